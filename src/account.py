@@ -1,13 +1,28 @@
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import pandas as pd
+import numpy as np
 
 from src.api_client import KISClient
-from src.models import AccountBalance, Position
+from src.models import AccountBalance, PositionArrays
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger("kis_trader.account")
 
+# 잔고 API 필드 → 배열 dtype. 순서는 Position / PositionArrays 필드 순서와 같다.
+_POSITION_FIELDS = (
+    ("pdno", object),            # symbol
+    ("prdt_name", object),       # name
+    ("hldg_qty", np.int64),      # quantity
+    ("pchs_avg_pric", np.float64),  # avg_price
+    ("prpr", np.int64),          # current_price
+    ("evlu_amt", np.int64),      # eval_amount
+    ("evlu_pfls_amt", np.int64),  # profit_loss
+    ("evlu_pfls_rt", np.float64),  # profit_rate
+)
+
 
 class AccountAPI:
     """국내주식 계좌 조회 API."""
@@ -41,21 +56,7 @@ class AccountAPI:
             return None
 
         # 보유종목
-        positions = []
-        for item in (res.output1 or []):
-            qty = int(item.get("hldg_qty", 0))
-            if qty == 0:
-                continue
-            positions.append(Position(
-                symbol=item.get("pdno", ""),
-                name=item.get("prdt_name", ""),
-                quantity=qty,
-                avg_price=float(item.get("pchs_avg_pric", 0)),
-                current_price=int(item.get("prpr", 0)),
-                eval_amount=int(item.get("evlu_amt", 0)),
-                profit_loss=int(item.get("evlu_pfls_amt", 0)),
-                profit_rate=float(item.get("evlu_pfls_rt", 0)),
-            ))
+        position_arrays = self._parse_positions(res.output1 or [])
 
         # 계좌 요약 (output2의 첫 번째 항목)
         summary = {}
@@ -67,9 +68,33 @@ class AccountAPI:
             total_deposit=int(summary.get("dnca_tot_amt", 0)),
             total_profit_loss=int(summary.get("evlu_pfls_smtl_amt", 0)),
             total_profit_rate=float(summary.get("tot_evlu_pfls_amt_rt", 0) or 0),
-            positions=positions,
+            position_arrays=position_arrays,
         )
 
+    @staticmethod
+    def _parse_positions(rows: list) -> Optional[PositionArrays]:
+        """잔고 API output1을 필드별 배열로 만든다.
+
+        행마다 int()/float()를 부르지 않고 필드 하나를 통째로 NumPy에 넘겨
+        문자열 → 숫자 변환을 한 번에 처리한다.
+        """
+        if not rows:
+            return None
+
+        columns = []
+        for key, dtype in _POSITION_FIELDS:
+            if dtype is object:
+                columns.append(np.array([row.get(key) or "" for row in rows], dtype=object))
+            else:
+                # 빈 문자열/누락은 0으로 보고, "70100.0000" 같은 소수 표기도 허용한다
+                values = np.array([row.get(key) or 0 for row in rows], dtype=np.float64)
+                columns.append(values.astype(dtype))
+
+        held = columns[2] != 0  # hldg_qty
+        if not held.all():
+            columns = [col[held] for col in columns]
+        return PositionArrays(*columns)
+
     def get_buying_power(self, symbol: str = "", price: int = 0) -> int:
         """매수 가능 금액을 조회한다."""
         params = {
@@ -99,7 +124,7 @@ class AccountAPI:
         start_date: str,
         end_date: str,
         side: str = "00",
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """주문 체결 내역을 조회한다.
 
         Args:
@@ -107,6 +132,8 @@ class AccountAPI:
             end_date: 조회 종료일 (YYYYMMDD)
             side: "00":전체, "01":매도, "02":매수
         """
+        import pandas as pd
+
         params = {
             "CANO": "",
             "ACNT_PRDT_CD": "",
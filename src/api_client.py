@@ -1,52 +1,90 @@
 import json
 import logging
-import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.auth import TokenManager
 from src.config import Config
+from src.ratelimit import shared_bucket
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
 
 logger = logging.getLogger("kis_trader.api")
 
+# 커넥션 풀: 병렬 다운로드 워커 수보다 넉넉하게 잡아 TLS 재연결을 피한다
+POOL_SIZE = 16
 
-class APIResponse:
-    """KIS API 응답을 래핑한다."""
+# 일시적 오류 재시도. urllib3 기본값대로 GET 등 멱등 메서드만 재시도하며
+# 주문(POST)은 중복 체결 위험이 있어 재시도하지 않는다.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
 
-    def __init__(self, status_code: int, data: dict, headers: dict):
-        self.status_code = status_code
-        self.data = data
-        self.headers = headers
 
-    @property
-    def success(self) -> bool:
-        return self.data.get("rt_cd") == "0"
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 
-    @property
-    def error_code(self) -> str:
-        return self.data.get("msg_cd", "")
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
-    @property
-    def error_message(self) -> str:
-        return self.data.get("msg1", "")
 
-    @property
-    def output(self) -> Any:
-        return self.data.get("output")
+@lru_cache(maxsize=64)
+def _resolve_tr_id(is_paper: bool, tr_id: str) -> str:
+    """거래 모드에 맞는 TR ID를 반환한다. 사용하는 TR ID 종류가 적어 결과를 캐싱한다."""
+    # 모의투자: T/J/C로 시작하는 TR ID를 V로 변환
+    # 단, CTCA0903R(국내휴장일조회)는 변환 시 미지원 오류가 발생할 수 있어 예외 처리
+    if is_paper and tr_id and tr_id[0] in ("T", "J", "C") and tr_id != "CTCA0903R":
+        return "V" + tr_id[1:]
+    return tr_id
 
-    @property
-    def output1(self) -> Any:
-        return self.data.get("output1")
 
-    @property
-    def output2(self) -> Any:
-        return self.data.get("output2")
+class APIResponse:
+    """KIS API 응답을 래핑한다.
+
+    자주 쓰는 필드는 생성 시 한 번만 추출해 슬롯 속성으로 보관한다.
+    """
+
+    __slots__ = (
+        "status_code",
+        "data",
+        "headers",
+        "success",
+        "error_code",
+        "error_message",
+        "output",
+        "output1",
+        "output2",
+        "has_next",
+    )
+
+    def __init__(self, status_code: int, data: dict, headers: dict):
+        self.status_code = status_code
+        self.data = data
+        self.headers = headers
 
-    @property
-    def has_next(self) -> bool:
-        """연속 조회 데이터가 있는지 확인한다."""
-        return self.headers.get("tr_cont", "") == "M"
+        self.success: bool = data.get("rt_cd") == "0"
+        self.error_code: str = data.get("msg_cd", "")
+        self.error_message: str = data.get("msg1", "")
+        self.output: Any = data.get("output")
+        self.output1: Any = data.get("output1")
+        self.output2: Any = data.get("output2")
+        # 연속 조회 데이터가 있는지 여부
+        self.has_next: bool = headers.get("tr_cont", "") == "M"
 
 
 class KISClient:
@@ -55,44 +93,83 @@ class KISClient:
     def __init__(self, config: Config, token_manager: TokenManager):
         self.config = config
         self.token_manager = token_manager
-        self._session = requests.Session()
-        self._last_call_time: float = 0
+        self._session = self._create_session()
+        # 같은 앱키를 쓰는 클라이언트끼리 호출 한도를 공유한다
+        self._rate_limiter = (
+            shared_bucket(config.api_key, 1.0 / config.rate_limit_interval)
+            if config.rate_limit_interval > 0
+            else None
+        )
+
+        # 요청마다 변하지 않는 헤더는 한 번만 구성해 둔다
+        self._static_headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/plain",
+            "charset": "UTF-8",
+            "appkey": config.api_key,
+            "appsecret": config.api_secret,
+            "custtype": "P",
+        }
+        self._auth_token = ""
+        self._auth_header = ""
+        self._account_params = {
+            "CANO": config.account_number,
+            "ACNT_PRDT_CD": config.account_product_code,
+        }
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """keep-alive 커넥션 풀과 재시도 정책이 적용된 세션을 만든다."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=RETRY_POLICY,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _rate_limit(self):
-        """API 호출 간 최소 간격을 유지한다."""
-        elapsed = time.time() - self._last_call_time
-        if elapsed < self.config.rate_limit_interval:
-            sleep_time = self.config.rate_limit_interval - elapsed
-            logger.debug("레이트 리미팅: %.2fs 대기", sleep_time)
-            time.sleep(sleep_time)
-        self._last_call_time = time.time()
+        """API 호출 간 최소 간격을 유지한다. 여러 스레드에서 호출해도 안전하다."""
+        if self._rate_limiter is None:
+            return
+        waited = self._rate_limiter.acquire()
+        if waited > 0:
+            logger.debug("레이트 리미팅: %.2fs 대기", waited)
 
     def _build_headers(self, tr_id: str, tr_cont: str = "") -> dict:
         """API 호출에 필요한 공통 헤더를 구성한다."""
-        # 모의투자: T/J/C로 시작하는 TR ID를 V로 변환
-        # 단, CTCA0903R(국내휴장일조회)는 변환 시 미지원 오류가 발생할 수 있어 예외 처리
-        if self.config.is_paper and tr_id and tr_id[0] in ("T", "J", "C") and tr_id != "CTCA0903R":
-            tr_id = "V" + tr_id[1:]
+        tr_id = _resolve_tr_id(self.config.is_paper, tr_id)
 
+        # 토큰이 바뀐 경우에만 authorization 문자열을 다시 만든다
         token = self.token_manager.get_token()
-        return {
-            "Content-Type": "application/json",
-            "Accept": "text/plain",
-            "charset": "UTF-8",
-            "authorization": f"Bearer {token}",
-            "appkey": self.config.api_key,
-            "appsecret": self.config.api_secret,
-            "tr_id": tr_id,
-            "tr_cont": tr_cont,
-            "custtype": "P",
-        }
+        if token != self._auth_token:
+            self._auth_token = token
+            self._auth_header = f"Bearer {token}"
+
+        headers = self._static_headers.copy()
+        headers["authorization"] = self._auth_header
+        headers["tr_id"] = tr_id
+        headers["tr_cont"] = tr_cont
+        return headers
 
     def _inject_account(self, params: dict) -> dict:
-        """계좌번호와 상품코드를 params에 자동 주입한다."""
-        if "CANO" in params:
-            params["CANO"] = self.config.account_number
-        if "ACNT_PRDT_CD" in params:
-            params["ACNT_PRDT_CD"] = self.config.account_product_code
+        """계좌번호와 상품코드를 params에 자동 주입한다.
+
+        params에 이미 있는 계좌 키만 채우고 없는 키는 추가하지 않는다.
+        값을 바꿀 때는 한 번 복사한 dict에 넣어 반환한다 (호출자 dict는 변경하지 않음).
+        """
+        has_cano = "CANO" in params
+        has_prdt = "ACNT_PRDT_CD" in params
+        if not (has_cano or has_prdt):
+            return params
+        account = self._account_params
+        params = dict(params)
+        if has_cano:
+            params["CANO"] = account["CANO"]
+        if has_prdt:
+            params["ACNT_PRDT_CD"] = account["ACNT_PRDT_CD"]
         return params
 
     def get(
@@ -126,7 +203,7 @@ class KISClient:
         body = self._inject_account(body)
 
         logger.debug("POST %s tr_id=%s", api_url, headers["tr_id"])
-        res = self._session.post(url, headers=headers, data=json.dumps(body))
+        res = self._session.post(url, headers=headers, data=_json_dumps(body))
         return self._parse_response(res, api_url)
 
     def _parse_response(self, res: requests.Response, api_url: str) -> APIResponse:
@@ -137,7 +214,7 @@ class KISClient:
             logger.error("HTTP %d: %s (%s)", res.status_code, res.text, api_url)
             return APIResponse(res.status_code, {"rt_cd": "-1", "msg1": res.text}, resp_headers)
 
-        data = res.json()
+        data = _json_loads(res.content)
         api_resp = APIResponse(res.status_code, data, resp_headers)
 
         if not api_resp.success:
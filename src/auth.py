@@ -1,11 +1,11 @@
 import json
 import logging
 import os
-from datetime import datetime
+import threading
+from datetime import date, datetime
 from typing import Optional
 
 import requests
-import yaml
 
 from src.config import Config
 
@@ -21,59 +21,86 @@ class TokenManager:
         self.config = config
         self._token: str = ""
         self._token_expired: datetime = datetime.min
+        self._token_file_date: Optional[date] = None
+        self._token_file_path: str = ""
+        # 여러 스레드가 동시에 만료를 감지해도 발급은 한 번만 하도록 보호한다
+        self._refresh_lock = threading.Lock()
         os.makedirs(TOKEN_DIR, exist_ok=True)
 
     @property
     def _token_file(self) -> str:
-        mode = "paper" if self.config.is_paper else "real"
-        date_str = datetime.today().strftime("%Y%m%d")
-        return os.path.join(TOKEN_DIR, f"KIS_{mode}_{date_str}")
+        """토큰 파일 경로. 날짜가 바뀔 때만 다시 계산한다."""
+        today = date.today()
+        if today != self._token_file_date:
+            mode = "paper" if self.config.is_paper else "real"
+            self._token_file_path = os.path.join(TOKEN_DIR, f"KIS_{mode}_{today:%Y%m%d}")
+            self._token_file_date = today
+        return self._token_file_path
 
     def get_token(self) -> str:
         """유효한 토큰을 반환한다. 만료됐으면 자동 갱신."""
-        if self._token and self._is_valid():
+        # 매 요청마다 호출되는 경로: 메모리의 만료 시각만 비교한다
+        if self._token and datetime.now() < self._token_expired:
             return self._token
 
-        # 파일에서 로드 시도
-        saved = self._load_token()
-        if saved:
-            self._token = saved
-            return self._token
+        with self._refresh_lock:
+            # 대기하는 동안 다른 스레드가 갱신했으면 그 토큰을 쓴다
+            if self._token and datetime.now() < self._token_expired:
+                return self._token
 
-        # 새로 발급
-        self._issue_token()
-        return self._token
+            # 파일에서 로드 시도
+            saved = self._load_token()
+            if saved:
+                self._token = saved
+                return self._token
 
-    def _is_valid(self) -> bool:
-        return datetime.now() < self._token_expired
+            # 새로 발급
+            self._issue_token()
+            return self._token
 
     def _load_token(self) -> Optional[str]:
         """파일에서 토큰을 읽어온다."""
         try:
             with open(self._token_file, encoding="UTF-8") as f:
-                data = yaml.load(f, Loader=yaml.FullLoader)
+                raw = f.read()
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError:
+                data = self._parse_legacy_token_file(raw)
             if not data or "token" not in data:
                 return None
 
             valid_date = data["valid-date"]
             if isinstance(valid_date, str):
-                valid_date = datetime.strptime(valid_date, "%Y-%m-%d %H:%M:%S")
+                valid_date = datetime.fromisoformat(valid_date)
 
             if valid_date > datetime.now():
                 self._token_expired = valid_date
                 logger.info("저장된 토큰 로드 완료 (만료: %s)", valid_date)
                 return data["token"]
             return None
-        except (FileNotFoundError, TypeError, KeyError):
+        except (FileNotFoundError, TypeError, KeyError, ValueError):
             return None
 
+    @staticmethod
+    def _parse_legacy_token_file(raw: str) -> dict:
+        """이전 버전의 `key: value` 형식(YAML) 토큰 파일을 파싱한다."""
+        data = {}
+        for line in raw.splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                data[key.strip()] = value.strip()
+        return data
+
     def _save_token(self, token: str, expired: str):
         """토큰을 파일에 저장한다."""
         valid_date = datetime.strptime(expired, "%Y-%m-%d %H:%M:%S")
         self._token_expired = valid_date
         with open(self._token_file, "w", encoding="utf-8") as f:
-            f.write(f"token: {token}\n")
-            f.write(f"valid-date: {valid_date}\n")
+            json.dump(
+                {"token": token, "valid-date": valid_date.strftime("%Y-%m-%d %H:%M:%S")},
+                f,
+            )
         logger.info("토큰 저장 완료 (만료: %s)", valid_date)
 
     def _issue_token(self):
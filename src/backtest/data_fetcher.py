@@ -2,75 +2,128 @@
 
 import logging
 import os
-import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
 from src.market_data import MarketDataAPI
 
 logger = logging.getLogger("kis_trader.backtest.data")
 
 DEFAULT_CACHE_DIR = "data/daily"
+DEFAULT_MAX_WORKERS = 4
+CACHE_SUFFIX = ".parquet"
+
+# 캐시 컬럼 타입: 날짜는 YYYYMMDD 정수, 가격은 원 단위 정수, 거래량/대금은 int64
+DAILY_DTYPES = {
+    "stck_bsop_date": "int32",
+    "stck_oprc": "int32",
+    "stck_hgpr": "int32",
+    "stck_lwpr": "int32",
+    "stck_clpr": "int32",
+    "prdy_vrss": "int32",
+    "acml_vol": "int64",
+    "acml_tr_pbmn": "int64",
+}
+
+
+def to_typed_daily(df: pd.DataFrame) -> pd.DataFrame:
+    """API 문자열 컬럼을 DAILY_DTYPES 기준의 숫자 컬럼으로 변환한다 (새로 만든 프레임 전용)."""
+    for col, dtype in DAILY_DTYPES.items():
+        if col in df.columns and df[col].dtype != dtype:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+    return df
 
 
 class HistoricalDataFetcher:
-    """KIS API에서 일봉 데이터를 가져오고 Parquet으로 캐싱한다."""
-
-    def __init__(self, market_data: MarketDataAPI, cache_dir: str = DEFAULT_CACHE_DIR):
+    """KIS API에서 일봉 데이터를 가져오고 Parquet으로 캐싱한다.
+
+    캐시는 종목별 Parquet 파일(종목 단위 파티션)이며, 로드 시 날짜 조건을
+    pyarrow에 넘겨(predicate pushdown) 필요한 row group만 디코딩한다.
+    """
+
+    def __init__(
+        self,
+        market_data: MarketDataAPI,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         self.market_data = market_data
         self.cache_dir = cache_dir
+        self.max_workers = max(1, max_workers)
         os.makedirs(cache_dir, exist_ok=True)
 
+        # 캐시 디렉터리를 한 번만 스캔해 종목 → 파일 경로 인덱스를 만든다
+        self._cache_index: Dict[str, str] = {
+            entry.name[:-len(CACHE_SUFFIX)]: entry.path
+            for entry in os.scandir(cache_dir)
+            if entry.is_file() and entry.name.endswith(CACHE_SUFFIX)
+        }
+
     def fetch_and_cache(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         """일봉 데이터를 가져오고 캐싱한다. 캐시가 있으면 재사용."""
-        cache_path = os.path.join(self.cache_dir, f"{symbol}.parquet")
-
         # 캐시 확인
-        cached = self._load_cached(cache_path, start_date, end_date)
+        cached = self._load_cached(symbol, start_date, end_date)
         if cached is not None:
             return cached
 
-        # API에서 가져오기 (페이지네이션)
+        return self._download(symbol, start_date, end_date)
+
+    def _download(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """API에서 일봉 데이터를 받아 캐시 파일로 저장한다."""
+        cache_path = self._cache_path(symbol)
+
+        # API에서 가져오기 (페이지네이션): 페이지별 원본 레코드를 모아 한 번에 DataFrame 생성
         logger.info("데이터 다운로드: %s (%s ~ %s)", symbol, start_date, end_date)
-        all_data = []
+        all_rows: List[dict] = []
         current_end = end_date
 
         for page in range(10):  # 최대 10페이지
-            df = self.market_data.get_daily_prices(symbol, start_date, current_end)
-            if df.empty:
+            rows = self.market_data.get_daily_price_rows(symbol, start_date, current_end)
+            if not rows:
                 break
 
-            all_data.append(df)
+            all_rows.extend(rows)
 
             # 가장 오래된 날짜 확인 (데이터는 최신순)
-            dates = df.get("stck_bsop_date", pd.Series())
-            if dates.empty:
-                break
-
-            oldest = dates.iloc[-1]
-            if oldest <= start_date:
+            oldest = rows[-1].get("stck_bsop_date", "")
+            if not oldest or oldest <= start_date:
                 break  # 요청 범위 도달
 
             # 다음 페이지: 가장 오래된 날짜 하루 전까지
             current_end = str(int(oldest) - 1).zfill(8)
-            time.sleep(0.6)  # rate limit
 
-        if not all_data:
+        if not all_rows:
             return pd.DataFrame()
 
-        result = pd.concat(all_data, ignore_index=True).drop_duplicates(subset=["stck_bsop_date"])
+        result = to_typed_daily(pd.DataFrame(all_rows))
 
-        # 날짜 범위 필터
         if "stck_bsop_date" in result.columns:
-            result = result[
-                (result["stck_bsop_date"] >= start_date) &
-                (result["stck_bsop_date"] <= end_date)
-            ]
+            # 날짜순 정렬(안정 정렬이라 페이지 간 중복은 먼저 받은 행이 앞에 온다)
+            result = result.sort_values("stck_bsop_date", kind="stable", ignore_index=True)
+            dates = result["stck_bsop_date"].to_numpy()
+
+            # 중복 제거: 정렬된 정수 배열이므로 인접 비교만으로 충분하다
+            if len(dates) > 1:
+                keep = np.empty(len(dates), dtype=bool)
+                keep[0] = True
+                np.not_equal(dates[1:], dates[:-1], out=keep[1:])
+                if not keep.all():
+                    result = result[keep].reset_index(drop=True)
+                    dates = dates[keep]
+
+            # 날짜 범위 필터: 이진 탐색으로 구간만 잘라낸다
+            lo = np.searchsorted(dates, int(start_date), side="left")
+            hi = np.searchsorted(dates, int(end_date), side="right")
+            result = result.iloc[lo:hi]
 
         # 캐싱
         if not result.empty:
             result.to_parquet(cache_path, index=False)
+            self._cache_index[symbol] = cache_path
             logger.info("캐시 저장: %s (%d rows)", cache_path, len(result))
 
         return result
@@ -78,37 +131,70 @@ class HistoricalDataFetcher:
     def fetch_pool(
         self, symbols: List[str], start_date: str, end_date: str
     ) -> Dict[str, pd.DataFrame]:
-        """여러 종목의 일봉 데이터를 가져온다."""
+        """여러 종목의 일봉 데이터를 가져온다.
+
+        캐시가 요청 범위를 덮는 종목은 먼저 메타데이터만 보고 골라 바로 로드하고,
+        나머지 종목만 병렬로 다운로드한다. 호출 간격은 KISClient의 레이트 리미터가
+        스레드 간에 공유하여 보장한다.
+        """
+        loaded: Dict[str, pd.DataFrame] = {}
+        stale: List[str] = []
+        for symbol in symbols:
+            cached = self._load_cached(symbol, start_date, end_date)
+            if cached is None:
+                stale.append(symbol)
+            else:
+                loaded[symbol] = cached
+
+        if stale:
+            logger.info("캐시 사용 %d종목, 다운로드 %d종목", len(loaded), len(stale))
+
+            def _fetch(item):
+                i, symbol = item
+                logger.info("[%d/%d] %s 데이터 다운로드 중...", i + 1, len(stale), symbol)
+                return symbol, self._download(symbol, start_date, end_date)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for symbol, df in executor.map(_fetch, enumerate(stale)):
+                    loaded[symbol] = df
+
+        # 요청한 종목 순서를 유지한다
         data = {}
-        for i, symbol in enumerate(symbols):
-            logger.info("[%d/%d] %s 데이터 로드 중...", i + 1, len(symbols), symbol)
-            df = self.fetch_and_cache(symbol, start_date, end_date)
-            if not df.empty:
+        for symbol in symbols:
+            df = loaded.get(symbol)
+            if df is not None and not df.empty:
                 data[symbol] = df
-            time.sleep(0.3)  # rate limit 여유
         logger.info("총 %d/%d 종목 데이터 로드 완료", len(data), len(symbols))
         return data
 
+    def _cache_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}{CACHE_SUFFIX}")
+
     def _load_cached(
-        self, cache_path: str, start_date: str, end_date: str
+        self, symbol: str, start_date: str, end_date: str
     ) -> Optional[pd.DataFrame]:
         """캐시 파일이 있고 범위를 커버하면 로드한다."""
-        if not os.path.exists(cache_path):
+        cache_path = self._cache_index.get(symbol)
+        if cache_path is None:
             return None
 
         try:
-            df = pd.read_parquet(cache_path)
-            if "stck_bsop_date" not in df.columns or df.empty:
+            date_range = self._cached_date_range(cache_path)
+            if date_range is None:
                 return None
 
-            cached_min = df["stck_bsop_date"].min()
-            cached_max = df["stck_bsop_date"].max()
-
-            if cached_min <= start_date and cached_max >= end_date:
-                filtered = df[
-                    (df["stck_bsop_date"] >= start_date) &
-                    (df["stck_bsop_date"] <= end_date)
-                ]
+            cached_min, cached_max = date_range
+            if int(cached_min) <= int(start_date) and int(cached_max) >= int(end_date):
+                # 이전 버전 캐시는 날짜가 문자열이므로 필터 값 타입을 컬럼에 맞춘다
+                cast = type(cached_min)
+                filtered = pd.read_parquet(
+                    cache_path,
+                    filters=[
+                        ("stck_bsop_date", ">=", cast(int(start_date))),
+                        ("stck_bsop_date", "<=", cast(int(end_date))),
+                    ],
+                )
+                filtered = to_typed_daily(filtered)
                 logger.debug("캐시 사용: %s (%d rows)", cache_path, len(filtered))
                 return filtered
 
@@ -116,3 +202,26 @@ class HistoricalDataFetcher:
             pass
 
         return None
+
+    @staticmethod
+    def _cached_date_range(cache_path: str) -> Optional[Tuple[Union[int, str], Union[int, str]]]:
+        """Parquet 메타데이터 통계에서 캐시된 날짜 범위(min, max)를 읽는다.
+
+        컬럼 값을 디코딩하지 않으므로 파일 전체를 읽는 것보다 훨씬 가볍다.
+        """
+        meta = pq.ParquetFile(cache_path).metadata
+        if meta.num_rows == 0 or "stck_bsop_date" not in meta.schema.names:
+            return None
+
+        col = meta.schema.names.index("stck_bsop_date")
+        lo = None
+        hi = None
+        for i in range(meta.num_row_groups):
+            stats = meta.row_group(i).column(col).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            lo = stats.min if lo is None else min(lo, stats.min)
+            hi = stats.max if hi is None else max(hi, stats.max)
+        if lo is None or hi is None:
+            return None
+        return lo, hi
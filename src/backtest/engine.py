@@ -3,8 +3,9 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.models import Order, OrderResult, OrderSide, Quote
@@ -12,8 +13,60 @@ from src.strategy import BaseStrategy
 
 logger = logging.getLogger("kis_trader.backtest.engine")
 
+# 틱 생성에 쓰는 컬럼 순서 (없는 컬럼은 0으로 채운다)
+TICK_COLUMNS = ("stck_oprc", "stck_hgpr", "stck_lwpr", "stck_clpr", "acml_vol", "stck_prdy_clpr")
 
-@dataclass
+
+# 수수료율/세율을 정수로 다루기 위한 배율 (0.015% → 150_000, 0.0140527% → 140_527)
+RATE_SCALE = 1_000_000_000
+BPS_SCALE = 10_000
+
+
+def _scale_rate(rate: float, name: str) -> int:
+    """요율을 RATE_SCALE 기준 정수로 바꾼다. 이 단위로 표현되지 않는 요율은 거부한다."""
+    exact = rate * RATE_SCALE
+    scaled = round(exact)
+    # 부동소수 표현 오차(예: 0.00015 * 1e9 = 150000.00000000003)만 허용한다
+    if abs(exact - scaled) > 1e-6:
+        raise ValueError(f"{name}={rate!r}는 {1 / RATE_SCALE:g} 단위로 표현할 수 없습니다")
+    return scaled
+
+
+def _buy_fill(
+    price: int, quantity: int, buy_mul: int, comm_num: int
+) -> Tuple[int, int, int]:
+    """매수 체결가, 총비용(수수료 포함), 수수료를 계산한다.
+
+    buy_mul은 BPS_SCALE 기준 슬리피지 배율, comm_num은 RATE_SCALE 기준 수수료율이다.
+    """
+    fill_price = price * buy_mul // BPS_SCALE
+    gross_cost = fill_price * quantity
+    commission = gross_cost * comm_num // RATE_SCALE
+    return fill_price, gross_cost + commission, commission
+
+
+def _sell_fill(
+    price: int,
+    quantity: int,
+    buy_price: int,
+    buy_comm: int,
+    sell_mul: int,
+    comm_num: int,
+    tax_num: int,
+) -> Tuple[int, int, int]:
+    """매도 체결가, 순매도대금, 순손익(매수 비용 차감)을 계산한다."""
+    fill_price = price * sell_mul // BPS_SCALE
+    gross_proceeds = fill_price * quantity
+    net_proceeds = (
+        gross_proceeds
+        - gross_proceeds * comm_num // RATE_SCALE
+        - gross_proceeds * tax_num // RATE_SCALE
+    )
+    net_pnl = net_proceeds - (buy_price * quantity + buy_comm)
+    return fill_price, net_proceeds, net_pnl
+
+
+@dataclass(slots=True)
 class TradeRecord:
     """체결 기록."""
     date: str
@@ -24,7 +77,7 @@ class TradeRecord:
     pnl: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyRecord:
     """일별 기록."""
     date: str
@@ -45,6 +98,59 @@ class BacktestResult:
     daily_records: List[DailyRecord] = field(default_factory=list)
     trade_records: List[TradeRecord] = field(default_factory=list)
 
+    # 집계 캐시: finalize()가 기록을 한 번씩만 훑어 채운다
+    _stats: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def finalize(self, daily_target: int = 10_000, daily_limit: int = -5_000) -> None:
+        """일별/체결 기록을 한 번씩 순회해 리포트용 집계값을 계산하고 캐싱한다.
+
+        기록을 추가로 변경했다면 다시 호출해야 한다.
+        """
+        target_days = 0
+        limit_days = 0
+        pnl_sum = 0
+        capitals = np.empty(len(self.daily_records) + 1, dtype=np.int64)
+        capitals[0] = self.initial_capital
+        for i, rec in enumerate(self.daily_records, 1):
+            capitals[i] = rec.capital
+            pnl = rec.realized_pnl
+            pnl_sum += pnl
+            if pnl >= daily_target:
+                target_days += 1
+            if pnl <= daily_limit:
+                limit_days += 1
+
+        # MDD: 초기 자본을 포함한 누적 최고치 대비 최대 하락률
+        peaks = np.maximum.accumulate(capitals)
+        max_dd = float(((peaks - capitals) / peaks * 100).max())
+
+        win_sum = win_count = loss_sum = loss_count = 0
+        for t in self.trade_records:
+            if t.side != "sell":
+                continue
+            if t.pnl > 0:
+                win_sum += t.pnl
+                win_count += 1
+            elif t.pnl < 0:
+                loss_sum += t.pnl
+                loss_count += 1
+
+        self._stats = {
+            "max_drawdown_pct": max_dd,
+            "avg_win": win_sum / win_count if win_count else 0,
+            "avg_loss": loss_sum / loss_count if loss_count else 0,
+            "daily_target": daily_target,
+            "target_days": target_days,
+            "daily_limit": daily_limit,
+            "limit_days": limit_days,
+            "total_realized_pnl": pnl_sum,
+        }
+
+    def _get_stats(self) -> dict:
+        if self._stats is None:
+            self.finalize()
+        return self._stats
+
     @property
     def total_return_pct(self) -> float:
         if self.initial_capital == 0:
@@ -58,32 +164,30 @@ class BacktestResult:
 
     @property
     def avg_win(self) -> float:
-        wins = [t.pnl for t in self.trade_records if t.side == "sell" and t.pnl > 0]
-        return sum(wins) / len(wins) if wins else 0
+        return self._get_stats()["avg_win"]
 
     @property
     def avg_loss(self) -> float:
-        losses = [t.pnl for t in self.trade_records if t.side == "sell" and t.pnl < 0]
-        return sum(losses) / len(losses) if losses else 0
+        return self._get_stats()["avg_loss"]
 
     @property
     def max_drawdown_pct(self) -> float:
-        if not self.daily_records:
-            return 0
-        peak = self.initial_capital
-        max_dd = 0
-        for rec in self.daily_records:
-            if rec.capital > peak:
-                peak = rec.capital
-            dd = (peak - rec.capital) / peak * 100
-            if dd > max_dd:
-                max_dd = dd
-        return max_dd
+        return self._get_stats()["max_drawdown_pct"]
+
+    @property
+    def total_realized_pnl(self) -> int:
+        return self._get_stats()["total_realized_pnl"]
 
     def days_target_hit(self, target: int = 10_000) -> int:
+        stats = self._get_stats()
+        if target == stats["daily_target"]:
+            return stats["target_days"]
         return sum(1 for r in self.daily_records if r.realized_pnl >= target)
 
     def days_loss_limit_hit(self, limit: int = -5_000) -> int:
+        stats = self._get_stats()
+        if limit == stats["daily_limit"]:
+            return stats["limit_days"]
         return sum(1 for r in self.daily_records if r.realized_pnl <= limit)
 
 
@@ -103,17 +207,40 @@ class BacktestEngine:
         tax_rate: float = 0.002,            # 0.20% 세금+슬리피지 (매도 시)
     ):
         self.strategy = strategy
+        # {symbol: TICK_COLUMNS 순서의 정수 행렬}, 행 순서는 self.data[symbol].index와 같다
+        self._arrays: Dict[str, np.ndarray] = {}
+        # 전 종목 거래일의 정렬된 합집합 (YYYYMMDD 정수)
+        self._all_days = np.zeros(0, dtype=np.int32)
         self.data = self._prepare_data(data)
         self.initial_capital = initial_capital
         self.slippage_bps = slippage_bps
         self.commission_rate = commission_rate
         self.tax_rate = tax_rate
 
+        # 체결 계산용 정수 상수: 주문마다 부동소수 곱셈/형변환을 하지 않도록 미리 환산
+        self._buy_mul = BPS_SCALE + slippage_bps
+        self._sell_mul = BPS_SCALE - slippage_bps
+        self._comm_num = _scale_rate(commission_rate, "commission_rate")
+        self._tax_num = _scale_rate(tax_rate, "tax_rate")
+
         self._capital = initial_capital
-        self._positions: Dict[str, dict] = {}  # {symbol: {price, qty, buy_comm}}
+
+        # 보유 포지션: 종목 번호로 인덱싱하는 병렬 배열 (수량 0 = 미보유)
+        self._symbols: List[str] = list(self.data)
+        self._sym_idx: Dict[str, int] = {s: i for i, s in enumerate(self._symbols)}
+        self._pos_price = np.zeros(len(self._sym_idx), dtype=np.int64)
+        self._pos_qty = np.zeros(len(self._sym_idx), dtype=np.int64)
+        self._pos_buy_comm = np.zeros(len(self._sym_idx), dtype=np.int64)
         self._daily_pnl = 0
         self._pending_orders: List[Order] = []
 
+        # run() 시작 시 만드는 틱 패널 (_build_tick_panel 참고)
+        self._panel_symbols: List[str] = []
+        self._panel_valid = np.zeros((0, 0), dtype=bool)
+        self._tick_fields = np.zeros((0, 0, 4, 6), dtype=np.int64)
+        self._tick_rates = np.zeros((0, 0, 4), dtype=np.float64)
+        self._quote_pool: List[Quote] = []
+
     def run(self, start_date: str, end_date: str) -> BacktestResult:
         """백테스트를 실행한다."""
         trading_days = self._get_trading_days(start_date, end_date)
@@ -128,81 +255,57 @@ class BacktestEngine:
         )
 
         self._capital = self.initial_capital
+        self._build_tick_panel(trading_days)
 
-        for day in trading_days:
+        for day_idx, day in enumerate(trading_days):
             self._daily_pnl = 0
-            day_trades = 0
-
-            # 전략 초기화 (매일 리셋)
-            self.strategy.initialize()
-
-            # 하루 4틱 시뮬레이션
-            ticks = self._generate_day_ticks(day)
-            for tick_quotes in ticks:
-                if not tick_quotes:
-                    continue
-
+            trades_before = result.total_trades
+
+            # 전략 일별 리셋 (기본 구현은 initialize() 재호출)
+            self.strategy.daily_reset()
+
+            # 하루 4틱 시뮬레이션 (감시 종목과 보유 종목만 시세 생성)
+            sym_mask = self._watch_mask() | (self._pos_qty > 0)
+            # 체결용 틱별 가격: tick_prices[틱][종목 번호], 시세가 없으면 0
+            tick_prices = np.where(
+                (self._panel_valid[day_idx] & sym_mask)[:, None],
+                self._tick_fields[day_idx, :, :, 0],
+                0,
+            ).T.tolist()
+            for i, tick_quotes in enumerate(self._iter_day_ticks(day_idx, sym_mask)):
                 # 이전 틱의 대기 주문 체결
-                self._fill_pending_orders(tick_quotes, result)
+                self._fill_pending_orders(tick_prices[i], result)
 
                 # 전략 실행
                 orders = self.strategy.on_batch_tick(tick_quotes)
                 self._pending_orders = orders
 
             # 대기 주문은 종가에 체결 시도
+            close_prices = tick_prices[-1]
             if self._pending_orders:
-                close_quotes = ticks[-1] if ticks else []
-                self._fill_pending_orders(close_quotes, result)
+                self._fill_pending_orders(close_prices, result)
 
             # 장마감 강제 청산: 잔여 포지션을 종가에 매도 (오버나잇 없음)
-            if self._positions and ticks:
-                close_quotes = ticks[-1]
-                quote_map = {q.symbol: q for q in close_quotes}
-                for symbol in list(self._positions.keys()):
-                    q = quote_map.get(symbol)
-                    if not q:
-                        continue
-                    pos = self._positions.pop(symbol)
-                    fill_price = q.current_price
-                    gross_proceeds = fill_price * pos["qty"]
-                    sell_commission = int(gross_proceeds * self.commission_rate)
-                    sell_tax = int(gross_proceeds * self.tax_rate)
-                    net_proceeds = gross_proceeds - sell_commission - sell_tax
-                    buy_comm = pos.get("buy_comm", 0)
-                    net_pnl = net_proceeds - (pos["price"] * pos["qty"] + buy_comm)
-
-                    self._capital += net_proceeds
-                    self._daily_pnl += net_pnl
-
-                    if net_pnl > 0:
-                        result.winning_trades += 1
-                    elif net_pnl < 0:
-                        result.losing_trades += 1
-
-                    fill_result = OrderResult(
-                        success=True, symbol=symbol, side=OrderSide.SELL,
-                        quantity=pos["qty"], price=fill_price,
-                    )
-                    self.strategy.on_order_filled(fill_result)
-
-                    result.trade_records.append(TradeRecord(
-                        date=day, symbol=symbol, side="sell",
-                        quantity=pos["qty"], price=fill_price, pnl=net_pnl,
-                    ))
-                    result.total_trades += 1
+            for i in np.flatnonzero(self._pos_qty).tolist():
+                price = close_prices[i]
+                if price <= 0:
+                    continue
+                qty = int(self._pos_qty[i])
+                self._settle_sell(i, self._symbols[i], qty, price, BPS_SCALE, str(day), result)
 
             # 일별 기록
             portfolio_value = self._capital
             result.daily_records.append(DailyRecord(
-                date=day,
+                date=str(day),
                 capital=portfolio_value,
                 realized_pnl=self._daily_pnl,
-                trade_count=day_trades,
-                positions_held=len(self._positions),
+                trade_count=result.total_trades - trades_before,
+                positions_held=int(np.count_nonzero(self._pos_qty)),
             ))
 
         # 최종 자본 계산 (매일 청산하므로 잔여 포지션 없음)
         result.final_capital = self._capital
+        result.finalize()
 
         logger.info("백테스트 완료")
         return result
@@ -217,90 +320,146 @@ class BacktestEngine:
             for col in ["stck_oprc", "stck_hgpr", "stck_lwpr", "stck_clpr", "acml_vol"]:
                 if col in df.columns:
                     df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+            # 날짜는 YYYYMMDD 정수로 통일 (문자열 캐시와 정수 캐시 모두 지원)
+            df["stck_bsop_date"] = df["stck_bsop_date"].astype("int32")
             df = df.set_index("stck_bsop_date")
+            if not df.index.is_unique:
+                df = df[~df.index.duplicated(keep="last")]
             prepared[symbol] = df
-        return prepared
-
-    def _get_trading_days(self, start: str, end: str) -> List[str]:
-        """데이터에 존재하는 거래일 목록을 반환한다."""
-        all_dates = set()
-        for df in self.data.values():
-            dates = df.index[(df.index >= start) & (df.index <= end)]
-            all_dates.update(dates)
-        return sorted(all_dates)
-
-    def _generate_day_ticks(self, day: str) -> List[List[Quote]]:
-        """하루를 4틱으로 변환한다: 시가→첫극단→둘째극단→종가."""
-        ticks = [[], [], [], []]  # open, first_ext, second_ext, close
-
-        for symbol, df in self.data.items():
-            if day not in df.index:
-                continue
 
-            row = df.loc[day]
-            o = int(row.get("stck_oprc", 0))
-            h = int(row.get("stck_hgpr", 0))
-            l = int(row.get("stck_lwpr", 0))
-            c = int(row.get("stck_clpr", 0))
-            v = int(row.get("acml_vol", 0))
-
-            if o <= 0 or c <= 0:
-                continue
-
-            prev_close = int(row.get("stck_prdy_clpr", o))
-            if prev_close <= 0:
-                prev_close = o
-
-            # 상승일: O → L → H → C, 하락일: O → H → L → C
-            if c >= o:
-                prices = [o, l, h, c]
-            else:
-                prices = [o, h, l, c]
-
-            for i, price in enumerate(prices):
-                change = price - prev_close
-                change_rate = change / prev_close * 100 if prev_close > 0 else 0
-
-                ticks[i].append(Quote(
-                    symbol=symbol,
-                    name=symbol,
-                    current_price=price,
-                    change=change,
-                    change_rate=change_rate,
-                    open_price=o,
-                    high_price=h if i >= 2 else max(o, price),
-                    low_price=l if i >= 2 else min(o, price),
-                    volume=v * (i + 1) // 4,
-                    trade_amount=0,
-                ))
+            # 틱 생성 시 df.loc 라벨 조회를 피하도록 정수 행렬을 미리 만든다
+            arr = np.zeros((len(df), len(TICK_COLUMNS)), dtype=np.int64)
+            for j, col in enumerate(TICK_COLUMNS):
+                if col in df.columns:
+                    arr[:, j] = pd.to_numeric(df[col], errors="coerce").fillna(0).to_numpy()
+            # 전일 종가가 없으면(컬럼 부재 포함) 당일 시가를 기준으로 한다
+            prev_close = arr[:, TICK_COLUMNS.index("stck_prdy_clpr")]
+            np.copyto(prev_close, arr[:, TICK_COLUMNS.index("stck_oprc")], where=prev_close <= 0)
+            self._arrays[symbol] = arr
+
+        if prepared:
+            self._all_days = np.unique(
+                np.concatenate([df.index.to_numpy() for df in prepared.values()])
+            )
+        return prepared
 
-        return ticks
+    def _get_trading_days(self, start: str, end: str) -> List[int]:
+        """데이터에 존재하는 거래일 목록(YYYYMMDD 정수)을 반환한다."""
+        days = self._all_days
+        return days[(days >= int(start)) & (days <= int(end))].tolist()
+
+    def _build_tick_panel(self, trading_days: List[int]):
+        """전 기간의 4틱 시세를 (거래일, 종목, 틱) 배열로 한 번에 계산한다.
+
+        틱 필드 순서는 [현재가, 전일대비, 시가, 고가, 저가, 거래량]이다.
+        """
+        symbols = list(self._arrays)
+        n_days, n_syms = len(trading_days), len(symbols)
+
+        # prices[day, sym] = [o, h, l, c, v, prev_close], 해당일 데이터가 없으면 0
+        prices = np.zeros((n_days, n_syms, len(TICK_COLUMNS)), dtype=np.int64)
+        for j, symbol in enumerate(symbols):
+            # 거래일별 행 위치 (-1 = 해당일 데이터 없음)
+            pos = self.data[symbol].index.get_indexer(trading_days)
+            found = pos >= 0
+            prices[found, j] = self._arrays[symbol][pos[found]]
+
+        o, h, l, c, v, prev_close = np.moveaxis(prices, -1, 0)
+
+        # 상승일: O → L → H → C, 하락일: O → H → L → C
+        up = c >= o
+        tick_price = np.stack(
+            [o, np.where(up, l, h), np.where(up, h, l), c], axis=-1
+        )
+        tick_high = np.stack(
+            [o, np.maximum(o, tick_price[..., 1]), h, h], axis=-1
+        )
+        tick_low = np.stack(
+            [o, np.minimum(o, tick_price[..., 1]), l, l], axis=-1
+        )
+        tick_volume = v[..., None] * np.arange(1, 5) // 4
+        change = tick_price - prev_close[..., None]
+
+        self._panel_symbols = symbols
+        self._quote_pool = [
+            Quote(
+                symbol=symbol, name=symbol, current_price=0, change=0, change_rate=0.0,
+                open_price=0, high_price=0, low_price=0, volume=0, trade_amount=0,
+            )
+            for symbol in symbols
+        ]
+        self._panel_valid = (o > 0) & (c > 0)
+        self._tick_fields = np.stack(
+            [tick_price, change, np.broadcast_to(o[..., None], tick_price.shape),
+             tick_high, tick_low, tick_volume],
+            axis=-1,
+        )
 
-    def _fill_pending_orders(self, quotes: List[Quote], result: BacktestResult):
-        """대기 주문을 현재 틱 가격에 체결한다."""
-        quote_map = {q.symbol: q for q in quotes}
+        # 등락률(%)은 전략이 실수 임계값과 비교하므로 실수로 유지하되,
+        # 유효한 칸에 대해서만 한 번에 나눗셈하고 틱 루프에서는 다시 계산하지 않는다
+        rates = np.zeros(change.shape, dtype=np.float64)
+        np.divide(
+            change, prev_close[..., None], out=rates,
+            where=(self._panel_valid & (prev_close > 0))[..., None],
+        )
+        rates *= 100
+        self._tick_rates = rates
+
+    def _watch_mask(self) -> np.ndarray:
+        """전략 감시 종목의 불리언 마스크. 감시 목록이 비어 있으면 전 종목."""
+        watchlist = self.strategy.get_watchlist()
+        if not watchlist:
+            return np.ones(len(self._symbols), dtype=bool)
+        mask = np.zeros(len(self._symbols), dtype=bool)
+        idx = [self._sym_idx[s] for s in watchlist if s in self._sym_idx]
+        mask[idx] = True
+        return mask
+
+    def _iter_day_ticks(self, day_idx: int, sym_mask: np.ndarray) -> Iterator[List[Quote]]:
+        """하루를 4틱으로 변환해 순서대로 내보낸다: 시가→첫극단→둘째극단→종가.
+
+        값은 _build_tick_panel에서 미리 계산해 두었고, 종목별로 하나씩 만들어 둔
+        Quote 객체를 틱마다 갱신해 재사용한다. 따라서 전략이 보관한 Quote도
+        항상 해당 종목의 최신 틱 값을 가리킨다.
+        """
+        cols = np.flatnonzero(self._panel_valid[day_idx] & sym_mask)
+        if cols.size == 0:
+            return
+        fields = self._tick_fields[day_idx, cols].tolist()
+        rates = self._tick_rates[day_idx, cols].tolist()
+        quotes = [self._quote_pool[j] for j in cols.tolist()]
+
+        for i in range(4):
+            for q, sym_fields, sym_rates in zip(quotes, fields, rates):
+                (q.current_price, q.change, q.open_price,
+                 q.high_price, q.low_price, q.volume) = sym_fields[i]
+                q.change_rate = sym_rates[i]
+            yield quotes
+
+    def _fill_pending_orders(self, prices: List[int], result: BacktestResult):
+        """대기 주문을 현재 틱 가격에 체결한다. prices는 종목 번호로 인덱싱한다."""
+        if not self._pending_orders:
+            return
 
         for order in self._pending_orders:
-            q = quote_map.get(order.symbol)
-            if not q or q.current_price <= 0:
+            i = self._sym_idx.get(order.symbol)
+            price = prices[i] if i is not None else 0
+            if price <= 0:
                 continue
 
             if order.side == OrderSide.BUY:
                 # 슬리피지 적용
-                fill_price = int(q.current_price * (1 + self.slippage_bps / 10000))
-                gross_cost = fill_price * order.quantity
-                buy_commission = int(gross_cost * self.commission_rate)
-                total_cost = gross_cost + buy_commission
+                fill_price, total_cost, buy_commission = _buy_fill(
+                    price, order.quantity, self._buy_mul, self._comm_num
+                )
 
                 if total_cost > self._capital:
                     continue
 
                 self._capital -= total_cost
-                self._positions[order.symbol] = {
-                    "price": fill_price,
-                    "qty": order.quantity,
-                    "buy_comm": buy_commission,
-                }
+                self._pos_price[i] = fill_price
+                self._pos_qty[i] = order.quantity
+                self._pos_buy_comm[i] = buy_commission
 
                 fill_result = OrderResult(
                     success=True, symbol=order.symbol, side=OrderSide.BUY,
@@ -315,38 +474,49 @@ class BacktestEngine:
                 result.total_trades += 1
 
             elif order.side == OrderSide.SELL:
-                pos = self._positions.pop(order.symbol, None)
-                if not pos:
+                if not self._pos_qty[i]:
                     continue
 
-                fill_price = int(q.current_price * (1 - self.slippage_bps / 10000))
-                gross_proceeds = fill_price * order.quantity
-                sell_commission = int(gross_proceeds * self.commission_rate)
-                sell_tax = int(gross_proceeds * self.tax_rate)
-                net_proceeds = gross_proceeds - sell_commission - sell_tax
+                self._settle_sell(
+                    i, order.symbol, order.quantity, price,
+                    self._sell_mul, "", result,
+                )
 
-                # 순손익 = 매도순수익 - 매수총비용
-                buy_comm = pos.get("buy_comm", 0)
-                net_pnl = net_proceeds - (pos["price"] * order.quantity + buy_comm)
+        self._pending_orders = []
 
-                self._capital += net_proceeds
-                self._daily_pnl += net_pnl
+    def _settle_sell(
+        self,
+        sym_idx: int,
+        symbol: str,
+        quantity: int,
+        price: int,
+        sell_mul: int,
+        date: str,
+        result: BacktestResult,
+    ):
+        """포지션을 청산하고 매도 대금과 손익을 반영한 뒤 체결을 기록한다."""
+        fill_price, net_proceeds, net_pnl = _sell_fill(
+            price, quantity, int(self._pos_price[sym_idx]), int(self._pos_buy_comm[sym_idx]),
+            sell_mul, self._comm_num, self._tax_num,
+        )
+        self._pos_qty[sym_idx] = 0
 
-                if net_pnl > 0:
-                    result.winning_trades += 1
-                elif net_pnl < 0:
-                    result.losing_trades += 1
+        self._capital += net_proceeds
+        self._daily_pnl += net_pnl
 
-                fill_result = OrderResult(
-                    success=True, symbol=order.symbol, side=OrderSide.SELL,
-                    quantity=order.quantity, price=fill_price,
-                )
-                self.strategy.on_order_filled(fill_result)
+        if net_pnl > 0:
+            result.winning_trades += 1
+        elif net_pnl < 0:
+            result.losing_trades += 1
 
-                result.trade_records.append(TradeRecord(
-                    date="", symbol=order.symbol, side="sell",
-                    quantity=order.quantity, price=fill_price, pnl=net_pnl,
-                ))
-                result.total_trades += 1
+        fill_result = OrderResult(
+            success=True, symbol=symbol, side=OrderSide.SELL,
+            quantity=quantity, price=fill_price,
+        )
+        self.strategy.on_order_filled(fill_result)
 
-        self._pending_orders = []
+        result.trade_records.append(TradeRecord(
+            date=date, symbol=symbol, side="sell",
+            quantity=quantity, price=fill_price, pnl=net_pnl,
+        ))
+        result.total_trades += 1
@@ -30,7 +30,7 @@ def print_report(result: BacktestResult, daily_target: int = 10_000, daily_limit
     if trading_days > 0:
         target_days = result.days_target_hit(daily_target)
         loss_days = result.days_loss_limit_hit(daily_limit)
-        avg_daily = sum(r.realized_pnl for r in result.daily_records) / trading_days
+        avg_daily = result.total_realized_pnl / trading_days
 
         print(f"\n  거래일 수:       {trading_days:>12d}일")
         print(f"  목표 달성 일수:  {target_days:>12d}일 ({target_days/trading_days*100:.1f}%)")
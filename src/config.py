@@ -29,6 +29,9 @@ class Config:
     # 로깅
     log_level: str
 
+    # 스케줄러: 전략 watchlist 재조회 주기 (초)
+    watchlist_refresh_seconds: float = 60.0
+
     @classmethod
     def load(cls, env_path: str = None) -> "Config":
         """`.env` 파일에서 설정을 로드한다."""
@@ -58,6 +61,7 @@ class Config:
         account_product_code = os.getenv("ACCOUNT_PRODUCT_CODE", "01")
         hts_id = os.getenv("HTS_ID", "")
         log_level = os.getenv("LOG_LEVEL", "INFO")
+        watchlist_refresh_seconds = float(os.getenv("WATCHLIST_REFRESH_SECONDS", "60"))
 
         config = cls(
             trading_mode=trading_mode,
@@ -71,6 +75,7 @@ class Config:
             ws_url=ws_url,
             rate_limit_interval=rate_limit_interval,
             log_level=log_level,
+            watchlist_refresh_seconds=watchlist_refresh_seconds,
         )
         config.validate()
         return config
@@ -39,7 +39,10 @@ class OrderExecutor:
         self.risk = risk_manager or RiskManager()
 
     def submit_orders(self, orders: List[Order]) -> List[OrderResult]:
-        """주문 리스트를 리스크 체크 후 실행한다."""
+        """주문 리스트를 리스크 체크 후 실행한다.
+
+        전략이 정한 순서(예: 매도 먼저)대로 브로커에 도착해야 하므로 한 건씩 차례로 보낸다.
+        """
         results = []
         for order in orders:
             ok, reason = self.risk.check(order)
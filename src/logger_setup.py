@@ -1,14 +1,28 @@
+import atexit
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Optional
+
+# 모든 핸들러가 공유하는 포매터
+LOG_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+_listener: Optional[QueueListener] = None
 
 
 def setup_logger(log_level: str = "INFO", log_dir: str = "logs") -> logging.Logger:
-    """로깅을 설정하고 루트 로거를 반환한다."""
+    """로깅을 설정하고 루트 로거를 반환한다.
+
+    로거에는 QueueHandler만 달고, 콘솔/파일 출력은 백그라운드 QueueListener
+    스레드가 처리한다. 매매 루프에서는 로그 호출이 큐 적재 한 번으로 끝난다.
+    """
+    global _listener
+
     os.makedirs(log_dir, exist_ok=True)
 
     level = getattr(logging, log_level.upper(), logging.INFO)
-    fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    fmt = LOG_FORMATTER
 
     # 루트 로거
     root = logging.getLogger("kis_trader")
@@ -21,7 +35,6 @@ def setup_logger(log_level: str = "INFO", log_dir: str = "logs") -> logging.Logg
     console = logging.StreamHandler()
     console.setLevel(level)
     console.setFormatter(fmt)
-    root.addHandler(console)
 
     # 메인 로그 파일 (오늘 로그는 trading.log, 이전 로그는 trading.log.YYYY-MM-DD)
     main_file = TimedRotatingFileHandler(
@@ -34,10 +47,8 @@ def setup_logger(log_level: str = "INFO", log_dir: str = "logs") -> logging.Logg
     main_file.suffix = "%Y-%m-%d"
     main_file.setLevel(level)
     main_file.setFormatter(fmt)
-    root.addHandler(main_file)
 
-    # 주문 전용 로그
-    order_logger = logging.getLogger("kis_trader.orders")
+    # 주문 전용 로그: kis_trader.orders 로거에서 올라온 레코드만 기록
     order_file = TimedRotatingFileHandler(
         os.path.join(log_dir, "orders.log"),
         when="midnight",
@@ -48,6 +59,18 @@ def setup_logger(log_level: str = "INFO", log_dir: str = "logs") -> logging.Logg
     order_file.suffix = "%Y-%m-%d"
     order_file.setLevel(logging.INFO)
     order_file.setFormatter(fmt)
-    order_logger.addHandler(order_file)
+    order_file.addFilter(logging.Filter("kis_trader.orders"))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, console, main_file, order_file, respect_handler_level=True
+    )
+    _listener.start()
+    # 종료 시 큐에 남은 레코드를 모두 기록하고 스레드를 정리한다
+    atexit.register(_listener.stop)
+
+    # 자체 핸들러를 달았으므로 상위(root) 로거로 중복 전달하지 않는다
+    root.propagate = False
 
     return root
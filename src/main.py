@@ -9,7 +9,7 @@ from src.auth import TokenManager
 from src.config import Config
 from src.executor import OrderExecutor, RiskManager
 from src.logger_setup import setup_logger
-from src.market_data import MarketDataAPI
+from src.market_data import HOLIDAY_CACHE_FILE, MarketDataAPI
 from src.strategy import BaseStrategy
 from src.trading import TradingAPI
 
@@ -29,7 +29,7 @@ def create_components(config: Config):
     """핵심 컴포넌트들을 생성한다."""
     token_mgr = TokenManager(config)
     client = KISClient(config, token_mgr)
-    market_data = MarketDataAPI(client)
+    market_data = MarketDataAPI(client, holiday_cache_path=HOLIDAY_CACHE_FILE)
     trading = TradingAPI(client)
     account = AccountAPI(client)
     return client, market_data, trading, account
@@ -81,11 +81,12 @@ def run(strategy: BaseStrategy, config: Config = None):
                 if quote is None:
                     continue
 
-                logger.info(
-                    "[%s] %s: %s원 (%+d, %+.2f%%)",
+                # 종목별 시세는 틱마다 찍히므로 DEBUG로 남기고, 포맷은 로거에 맡긴다
+                logger.debug(
+                    "[%s] %s: %d원 (%+d, %+.2f%%)",
                     quote.symbol,
                     quote.name,
-                    f"{quote.current_price:,}",
+                    quote.current_price,
                     quote.change,
                     quote.change_rate,
                 )
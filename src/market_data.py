@@ -1,22 +1,185 @@
+import json
 import logging
-from datetime import datetime
-from typing import List, Optional
-
-import pandas as pd
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from src.api_client import KISClient
 from src.models import Quote, RankingItem
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 logger = logging.getLogger("kis_trader.market")
 
+# 휴장일 조회 결과 디스크 캐시 (프로세스 재시작 후에도 재사용)
+HOLIDAY_CACHE_FILE = os.path.join(os.path.expanduser("~"), "KIS", "config", "holidays.json")
+HOLIDAY_TTL_PAST = 30 * 24 * 3600   # 지난 날짜는 바뀔 일이 없으므로 30일
+HOLIDAY_TTL_TODAY = 3600            # 오늘/미래 날짜는 1시간
+HOLIDAY_TTL_FALLBACK = 24 * 3600    # 조회 실패 시 주중 fallback 결과는 1일
+
+# 같은 (종목, 기간) 일봉 조회를 짧은 시간 안에 반복하면 직전 응답을 재사용한다
+DAILY_ROWS_TTL = 60
+
+# 요청 파라미터 중 호출마다 바뀌지 않는 부분 (읽기 전용 템플릿)
+_FLUCTUATION_RANKING_PARAMS = MappingProxyType({
+    "fid_cond_mrkt_div_code": "J",
+    "fid_cond_scr_div_code": "20170",
+    "fid_input_iscd": "0000",
+    "fid_rank_sort_cls_code": "0",
+    "fid_input_cnt_1": "0",
+    "fid_prc_cls_code": "0",
+    "fid_input_price_1": "",
+    "fid_input_price_2": "",
+    "fid_vol_cnt": "",
+    "fid_trgt_cls_code": "0",
+    "fid_trgt_exls_cls_code": "0",
+    "fid_div_cls_code": "0",
+    "fid_rsfl_rate1": "",
+    "fid_rsfl_rate2": "",
+})
+_MARKET_CAP_RANKING_PARAMS = MappingProxyType({
+    "fid_cond_mrkt_div_code": "J",
+    "fid_cond_scr_div_code": "20174",
+    "fid_div_cls_code": "0",
+    "fid_input_iscd": "0000",
+    "fid_trgt_cls_code": "0",
+    "fid_trgt_exls_cls_code": "0",
+    "fid_input_price_1": "",
+    "fid_input_price_2": "",
+    "fid_vol_cnt": "",
+})
+MULTI_PRICE_MAX_SYMBOLS = 30
+# 멀티시세 순번별 파라미터 키 (1 ~ 30)
+_MULTI_PRICE_PARAM_KEYS = tuple(
+    (f"FID_COND_MRKT_DIV_CODE_{i}", f"FID_INPUT_ISCD_{i}")
+    for i in range(1, MULTI_PRICE_MAX_SYMBOLS + 1)
+)
+
+# 응답 필드 → 모델 필드 변환표: (응답 키, 모델 필드, dtype)
+# 숫자 필드는 모델 생성자 인자 순서(종목코드/이름 다음)와 같은 순서로 둔다.
+_CURRENT_PRICE_FIELDS = (
+    ("stck_prpr", "current_price", "int64"),
+    ("prdy_vrss", "change", "int64"),
+    ("prdy_ctrt", "change_rate", "float64"),
+    ("stck_oprc", "open_price", "int64"),
+    ("stck_hgpr", "high_price", "int64"),
+    ("stck_lwpr", "low_price", "int64"),
+    ("acml_vol", "volume", "int64"),
+    ("acml_tr_pbmn", "trade_amount", "int64"),
+)
+_MULTI_PRICE_FIELDS = (
+    ("inter2_prpr", "current_price", "int64"),
+    ("inter2_prdy_vrss", "change", "int64"),
+    ("prdy_ctrt", "change_rate", "float64"),
+    ("inter2_oprc", "open_price", "int64"),
+    ("inter2_hgpr", "high_price", "int64"),
+    ("inter2_lwpr", "low_price", "int64"),
+    ("acml_vol", "volume", "int64"),
+    ("acml_tr_pbmn", "trade_amount", "int64"),
+)
+# 기간별 시세 숫자 컬럼 (날짜 stck_bsop_date는 캐시/백테스트와 같은 YYYYMMDD 문자열로 둔다)
+_DAILY_PRICE_DTYPES = {
+    "stck_oprc": "int64",
+    "stck_hgpr": "int64",
+    "stck_lwpr": "int64",
+    "stck_clpr": "int64",
+    "prdy_vrss": "int64",
+    "acml_vol": "int64",
+    "acml_tr_pbmn": "int64",
+}
+_INDEX_DAILY_DTYPES = {
+    "bstp_nmix_prpr": "float64",
+    "bstp_nmix_oprc": "float64",
+    "bstp_nmix_hgpr": "float64",
+    "bstp_nmix_lwpr": "float64",
+    "acml_vol": "int64",
+    "acml_tr_pbmn": "int64",
+}
+
+_RANKING_FIELDS = (
+    ("stck_prpr", "current_price", "int64"),
+    ("prdy_ctrt", "change_rate", "float64"),
+    ("acml_vol", "volume", "int64"),
+    ("data_rank", "rank", "int64"),
+)
+
+
+_SCALAR_CASTERS = {"int64": int, "float64": float}
+
+
+def _cast_record(record: dict, numeric_fields: tuple) -> list:
+    """단건 응답 레코드의 숫자 필드를 변환표 순서대로 변환한다 (없는 키는 0)."""
+    return [
+        _SCALAR_CASTERS[dtype](record.get(key, 0))
+        for key, _name, dtype in numeric_fields
+    ]
+
+
+def _typed_frame(rows: List[dict], dtypes: Dict[str, str]) -> "pd.DataFrame":
+    """레코드 목록으로 DataFrame을 만들고 알려진 숫자 컬럼을 object에서 숫자 dtype으로 바꾼다."""
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(rows)
+    for col, dtype in dtypes.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+    return df
+
+
+def _typed_columns(
+    rows: List[dict], text_fields: Dict[str, str], numeric_fields: tuple
+) -> Dict[str, list]:
+    """응답 레코드를 DataFrame으로 한 번에 형변환해 모델 필드별 값 목록으로 반환한다.
+
+    숫자로 바꿀 수 없는 값이 있는 행은 건너뛴다. 응답에 아예 없는 키는
+    문자열은 "", 숫자는 0으로 채운다.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(rows)
+    columns: Dict[str, list] = {}
+    valid = pd.Series(True, index=df.index)
+    numeric = {}
+    for key, name, dtype in numeric_fields:
+        if key in df.columns:
+            values = pd.to_numeric(df[key], errors="coerce")
+            # 정수 필드에 소수가 오면 int() 변환과 마찬가지로 잘못된 값으로 본다
+            valid &= values.notna() if dtype != "int64" else (values % 1 == 0)
+            numeric[name] = (values, dtype)
+        else:
+            numeric[name] = (pd.Series(0, index=df.index), dtype)
+
+    for key, name in text_fields.items():
+        col = df[key] if key in df.columns else pd.Series("", index=df.index)
+        columns[name] = col[valid].fillna("").tolist()
+    for name, (values, dtype) in numeric.items():
+        columns[name] = values[valid].astype(dtype).tolist()
+    return columns
+
 
 class MarketDataAPI:
     """국내주식 시세 조회 API."""
 
-    def __init__(self, client: KISClient):
+    def __init__(self, client: KISClient, holiday_cache_path: Optional[str] = None):
+        """
+        Args:
+            client: KIS API 클라이언트
+            holiday_cache_path: 휴장일 조회 결과를 저장할 JSON 파일. None이면 메모리에만 캐싱.
+        """
         self.client = client
         self._market_open_cache: dict[str, bool] = {}
         self._holiday_warned_dates: set[str] = set()
+        self._holiday_cache_path = holiday_cache_path
+        self._holiday_disk_cache: Optional[dict] = None
+        # (TR ID, 종목/업종, 시작일, 종료일, ...) → (조회 시각, 원본 레코드)
+        self._daily_rows_cache: Dict[tuple, Tuple[float, List[dict]]] = {}
+        # 백테스트 병렬 다운로드 워커들이 동시에 읽고 쓰므로 보호한다
+        self._daily_rows_lock = threading.Lock()
 
     def get_current_price(self, symbol: str) -> Optional[Quote]:
         """주식 현재가를 조회한다.
@@ -38,16 +201,7 @@ class MarketDataAPI:
 
         o = res.output
         return Quote(
-            symbol=symbol,
-            name=o.get("hts_kor_isnm", ""),
-            current_price=int(o.get("stck_prpr", 0)),
-            change=int(o.get("prdy_vrss", 0)),
-            change_rate=float(o.get("prdy_ctrt", 0)),
-            open_price=int(o.get("stck_oprc", 0)),
-            high_price=int(o.get("stck_hgpr", 0)),
-            low_price=int(o.get("stck_lwpr", 0)),
-            volume=int(o.get("acml_vol", 0)),
-            trade_amount=int(o.get("acml_tr_pbmn", 0)),
+            symbol, o.get("hts_kor_isnm", ""), *_cast_record(o, _CURRENT_PRICE_FIELDS)
         )
 
     def get_orderbook(self, symbol: str) -> Optional[dict]:
@@ -73,7 +227,7 @@ class MarketDataAPI:
         end_date: str,
         period: str = "D",
         adjusted: bool = True,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """기간별 시세(일/주/월/년)를 조회한다.
 
         Args:
@@ -83,6 +237,31 @@ class MarketDataAPI:
             period: D(일), W(주), M(월), Y(년)
             adjusted: True면 수정주가
         """
+        import pandas as pd
+
+        rows = self.get_daily_price_rows(symbol, start_date, end_date, period, adjusted)
+        if not rows:
+            return pd.DataFrame()
+        return _typed_frame(rows, _DAILY_PRICE_DTYPES)
+
+    def get_daily_price_rows(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        period: str = "D",
+        adjusted: bool = True,
+    ) -> List[dict]:
+        """기간별 시세를 DataFrame으로 감싸지 않고 API 원본 레코드(최신순)로 반환한다.
+
+        여러 페이지를 모아 한 번에 DataFrame을 만들 때 사용한다.
+        같은 조건의 조회는 DAILY_ROWS_TTL초 동안 직전 응답을 재사용한다.
+        """
+        cache_key = ("FHKST03010100", symbol, start_date, end_date, period, adjusted)
+        cached = self._cached_daily_rows(cache_key)
+        if cached is not None:
+            return cached
+
         res = self.client.get(
             api_url="/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
             tr_id="FHKST03010100",
@@ -97,12 +276,9 @@ class MarketDataAPI:
         )
         if not res.success:
             logger.error("기간별 시세 조회 실패 [%s]: %s", symbol, res.error_message)
-            return pd.DataFrame()
+            return []
 
-        data = res.output2
-        if not data:
-            return pd.DataFrame()
-        return pd.DataFrame(data)
+        return self._store_daily_rows(cache_key, res.output2 or [])
 
     def get_fluctuation_ranking(
         self,
@@ -118,18 +294,10 @@ class MarketDataAPI:
             api_url="/uapi/domestic-stock/v1/ranking/fluctuation",
             tr_id="FHPST01700000",
             params={
-                "fid_cond_mrkt_div_code": "J",
-                "fid_cond_scr_div_code": "20170",
-                "fid_input_iscd": "0000",
-                "fid_rank_sort_cls_code": "0",
-                "fid_input_cnt_1": "0",
-                "fid_prc_cls_code": "0",
+                **_FLUCTUATION_RANKING_PARAMS,
                 "fid_input_price_1": str(min_price) if min_price else "",
                 "fid_input_price_2": str(max_price) if max_price else "",
                 "fid_vol_cnt": str(min_volume) if min_volume else "",
-                "fid_trgt_cls_code": "0",
-                "fid_trgt_exls_cls_code": "0",
-                "fid_div_cls_code": "0",
                 "fid_rsfl_rate1": str(min_change_rate) if min_change_rate else "",
                 "fid_rsfl_rate2": str(max_change_rate) if max_change_rate else "",
             },
@@ -138,67 +306,44 @@ class MarketDataAPI:
             logger.error("등락률 순위 조회 실패: %s", res.error_message)
             return []
 
-        items = []
-        for row in (res.output or [])[:count]:
-            try:
-                items.append(RankingItem(
-                    symbol=row.get("stck_shrn_iscd", ""),
-                    name=row.get("hts_kor_isnm", ""),
-                    current_price=int(row.get("stck_prpr", 0)),
-                    change_rate=float(row.get("prdy_ctrt", 0)),
-                    volume=int(row.get("acml_vol", 0)),
-                    rank=int(row.get("data_rank", 0)),
-                ))
-            except (ValueError, TypeError):
-                continue
-        return items
+        return self._parse_ranking((res.output or [])[:count], "stck_shrn_iscd")
 
     def get_market_cap_ranking(self, count: int = 30) -> List[RankingItem]:
         """시가총액 상위 종목을 조회한다."""
         res = self.client.get(
             api_url="/uapi/domestic-stock/v1/ranking/market-cap",
             tr_id="FHPST01740000",
-            params={
-                "fid_cond_mrkt_div_code": "J",
-                "fid_cond_scr_div_code": "20174",
-                "fid_div_cls_code": "0",
-                "fid_input_iscd": "0000",
-                "fid_trgt_cls_code": "0",
-                "fid_trgt_exls_cls_code": "0",
-                "fid_input_price_1": "",
-                "fid_input_price_2": "",
-                "fid_vol_cnt": "",
-            },
+            params=_MARKET_CAP_RANKING_PARAMS,
         )
         if not res.success:
             logger.error("시가총액 순위 조회 실패: %s", res.error_message)
             return []
 
-        items = []
-        for row in (res.output or [])[:count]:
-            try:
-                items.append(RankingItem(
-                    symbol=row.get("mksc_shrn_iscd", ""),
-                    name=row.get("hts_kor_isnm", ""),
-                    current_price=int(row.get("stck_prpr", 0)),
-                    change_rate=float(row.get("prdy_ctrt", 0)),
-                    volume=int(row.get("acml_vol", 0)),
-                    rank=int(row.get("data_rank", 0)),
-                ))
-            except (ValueError, TypeError):
-                continue
-        return items
+        return self._parse_ranking((res.output or [])[:count], "mksc_shrn_iscd")
+
+    @staticmethod
+    def _parse_ranking(rows: List[dict], symbol_key: str) -> List[RankingItem]:
+        """순위 응답 레코드를 RankingItem 목록으로 변환한다."""
+        if not rows:
+            return []
+        cols = _typed_columns(
+            rows, {symbol_key: "symbol", "hts_kor_isnm": "name"}, _RANKING_FIELDS
+        )
+        return [
+            RankingItem(*values)
+            for values in zip(
+                cols["symbol"], cols["name"], *(cols[name] for _, name, _ in _RANKING_FIELDS)
+            )
+        ]
 
     def get_multi_price(self, symbols: List[str]) -> List[Quote]:
         """최대 30종목의 시세를 한번에 조회한다."""
         if not symbols:
             return []
-        symbols = symbols[:30]
-
         params = {}
-        for i, sym in enumerate(symbols, 1):
-            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
-            params[f"FID_INPUT_ISCD_{i}"] = sym
+        for (market_key, symbol_key), sym in zip(_MULTI_PRICE_PARAM_KEYS, symbols):
+            params[market_key] = "J"
+            params[symbol_key] = sym
 
         res = self.client.get(
             api_url="/uapi/domestic-stock/v1/quotations/intstock-multprice",
@@ -209,34 +354,27 @@ class MarketDataAPI:
             logger.error("멀티시세 조회 실패: %s", res.error_message)
             return []
 
-        quotes = []
-        for row in (res.output or []):
-            sym = row.get("inter_shrn_iscd", "")
-            if not sym:
-                continue
-            try:
-                quotes.append(Quote(
-                    symbol=sym,
-                    name=row.get("inter_kor_isnm", ""),
-                    current_price=int(row.get("inter2_prpr", 0)),
-                    change=int(row.get("inter2_prdy_vrss", 0)),
-                    change_rate=float(row.get("prdy_ctrt", 0)),
-                    open_price=int(row.get("inter2_oprc", 0)),
-                    high_price=int(row.get("inter2_hgpr", 0)),
-                    low_price=int(row.get("inter2_lwpr", 0)),
-                    volume=int(row.get("acml_vol", 0)),
-                    trade_amount=int(row.get("acml_tr_pbmn", 0)),
-                ))
-            except (ValueError, TypeError):
-                continue
-        return quotes
+        rows = [row for row in (res.output or []) if row.get("inter_shrn_iscd")]
+        if not rows:
+            return []
+        cols = _typed_columns(
+            rows, {"inter_shrn_iscd": "symbol", "inter_kor_isnm": "name"}, _MULTI_PRICE_FIELDS
+        )
+        # 한 응답의 시세는 같은 시각으로 찍는다 (종목마다 datetime.now() 호출 방지)
+        fetched_at = datetime.now()
+        return [
+            Quote(*values, timestamp=fetched_at)
+            for values in zip(
+                cols["symbol"], cols["name"], *(cols[name] for _, name, _ in _MULTI_PRICE_FIELDS)
+            )
+        ]
 
     def get_index_daily_prices(
         self,
         index_code: str = "0001",
         start_date: str = "",
         end_date: str = "",
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """업종(인덱스) 일봉 시세를 조회한다.
 
         Args:
@@ -244,11 +382,52 @@ class MarketDataAPI:
             start_date: 시작일 (YYYYMMDD)
             end_date: 종료일 (YYYYMMDD)
         """
-        if not end_date:
-            end_date = datetime.today().strftime("%Y%m%d")
-        if not start_date:
-            from datetime import timedelta
-            start_date = (datetime.today() - timedelta(days=45)).strftime("%Y%m%d")
+        import pandas as pd
+
+        rows = self.get_index_daily_rows(index_code, start_date, end_date)
+        if not rows:
+            return pd.DataFrame()
+        return _typed_frame(rows, _INDEX_DAILY_DTYPES)
+
+    def get_index_daily_closes(
+        self,
+        index_code: str = "0001",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> "np.ndarray":
+        """업종(인덱스) 일봉 종가만 오래된 순 float64 배열로 반환한다.
+
+        이동평균 계산처럼 종가만 필요한 곳에서 DataFrame 생성을 피하기 위한 경로.
+        숫자가 아니거나 0 이하인 값은 건너뛰며, 조회 실패 시 빈 배열을 반환한다.
+        """
+        import numpy as np
+
+        closes = []
+        for row in reversed(self.get_index_daily_rows(index_code, start_date, end_date)):
+            try:
+                close = float(row.get("bstp_nmix_prpr", ""))
+            except (TypeError, ValueError):
+                continue
+            if close > 0:
+                closes.append(close)
+        return np.array(closes, dtype=np.float64)
+
+    def get_index_daily_rows(
+        self,
+        index_code: str = "0001",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> List[dict]:
+        """업종(인덱스) 일봉을 API 원본 레코드(최신순)로 반환한다. 기간 기본값은 최근 45일."""
+        if not end_date or not start_date:
+            today = datetime.today()
+            end_date = end_date or today.strftime("%Y%m%d")
+            start_date = start_date or (today - timedelta(days=45)).strftime("%Y%m%d")
+
+        cache_key = ("FHKUP03500100", index_code, start_date, end_date)
+        cached = self._cached_daily_rows(cache_key)
+        if cached is not None:
+            return cached
 
         res = self.client.get(
             api_url="/uapi/domestic-stock/v1/quotations/inquire-daily-indexchartprice",
@@ -263,20 +442,44 @@ class MarketDataAPI:
         )
         if not res.success:
             logger.error("인덱스 일봉 조회 실패 [%s]: %s", index_code, res.error_message)
-            return pd.DataFrame()
+            return []
 
-        data = res.output2
-        if not data:
-            return pd.DataFrame()
-        return pd.DataFrame(data)
+        return self._store_daily_rows(cache_key, res.output2 or [])
+
+    def _cached_daily_rows(self, key: tuple) -> Optional[List[dict]]:
+        with self._daily_rows_lock:
+            entry = self._daily_rows_cache.get(key)
+        if entry is None or time.time() - entry[0] >= DAILY_ROWS_TTL:
+            return None
+        return list(entry[1])
+
+    def _store_daily_rows(self, key: tuple, rows: List[dict]) -> List[dict]:
+        """성공한 응답만 캐시에 넣고, 넣을 때 만료된 항목을 정리한다."""
+        if rows:
+            now = time.time()
+            with self._daily_rows_lock:
+                cache = self._daily_rows_cache
+                for k in [k for k, v in cache.items() if now - v[0] >= DAILY_ROWS_TTL]:
+                    del cache[k]
+                cache[key] = (now, rows)
+        return list(rows)
 
     def is_market_open(self, date: str = None) -> bool:
-        """오늘(또는 지정일)이 거래일인지 확인한다."""
+        """오늘(또는 지정일)이 거래일인지 확인한다.
+
+        메모리 → 디스크(TTL) → API 순으로 확인한다.
+        """
+        today = datetime.today().strftime("%Y%m%d")
         if date is None:
-            date = datetime.today().strftime("%Y%m%d")
+            date = today
         if date in self._market_open_cache:
             return self._market_open_cache[date]
 
+        cached = self._load_holiday_entry(date)
+        if cached is not None:
+            self._market_open_cache[date] = cached
+            return cached
+
         res = self.client.get(
             api_url="/uapi/domestic-stock/v1/quotations/chk-holiday",
             tr_id="CTCA0903R",
@@ -298,6 +501,7 @@ class MarketDataAPI:
             else:
                 logger.warning("휴장일 조회 실패, 주중 fallback 사용: %s", res.error_message)
             self._market_open_cache[date] = is_open
+            self._store_holiday_entry(date, is_open, HOLIDAY_TTL_FALLBACK)
             return is_open
 
         output = res.output
@@ -306,14 +510,57 @@ class MarketDataAPI:
             today_info = output[0]
             is_open = today_info.get("opnd_yn", "Y") == "Y"
             self._market_open_cache[date] = is_open
+            ttl = HOLIDAY_TTL_PAST if date < today else HOLIDAY_TTL_TODAY
+            self._store_holiday_entry(date, is_open, ttl)
             return is_open
 
         is_open = self._weekday_fallback_open(date)
         self._market_open_cache[date] = is_open
         return is_open
 
+    def _holiday_entries(self) -> dict:
+        """디스크 캐시를 처음 한 번만 읽어 둔다."""
+        if self._holiday_disk_cache is None:
+            self._holiday_disk_cache = {}
+            if self._holiday_cache_path:
+                try:
+                    with open(self._holiday_cache_path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._holiday_disk_cache = data
+                except (OSError, ValueError):
+                    pass
+        return self._holiday_disk_cache
+
+    def _load_holiday_entry(self, date: str) -> Optional[bool]:
+        if not self._holiday_cache_path:
+            return None
+        entry = self._holiday_entries().get(date)
+        try:
+            if entry and time.time() - entry["fetched_at"] < entry["ttl"]:
+                return bool(entry["is_open"])
+        except (KeyError, TypeError):
+            pass
+        return None
+
+    def _store_holiday_entry(self, date: str, is_open: bool, ttl: int):
+        if not self._holiday_cache_path:
+            return
+        entries = self._holiday_entries()
+        entries[date] = {"is_open": is_open, "fetched_at": time.time(), "ttl": ttl}
+        # 임시 파일에 쓴 뒤 교체해 중간에 끊겨도 캐시 파일이 깨지지 않게 한다
+        tmp_path = f"{self._holiday_cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._holiday_cache_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self._holiday_cache_path)
+        except OSError as e:
+            logger.debug("휴장일 캐시 저장 실패: %s", e)
+
     def _weekday_fallback_open(self, date: str) -> bool:
+        # YYYYMMDD 고정 형식이므로 strptime 대신 슬라이싱으로 파싱한다
         try:
-            return datetime.strptime(date, "%Y%m%d").weekday() < 5
+            return datetime(int(date[:4]), int(date[4:6]), int(date[6:8])).weekday() < 5
         except ValueError:
             return datetime.today().weekday() < 5
@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+import numpy as np
+
 
 class OrderSide(Enum):
     BUY = "buy"
@@ -20,7 +22,7 @@ class OrderType(Enum):
     TIME_EXT = "07"    # 시간외 단일가
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     symbol: str           # 종목코드
     name: str             # 종목명
@@ -35,7 +37,7 @@ class Quote:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     symbol: str
     side: OrderSide
@@ -44,7 +46,7 @@ class Order:
     price: int = 0  # 시장가일 때 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     success: bool
     order_no: str = ""
@@ -56,7 +58,7 @@ class OrderResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str           # 종목코드
     name: str             # 종목명
@@ -69,15 +71,98 @@ class Position:
 
 
 @dataclass
+class PositionArrays:
+    """보유종목을 필드별 배열(SoA)로 보관한다. i번째 원소들이 한 종목이다."""
+    symbols: np.ndarray          # object
+    names: np.ndarray            # object
+    quantities: np.ndarray       # int64
+    avg_prices: np.ndarray       # float64
+    current_prices: np.ndarray   # int64
+    eval_amounts: np.ndarray     # int64
+    profit_losses: np.ndarray    # int64
+    profit_rates: np.ndarray     # float64
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __eq__(self, other: object) -> bool:
+        # ndarray의 ==는 원소별 배열을 돌려주므로 필드마다 array_equal로 비교한다
+        if not isinstance(other, PositionArrays):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, f.name), getattr(other, f.name))
+            for f in fields(self)
+        )
+
+    @classmethod
+    def from_positions(cls, positions: List[Position]) -> "PositionArrays":
+        return cls(
+            symbols=np.array([p.symbol for p in positions], dtype=object),
+            names=np.array([p.name for p in positions], dtype=object),
+            quantities=np.array([p.quantity for p in positions], dtype=np.int64),
+            avg_prices=np.array([p.avg_price for p in positions], dtype=np.float64),
+            current_prices=np.array([p.current_price for p in positions], dtype=np.int64),
+            eval_amounts=np.array([p.eval_amount for p in positions], dtype=np.int64),
+            profit_losses=np.array([p.profit_loss for p in positions], dtype=np.int64),
+            profit_rates=np.array([p.profit_rate for p in positions], dtype=np.float64),
+        )
+
+    def to_positions(self) -> List[Position]:
+        return [
+            Position(*row)
+            for row in zip(
+                self.symbols.tolist(),
+                self.names.tolist(),
+                self.quantities.tolist(),
+                self.avg_prices.tolist(),
+                self.current_prices.tolist(),
+                self.eval_amounts.tolist(),
+                self.profit_losses.tolist(),
+                self.profit_rates.tolist(),
+            )
+        ]
+
+
+@dataclass(slots=True, init=False)
 class AccountBalance:
     total_eval_amount: int       # 총평가금액
     total_deposit: int           # 예수금
     total_profit_loss: int       # 총평가손익
     total_profit_rate: float     # 총수익률(%)
-    positions: List[Position] = field(default_factory=list)
-
-
-@dataclass
+    position_arrays: Optional[PositionArrays] = None
+    _positions: Optional[List[Position]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        total_eval_amount: int,
+        total_deposit: int,
+        total_profit_loss: int,
+        total_profit_rate: float,
+        position_arrays: Optional[PositionArrays] = None,
+        positions: Optional[List[Position]] = None,
+    ):
+        """보유종목은 position_arrays 또는 positions(목록) 중 하나로 넘긴다. 목록은 배열로 바꿔 보관한다."""
+        if positions and position_arrays is not None:
+            raise ValueError("position_arrays와 positions는 함께 지정할 수 없습니다")
+        self.total_eval_amount = total_eval_amount
+        self.total_deposit = total_deposit
+        self.total_profit_loss = total_profit_loss
+        self.total_profit_rate = total_profit_rate
+        self.position_arrays = PositionArrays.from_positions(positions) if positions else position_arrays
+        self._positions = list(positions) if positions else None
+
+    @property
+    def positions(self) -> List[Position]:
+        """보유종목 목록. 처음 접근할 때 position_arrays에서 만든다."""
+        if self._positions is None:
+            if self.position_arrays is None:
+                self._positions = []
+            else:
+                self._positions = self.position_arrays.to_positions()
+        return self._positions
+
+
+@dataclass(slots=True)
 class RankingItem:
     """순위 조회 결과 항목."""
     symbol: str           # 종목코드
@@ -1,14 +1,66 @@
+import atexit
+import heapq
 import logging
 import os
+import queue
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("kis_trader.notifications")
 
+_LEVEL_ICONS = {
+    "info": ":large_blue_circle:",
+    "warning": ":large_orange_circle:",
+    "error": ":red_circle:",
+}
+_DEFAULT_ICON = ":white_circle:"
+
+# 백그라운드 전송 대기열 크기. 가득 차면 새 알림은 버린다 (메모리 상한)
+ALERT_QUEUE_SIZE = 64
+# 쿨다운 기록을 보관할 최대 이벤트 키 수. 넘으면 만료된 기록부터 정리한다
+ALERT_KEY_LIMIT = 1024
+# 프로세스 종료 시 남은 알림 전송을 기다리는 최대 시간(초). 웹훅이 죽어 있어도 종료가 막히지 않게 한다
+ALERT_EXIT_FLUSH_TIMEOUT = 5.0
+
+
+def _create_session() -> requests.Session:
+    """웹훅 호출용 keep-alive 세션. 연속 알림 시 TLS 핸드셰이크를 재사용한다."""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        ),
+    )
+    return session
+
+
+_session = _create_session()
+
+
+@lru_cache(maxsize=8)
+def _parse_alert_env(
+    enabled: str, channel: str, webhook: str, min_interval: str
+) -> Tuple[bool, str, str, int]:
+    """알림 환경변수 원문을 파싱한다. 같은 값이면 캐시된 결과를 재사용한다."""
+    return (
+        enabled.strip().lower() in ("1", "true", "yes", "on"),
+        channel.strip().lower() or "slack",
+        webhook.strip(),
+        max(0, int(min_interval)),
+    )
+
 
 @dataclass
 class AlertConfig:
@@ -19,22 +71,40 @@ class AlertConfig:
 
     @classmethod
     def from_env(cls) -> "AlertConfig":
-        enabled = os.getenv("ALERTS_ENABLED", "false").strip().lower() in ("1", "true", "yes", "on")
-        channel = os.getenv("ALERT_CHANNEL", "slack").strip().lower() or "slack"
-        webhook = os.getenv("SLACK_WEBHOOK_URL", "").strip()
-        min_interval = int(os.getenv("ALERT_MIN_INTERVAL_SECONDS", "300"))
+        # 환경변수 조회는 dict 조회 수준이라 매번 읽고, 파싱 결과만 메모이즈한다
+        # (.env 로드 전후로 값이 바뀌어도 항상 현재 값을 반영)
+        enabled, channel, webhook, min_interval = _parse_alert_env(
+            os.getenv("ALERTS_ENABLED", "false"),
+            os.getenv("ALERT_CHANNEL", "slack"),
+            os.getenv("SLACK_WEBHOOK_URL", ""),
+            os.getenv("ALERT_MIN_INTERVAL_SECONDS", "300"),
+        )
         return cls(
             enabled=enabled,
             channel=channel,
             slack_webhook_url=webhook,
-            min_interval_seconds=max(0, min_interval),
+            min_interval_seconds=min_interval,
         )
 
 
 @dataclass
 class AlertManager:
+    """알림 전송기.
+
+    쿨다운 판정은 호출 스레드에서 하고, 실제 HTTP 전송은 백그라운드 워커가
+    맡는다. 트레이딩 루프가 웹훅 응답(최대 5초)을 기다리며 멈추지 않게 하기 위함.
+    send()의 True는 전송 대기열에 들어갔다는 뜻이다.
+    """
+
     cfg: AlertConfig = field(default_factory=AlertConfig.from_env)
     _last_sent: Dict[str, float] = field(default_factory=dict)
+    # 지금까지 쓰인 가장 긴 쿨다운. 이보다 오래된 기록은 더 이상 전송을 막지 못한다
+    _max_interval: float = field(default=0.0, repr=False)
+    _queue: "queue.Queue" = field(
+        default_factory=lambda: queue.Queue(maxsize=ALERT_QUEUE_SIZE), repr=False
+    )
+    _worker: Optional[threading.Thread] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def send(
         self,
@@ -60,27 +130,85 @@ class AlertManager:
 
         min_interval = max(self.cfg.min_interval_seconds, cooldown_seconds)
         now = time.time()
-        last_ts = self._last_sent.get(event_key, 0.0)
-        if min_interval > 0 and now - last_ts < min_interval:
-            return False
+        with self._lock:
+            last_ts = self._last_sent.get(event_key, 0.0)
+            if min_interval > 0 and now - last_ts < min_interval:
+                return False
 
-        ok = self._send_slack(level=level, title=title, message=message)
-        if ok:
+            try:
+                self._queue.put_nowait((event_key, now, level, title, message))
+            except queue.Full:
+                logger.warning("알림 대기열이 가득 차 알림을 버립니다: %s", title)
+                return False
             self._last_sent[event_key] = now
-        return ok
+            self._max_interval = max(self._max_interval, min_interval)
+            if len(self._last_sent) > ALERT_KEY_LIMIT:
+                self._prune_last_sent(now)
+            self._ensure_worker()
+        return True
+
+    def _prune_last_sent(self, now: float):
+        """만료된 쿨다운 기록을 지우고, 그래도 많으면 오래된 것부터 버린다 (_lock 안에서 호출)."""
+        horizon = now - self._max_interval
+        self._last_sent = {k: ts for k, ts in self._last_sent.items() if ts > horizon}
+        overflow = len(self._last_sent) - ALERT_KEY_LIMIT
+        if overflow > 0:
+            for key, _ in heapq.nsmallest(overflow, self._last_sent.items(), key=itemgetter(1)):
+                del self._last_sent[key]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기열의 알림이 모두 전송(또는 실패)될 때까지 기다린다.
+
+        timeout(초)을 주면 그때까지만 기다리고, 남은 알림이 있으면 False를 반환한다.
+        """
+        q = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                if deadline is None:
+                    q.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+
+    def _flush_at_exit(self):
+        if not self.flush(timeout=ALERT_EXIT_FLUSH_TIMEOUT):
+            logger.warning("종료 전 알림 %d건을 보내지 못했습니다", self._queue.unfinished_tasks)
+
+    def _ensure_worker(self):
+        # _lock 안에서 호출된다
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_worker, name="alert-sender", daemon=True
+            )
+            self._worker.start()
+            # 종료 직전에 쌓인 알림(일일 중단 등)도 내보내되 오래 막지는 않는다.
+            # 워커는 인스턴스당 한 번만 만들어지므로 훅도 한 번만 등록된다
+            atexit.register(self._flush_at_exit)
+
+    def _run_worker(self):
+        while True:
+            event_key, queued_at, level, title, message = self._queue.get()
+            try:
+                if not self._send_slack(level=level, title=title, message=message):
+                    # 전송 실패 시 쿨다운을 풀어 다음 호출에서 재시도할 수 있게 한다
+                    with self._lock:
+                        if self._last_sent.get(event_key) == queued_at:
+                            del self._last_sent[event_key]
+            finally:
+                self._queue.task_done()
 
     def _send_slack(self, level: str, title: str, message: str) -> bool:
-        icon = {
-            "info": ":large_blue_circle:",
-            "warning": ":large_orange_circle:",
-            "error": ":red_circle:",
-        }.get(level, ":white_circle:")
+        icon = _LEVEL_ICONS.get(level, _DEFAULT_ICON)
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         text = f"{icon} *{title}*\n{message}\n`{ts}`"
         payload = {"text": text}
 
         try:
-            res = requests.post(self.cfg.slack_webhook_url, json=payload, timeout=5)
+            res = _session.post(self.cfg.slack_webhook_url, json=payload, timeout=5)
             if 200 <= res.status_code < 300:
                 return True
             logger.warning("슬랙 알림 실패 HTTP %d: %s", res.status_code, res.text)
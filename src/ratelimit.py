@@ -0,0 +1,60 @@
+import logging
+import threading
+import time
+from typing import Dict
+
+logger = logging.getLogger("kis_trader.ratelimit")
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 레이트 리미터.
+
+    초당 rate_per_sec개의 토큰이 채워지고 최대 burst개까지 쌓인다.
+    토큰이 없으면 선예약 후 대기하므로, 여러 스레드가 동시에 호출해도
+    대기 시간이 순서대로 누적되어 전체 호출 속도가 한도를 넘지 않는다.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec는 0보다 커야 합니다.")
+        self.rate = rate_per_sec
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 1개를 소비한다. 부족하면 채워질 때까지 대기하고 대기한 시간(초)을 반환한다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_shared_buckets: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bucket(key: str, rate_per_sec: float, burst: int = 1) -> TokenBucket:
+    """같은 key(예: 앱키)를 쓰는 모든 클라이언트가 공유하는 프로세스 전역 버킷을 반환한다.
+
+    호출 한도는 key 단위이므로 버킷도 key 하나에 하나만 둔다. 나중 호출이 다른
+    rate/burst를 요청해도 처음 만든 버킷의 설정을 유지한다.
+    """
+    with _shared_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate_per_sec, burst)
+            _shared_buckets[key] = bucket
+        elif bucket.rate != rate_per_sec or bucket.capacity != max(1, burst):
+            logger.warning(
+                "이미 만든 공유 버킷 설정(%.2f/s, burst %d)을 유지합니다 (요청: %.2f/s, burst %d)",
+                bucket.rate, int(bucket.capacity), rate_per_sec, burst,
+            )
+        return bucket
@@ -1,6 +1,10 @@
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain
+from typing import List, Optional
 
 from src.account import AccountAPI
 from src.api_client import KISClient
@@ -8,7 +12,8 @@ from src.auth import TokenManager
 from src.config import Config
 from src.executor import OrderExecutor, RiskManager
 from src.logger_setup import setup_logger
-from src.market_data import MarketDataAPI
+from src.market_data import HOLIDAY_CACHE_FILE, MarketDataAPI
+from src.models import Quote
 from src.strategy import BaseStrategy
 from src.trading import TradingAPI
 
@@ -18,6 +23,15 @@ logger = logging.getLogger("kis_trader.scheduler")
 MARKET_OPEN = (9, 0)    # 09:00
 MARKET_CLOSE = (15, 30)  # 15:30
 PRE_OPEN = (8, 50)       # 장 시작 10분 전 준비
+# 요일(월=0)별 다음 평일까지의 일수: 금→월 3일, 토→월 2일
+_DAYS_TO_NEXT_WEEKDAY = (1, 1, 1, 1, 3, 2, 1)
+
+# 멀티 시세 조회 한 번에 담을 수 있는 종목 수와 동시 조회 스레드 수.
+# 실제 호출 간격은 KISClient의 공유 레이트 리미터가 보장한다.
+QUOTE_BATCH_SIZE = 30
+QUOTE_FETCH_WORKERS = 4
+# 감시 종목이 그대로이고 직전 조회 후 이 시간(초)이 안 지났으면 시세를 재사용한다
+QUOTE_MIN_REFETCH_SECONDS = 1.0
 
 
 class TradingScheduler:
@@ -26,18 +40,20 @@ class TradingScheduler:
     def __init__(self, strategy: BaseStrategy, config: Config = None):
         self.config = config or Config.load()
         self.strategy = strategy
-        self._shutdown = False
+        self._shutdown = threading.Event()
 
         # 컴포넌트 초기화
         self.token_mgr = TokenManager(self.config)
         self.client = KISClient(self.config, self.token_mgr)
-        self.market_data = MarketDataAPI(self.client)
+        self.market_data = MarketDataAPI(self.client, holiday_cache_path=HOLIDAY_CACHE_FILE)
         self.trading = TradingAPI(self.client)
         self.account = AccountAPI(self.client)
         self.executor = OrderExecutor(self.trading, RiskManager())
+        # 배치 시세 조회용 워커 풀. 틱마다 스레드를 새로 만들지 않도록 재사용한다
+        self._quote_pool: Optional[ThreadPoolExecutor] = None
 
     def stop(self):
-        self._shutdown = True
+        self._shutdown.set()
 
     def run(self, tick_interval: int = 10):
         """스케줄러를 시작한다. Ctrl+C로 종료.
@@ -52,12 +68,12 @@ class TradingScheduler:
         logger.info("=" * 50)
 
         try:
-            while not self._shutdown:
+            while not self._shutdown.is_set():
                 now = datetime.now()
 
                 if self._is_trading_time(now):
                     halted_for_day = self._run_trading_session(tick_interval)
-                    if halted_for_day and not self._shutdown:
+                    if halted_for_day and not self._shutdown.is_set():
                         logger.info("당일 하드스탑 감지: 다음 장 준비 시각까지 대기합니다.")
                         self._sleep_until_preopen()
                 else:
@@ -79,6 +95,10 @@ class TradingScheduler:
         except KeyboardInterrupt:
             logger.info("Ctrl+C — 스케줄러를 종료합니다.")
         finally:
+            self.trading.shutdown()
+            if self._quote_pool is not None:
+                self._quote_pool.shutdown(wait=False)
+                self._quote_pool = None
             logger.info("스케줄러 종료")
 
     def _is_trading_time(self, now: datetime) -> bool:
@@ -93,36 +113,44 @@ class TradingScheduler:
 
     def _seconds_until_preopen(self, now: datetime) -> int:
         """다음 준비 시각까지 남은 초."""
-        today_preopen = now.replace(hour=PRE_OPEN[0], minute=PRE_OPEN[1], second=0)
-
-        if now < today_preopen and now.weekday() < 5:
-            return int((today_preopen - now).total_seconds())
-
-        # 오늘 이미 지남 → 다음 평일 계산
-        days_ahead = 1
-        next_day = now + timedelta(days=days_ahead)
-        while next_day.weekday() >= 5:  # 토(5), 일(6) 건너뛰기
-            days_ahead += 1
-            next_day = now + timedelta(days=days_ahead)
+        target = now.date()
+        if now.weekday() >= 5 or (now.hour, now.minute) >= PRE_OPEN:
+            # 오늘 이미 지났거나 주말 → 다음 평일
+            target += timedelta(days=_DAYS_TO_NEXT_WEEKDAY[now.weekday()])
 
-        next_preopen = next_day.replace(hour=PRE_OPEN[0], minute=PRE_OPEN[1], second=0, microsecond=0)
+        next_preopen = datetime(target.year, target.month, target.day, *PRE_OPEN)
         return int((next_preopen - now).total_seconds())
 
     def _interruptible_sleep(self, seconds: int):
-        """shutdown 체크하면서 대기."""
-        end = time.time() + seconds
-        while time.time() < end and not self._shutdown:
-            time.sleep(1)
+        """shutdown 신호가 오면 즉시 깨어나는 대기."""
+        self._shutdown.wait(seconds)
 
     def _sleep_until_preopen(self):
         """다음 장 준비 시각까지 대기한다."""
-        while not self._shutdown:
+        while not self._shutdown.is_set():
             now = datetime.now()
             wait = self._seconds_until_preopen(now)
             if wait <= 0:
                 return
             self._interruptible_sleep(min(wait, 300))
 
+    def _fetch_quotes(self, watchlist: List[str]) -> List[Quote]:
+        """감시 종목 시세를 배치 단위로 나눠 동시에 조회한다. 결과는 종목 순서를 유지한다."""
+        chunks = [
+            watchlist[i:i + QUOTE_BATCH_SIZE]
+            for i in range(0, len(watchlist), QUOTE_BATCH_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return self.market_data.get_multi_price(chunks[0]) if chunks else []
+
+        if self._quote_pool is None:
+            self._quote_pool = ThreadPoolExecutor(
+                max_workers=QUOTE_FETCH_WORKERS, thread_name_prefix="quote-fetch"
+            )
+        return list(chain.from_iterable(
+            self._quote_pool.map(self.market_data.get_multi_price, chunks)
+        ))
+
     def _run_trading_session(self, tick_interval: int) -> bool:
         """장 시간 동안 전략을 실행한다.
 
@@ -143,7 +171,8 @@ class TradingScheduler:
 
         # 전략 초기화
         self.strategy.initialize()
-        watchlist = self.strategy.get_watchlist()
+        watchlist = list(dict.fromkeys(self.strategy.get_watchlist()))
+        watchlist_fetched_at = time.monotonic()
         logger.info("감시 종목: %d개", len(watchlist))
 
         # 잔고 확인
@@ -156,31 +185,41 @@ class TradingScheduler:
             )
 
         halted_for_day = False
+        last_watchlist: List[str] = []
+        last_quotes: List[Quote] = []
+        last_fetch = 0.0
 
         # 틱 루프
-        while not self._shutdown and self._is_trading_time(datetime.now()):
+        while not self._shutdown.is_set() and self._is_trading_time(datetime.now()):
             if not self.strategy.should_continue():
                 logger.info("전략이 종료를 요청했습니다.")
                 halted_for_day = True
                 break
 
-            # 동적 watchlist 갱신
-            watchlist = self.strategy.get_watchlist()
+            # 동적 watchlist 갱신: 설정 주기마다만 전략에 재조회한다 (순서 유지, 중복 제거)
+            if time.monotonic() - watchlist_fetched_at >= self.config.watchlist_refresh_seconds:
+                watchlist = list(dict.fromkeys(self.strategy.get_watchlist()))
+                watchlist_fetched_at = time.monotonic()
 
             # 배치 시세 조회 (30종목씩)
-            all_quotes = []
-            for i in range(0, len(watchlist), 30):
-                chunk = watchlist[i:i+30]
-                chunk_quotes = self.market_data.get_multi_price(chunk)
-                all_quotes.extend(chunk_quotes)
+            if (
+                watchlist == last_watchlist
+                and time.monotonic() - last_fetch < QUOTE_MIN_REFETCH_SECONDS
+            ):
+                all_quotes = last_quotes
+            else:
+                all_quotes = self._fetch_quotes(watchlist)
+                last_watchlist, last_quotes, last_fetch = watchlist, all_quotes, time.monotonic()
 
             if all_quotes:
-                for q in all_quotes:
-                    logger.debug(
-                        "[%s] %s %s원 (%+.2f%%)",
-                        q.symbol, q.name,
-                        f"{q.current_price:,}", q.change_rate,
-                    )
+                # 종목별 시세 로그는 DEBUG일 때만 만든다 (가격 포맷 비용 절약)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for q in all_quotes:
+                        logger.debug(
+                            "[%s] %s %s원 (%+.2f%%)",
+                            q.symbol, q.name,
+                            f"{q.current_price:,}", q.change_rate,
+                        )
 
                 orders = self.strategy.on_batch_tick(all_quotes)
                 if orders:
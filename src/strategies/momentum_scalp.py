@@ -9,19 +9,23 @@
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from src.market_data import MarketDataAPI
 from src.models import Order, OrderResult, OrderSide, OrderType, Quote
 from src.notifications import AlertManager
 from src.strategy import BaseStrategy
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger("kis_trader.strategy.momentum")
 
+LIQUIDATION_CUTOFF = (15, 15)  # 이 시각 이후 전량 청산 후 거래 중지 (실거래 모드)
+
 # 시가총액 상위 30종목 (하드코딩)
 DEFAULT_STATIC_WATCHLIST = [
     "005930",  # 삼성전자
@@ -65,7 +69,7 @@ DEFAULT_INVERSE_ETFS = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MomentumScalpConfig:
     """모멘텀 스캘핑 전략 설정."""
 
@@ -125,7 +129,7 @@ class MomentumScalpConfig:
     inverse_min_momentum: float = 1.5        # 인버스 매수 최소 모멘텀 점수
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionState:
     """보유 포지션 상태."""
     symbol: str
@@ -142,7 +146,7 @@ class PositionState:
             self.high_since_buy = self.buy_price
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyPnL:
     """일일 손익 추적."""
     realized_gross_pnl: int = 0
@@ -161,6 +165,31 @@ class DailyPnL:
         return self.realized_net_pnl
 
 
+def _kospi_regime(closes: "np.ndarray") -> Optional[Tuple[int, float, float, float]]:
+    """오래된 순 KOSPI 종가로 (약세 점수, 현재가, MA20, MA5)를 구한다. 20일 미만이면 None."""
+    if len(closes) < 20:
+        return None
+
+    score = 0
+
+    # 1. KOSPI < MA20: 중기 하락 추세
+    ma20 = float(closes[-20:].mean())
+    current = float(closes[-1])
+    if current < ma20:
+        score += 1
+
+    # 2. MA5 < MA20: 단기 데드크로스
+    ma5 = float(closes[-5:].mean())
+    if ma5 < ma20:
+        score += 1
+
+    # 3. 3일 연속 하락
+    if (closes[-3:] < closes[-4:-1]).all():
+        score += 1
+
+    return score, current, ma20, ma5
+
+
 class MomentumScalpStrategy(BaseStrategy):
     """모멘텀 스캘핑 전략."""
 
@@ -181,10 +210,16 @@ class MomentumScalpStrategy(BaseStrategy):
         self._halted = False
         self._avg_volumes: Dict[str, int] = {}
         self._quotes_cache: Dict[str, Quote] = {}
-        self._sell_cooldown: Dict[str, datetime] = {}
+        self._sell_cooldown: Dict[str, float] = {}  # 종목 → 매도 체결 시각 (time.monotonic)
         self._bear_score: int = 0
         self._bear_market = False
-        self._inverse_symbols: set = set(self.cfg.inverse_etfs)
+        self._regime_day: Optional[date] = None  # 시장 레짐을 마지막으로 계산한 날짜
+        self._inverse_symbols: frozenset = frozenset(self.cfg.inverse_etfs)
+        self._inverse_max_hold = timedelta(minutes=self.cfg.inverse_max_hold_minutes)
+        # 풀 갱신마다 쓰는 고정 종목(정적 관심종목 + 인버스). 순서를 유지해 풀 구성이 실행마다 같게 한다.
+        self._static_pool_base: Tuple[str, ...] = tuple(dict.fromkeys(
+            self.cfg.static_watchlist + (self.cfg.inverse_etfs if self.cfg.inverse_enabled else [])
+        ))
         self._halt_date: Optional[date] = None
         self._current_day: Optional[date] = None
         self._alerts = AlertManager()
@@ -235,29 +270,8 @@ class MomentumScalpStrategy(BaseStrategy):
         return self._pool
 
     def on_tick(self, quote: Quote) -> List[Order]:
-        self._quotes_cache[quote.symbol] = quote
-        orders = []
-
-        if self._halted:
-            return orders
-
-        if quote.symbol in self.positions:
-            order = self._evaluate_sell(quote)
-            if order:
-                orders.append(order)
-            else:
-                scale_in = self._evaluate_buy(quote)
-                if scale_in:
-                    orders.append(scale_in)
-
-        else:
-            long_count = sum(1 for s in self.positions if s not in self._inverse_symbols)
-            if long_count < self.cfg.max_position_count:
-                order = self._evaluate_buy(quote)
-                if order:
-                    orders.append(order)
-
-        return orders
+        """단일 시세도 배치 경로로 처리해 장마감/서킷 브레이커/인버스 규칙을 똑같이 적용한다."""
+        return self.on_batch_tick([quote])
 
     def on_batch_tick(self, quotes: List[Quote]) -> List[Order]:
         """배치 시세를 받아 전체적으로 판단한다."""
@@ -268,17 +282,26 @@ class MomentumScalpStrategy(BaseStrategy):
         if self._halted:
             return []
 
-        # 미실현 손익 업데이트 + 고가 추적
+        # 배치 안의 시각 판단(장마감, 중지일, 인버스 보유시간)은 한 번 읽은 시각을 공유한다
+        now = datetime.now()
+
+        # 고가 추적 + 미실현 순손익 추정(보조 손실컷용)을 보유 종목 한 번 순회로 처리한다
+        quote_get = self._quotes_cache.get
+        track_unrealized = self.cfg.enable_unrealized_loss_guard
+        unrealized_net = 0
         for sym, pos in self.positions.items():
-            q = self._quotes_cache.get(sym)
-            if q:
-                if q.current_price > pos.high_since_buy:
-                    pos.high_since_buy = q.current_price
+            q = quote_get(sym)
+            if q is None:
+                continue
+            price = q.current_price
+            if price > pos.high_since_buy:
+                pos.high_since_buy = price
+            if track_unrealized and price > 0:
+                unrealized_net += self._exit_net_pnl(pos, price)
 
         # 장마감 청산 (15:15 이후) — 반드시 halt 설정 (실거래 모드만)
         if self.market_data is not None:
-            now = datetime.now()
-            if now.hour >= 15 and now.minute >= 15:
+            if (now.hour, now.minute) >= LIQUIDATION_CUTOFF:
                 self._halted = True
                 self._halt_date = now.date()
                 if self.positions:
@@ -309,7 +332,7 @@ class MomentumScalpStrategy(BaseStrategy):
                 cooldown_seconds=1800,
             )
             self._halted = True
-            self._halt_date = datetime.now().date()
+            self._halt_date = now.date()
             return self._liquidate_all()
 
         if realized_net >= self.cfg.daily_profit_target:
@@ -325,7 +348,7 @@ class MomentumScalpStrategy(BaseStrategy):
                 cooldown_seconds=1800,
             )
             self._halted = True
-            self._halt_date = datetime.now().date()
+            self._halt_date = now.date()
             return self._liquidate_all()
 
         # 보조 손실컷: 순손익 추정(순실현 + 미실현 추정) 기준
@@ -335,7 +358,6 @@ class MomentumScalpStrategy(BaseStrategy):
                 if self.cfg.daily_total_loss_limit is not None
                 else self.cfg.daily_loss_limit
             )
-            unrealized_net = self._estimate_unrealized_net_pnl()
             total_net = realized_net + unrealized_net
             if total_net <= total_loss_limit:
                 logger.warning(
@@ -356,66 +378,85 @@ class MomentumScalpStrategy(BaseStrategy):
                     cooldown_seconds=1800,
                 )
                 self._halted = True
-                self._halt_date = datetime.now().date()
+                self._halt_date = now.date()
                 return self._liquidate_all()
 
         # 백테스트 모드: 배치 시세에서 약세 점수 추정
         if self.market_data is None:
             self._estimate_market_from_quotes(quotes)
 
-        # 개별 종목 평가
+        # 개별 종목 평가: 종목 루프에서 반복 참조하는 속성은 지역 변수로 묶어 둔다
         orders = []
-
-        # 1) 매도 먼저 (일반 + 인버스 모두)
-        for q in quotes:
-            if q.symbol in self.positions:
-                if q.symbol in self._inverse_symbols:
-                    order = self._evaluate_inverse_sell(q)
+        cfg = self.cfg
+        positions = self.positions
+        inverse = self._inverse_symbols
+
+        # 1) 매도 먼저 (일반 + 인버스 모두). 매도 주문을 낸 종목은 같은 배치에서 추가매수하지 않는다.
+        #    배치 대부분은 미보유 종목이므로 보유 종목 시세만 먼저 골라 평가한다.
+        selling = set()
+        if positions:
+            for q in [q for q in quotes if q.symbol in positions]:
+                if q.symbol in inverse:
+                    order = self._evaluate_inverse_sell(q, now)
                 else:
                     order = self._evaluate_sell(q)
                 if order:
                     orders.append(order)
+                    selling.add(q.symbol)
+
+        # 보유 종목은 이 배치 안에서 바뀌지 않으므로 종류별 보유 수와 보유 금액은 한 번만 구한다.
+        # 신규 매수 대기 건수와 금액(전체/종목별)은 매수 주문을 추가할 때마다 늘린다.
+        long_count, inv_count = self._position_counts()
+        total_exposure = self._get_total_exposure()
+        pending_total = 0
+        pending_by_symbol: Dict[str, int] = {}
 
         # 2) 일반 매수 (롱 포지션 카운트 기준)
+        pending_long = 0
         for q in quotes:
-            if q.symbol in self._inverse_symbols:
+            if q.symbol in inverse:
                 continue  # 인버스는 아래에서 별도 처리
-            long_count = sum(
-                1 for s in self.positions if s not in self._inverse_symbols
-            )
-            pending_long = sum(
-                1 for o in orders
-                if (
-                    o.side == OrderSide.BUY and
-                    o.symbol not in self._inverse_symbols and
-                    o.symbol not in self.positions
-                )
-            )
-            if q.symbol not in self.positions and long_count + pending_long >= self.cfg.max_position_count:
+            if q.symbol in selling:
+                continue
+            is_new = q.symbol not in positions
+            if is_new and long_count + pending_long >= cfg.max_position_count:
                 continue
 
-            order = self._evaluate_buy(q, pending_orders=orders)
+            order = self._evaluate_buy(
+                q,
+                total_exposure=total_exposure,
+                pending_total=pending_total,
+                pending_stock=pending_by_symbol.get(q.symbol, 0),
+            )
             if order:
                 orders.append(order)
+                amount = q.current_price * order.quantity
+                pending_total += amount
+                pending_by_symbol[q.symbol] = pending_by_symbol.get(q.symbol, 0) + amount
+                if is_new:
+                    pending_long += 1
 
         # 3) 인버스 매수 (인버스 포지션 카운트 기준)
-        if self.cfg.inverse_enabled and self._bear_score >= self.cfg.bearish_threshold:
+        if cfg.inverse_enabled and self._bear_score >= cfg.bearish_threshold:
+            pending_inv = 0
             for q in quotes:
-                if q.symbol not in self._inverse_symbols:
+                if q.symbol not in inverse:
                     continue
-                inv_count = sum(
-                    1 for s in self.positions if s in self._inverse_symbols
-                )
-                pending_inv = sum(
-                    1 for o in orders
-                    if o.side == OrderSide.BUY and o.symbol in self._inverse_symbols
-                )
-                if inv_count + pending_inv >= self.cfg.inverse_max_positions:
+                if inv_count + pending_inv >= cfg.inverse_max_positions:
                     break
-                if q.symbol not in self.positions:
-                    order = self._evaluate_inverse_buy(q, pending_orders=orders)
+                if q.symbol not in positions:
+                    order = self._evaluate_inverse_buy(
+                        q,
+                        total_exposure=total_exposure,
+                        pending_total=pending_total,
+                        pending_stock=pending_by_symbol.get(q.symbol, 0),
+                    )
                     if order:
                         orders.append(order)
+                        amount = q.current_price * order.quantity
+                        pending_total += amount
+                        pending_by_symbol[q.symbol] = pending_by_symbol.get(q.symbol, 0) + amount
+                        pending_inv += 1
 
         return orders
 
@@ -447,16 +488,17 @@ class MomentumScalpStrategy(BaseStrategy):
                 existing.buy_price = int(round(total_invested / total_qty))
                 if fill_price > existing.high_since_buy:
                     existing.high_since_buy = fill_price
-                tag = "[INV] " if result.symbol in self._inverse_symbols else ""
-                logger.info(
-                    "%s추가매수 체결: %s +%d주 @ %s원 (평단 %s원, 총 %d주)",
-                    tag,
-                    result.symbol,
-                    result.quantity,
-                    f"{fill_price:,}",
-                    f"{existing.buy_price:,}",
-                    existing.quantity,
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    tag = "[INV] " if result.symbol in self._inverse_symbols else ""
+                    logger.info(
+                        "%s추가매수 체결: %s +%d주 @ %s원 (평단 %s원, 총 %d주)",
+                        tag,
+                        result.symbol,
+                        result.quantity,
+                        f"{fill_price:,}",
+                        f"{existing.buy_price:,}",
+                        existing.quantity,
+                    )
                 return
 
             self.positions[result.symbol] = PositionState(
@@ -465,9 +507,10 @@ class MomentumScalpStrategy(BaseStrategy):
                 quantity=result.quantity,
                 invested_amount=fill_price * result.quantity,
             )
-            tag = "[INV] " if result.symbol in self._inverse_symbols else ""
-            logger.info("%s매수 체결: %s %d주 @ %s원",
-                        tag, result.symbol, result.quantity, f"{fill_price:,}")
+            if logger.isEnabledFor(logging.INFO):
+                tag = "[INV] " if result.symbol in self._inverse_symbols else ""
+                logger.info("%s매수 체결: %s %d주 @ %s원",
+                            tag, result.symbol, result.quantity, f"{fill_price:,}")
 
         elif result.side == OrderSide.SELL:
             if not result.success:
@@ -501,15 +544,16 @@ class MomentumScalpStrategy(BaseStrategy):
                 self.daily_pnl.taxes_paid += sell_tax_slippage
                 self.daily_pnl.trade_count += 1
 
-                self._sell_cooldown[result.symbol] = datetime.now()
+                self._sell_cooldown[result.symbol] = time.monotonic()
 
-                tag = "[INV] " if result.symbol in self._inverse_symbols else ""
-                logger.info(
-                    "%s매도 체결: %s %d주 @ %s원 "
-                    "(총손익: %s원, 순손익: %s원, 누적순손익: %s원)",
-                    tag, result.symbol, result.quantity, f"{sell_price:,}",
-                    f"{gross_pnl:,}", f"{net_pnl:,}", f"{self.daily_pnl.realized_net_pnl:,}",
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    tag = "[INV] " if result.symbol in self._inverse_symbols else ""
+                    logger.info(
+                        "%s매도 체결: %s %d주 @ %s원 "
+                        "(총손익: %s원, 순손익: %s원, 누적순손익: %s원)",
+                        tag, result.symbol, result.quantity, f"{sell_price:,}",
+                        f"{gross_pnl:,}", f"{net_pnl:,}", f"{self.daily_pnl.realized_net_pnl:,}",
+                    )
 
     def should_continue(self) -> bool:
         if self._halted and not self.positions:
@@ -520,8 +564,6 @@ class MomentumScalpStrategy(BaseStrategy):
 
     def _build_pool(self):
         """종목 풀을 구성한다."""
-        pool = set(self.cfg.static_watchlist)
-
         if self._pool_override:
             self._pool = list(self._pool_override)
             # 인버스 ETF가 override에 없으면 추가
@@ -532,10 +574,8 @@ class MomentumScalpStrategy(BaseStrategy):
             self._last_pool_refresh = datetime.now()
             return
 
-        # 인버스 ETF 추가
-        if self.cfg.inverse_enabled:
-            for sym in self.cfg.inverse_etfs:
-                pool.add(sym)
+        # 정적 관심종목 + 인버스 ETF 뒤에 등락률 상위 종목을 순서대로 붙인다 (dict = 순서 있는 집합)
+        pool = dict.fromkeys(self._static_pool_base)
 
         if self.market_data:
             try:
@@ -547,7 +587,7 @@ class MomentumScalpStrategy(BaseStrategy):
                     min_volume=self.cfg.min_volume,
                 )
                 for item in rising:
-                    pool.add(item.symbol)
+                    pool[item.symbol] = None
                 logger.info("동적 풀 갱신: 등락률 상위 %d개 추가 (총 %d종목)",
                             len(rising), len(pool))
             except Exception as e:
@@ -557,70 +597,59 @@ class MomentumScalpStrategy(BaseStrategy):
         self._last_pool_refresh = datetime.now()
 
     def _check_market_regime(self):
-        """KOSPI 기반 약세 점수(0~3)를 계산한다."""
-        if not self.market_data:
-            self._bear_score = 0
-            self._bear_market = False
-            return
-
-        try:
-            end_date = datetime.now().strftime("%Y%m%d")
-            start_date = (datetime.now() - timedelta(days=45)).strftime("%Y%m%d")
+        """KOSPI 기반 약세 점수(0~3)를 계산한다.
 
-            df = self.market_data.get_index_daily_prices("0001", start_date, end_date)
-            if df.empty or len(df) < 20:
-                self._bear_score = 0
-                self._bear_market = False
-                return
-
-            closes = pd.to_numeric(df["bstp_nmix_prpr"], errors="coerce").dropna()
-            if len(closes) < 20:
-                self._bear_score = 0
-                self._bear_market = False
+        일봉 MA 기반이라 장중에는 바뀌지 않으므로 하루 한 번만 조회한다
+        (세션 재시작으로 initialize()가 다시 불려도 같은 날이면 재사용).
+        """
+        regime = None
+        if self.market_data:
+            now = datetime.now()
+            if self._regime_day == now.date():
                 return
+            try:
+                end_date = now.strftime("%Y%m%d")
+                start_date = (now - timedelta(days=45)).strftime("%Y%m%d")
+                closes = self.market_data.get_index_daily_closes("0001", start_date, end_date)
+                regime = _kospi_regime(closes)
+            except Exception as e:
+                logger.warning("시장 레짐 확인 실패: %s", e)
 
-            score = 0
-
-            # 1. KOSPI < MA20: 중기 하락 추세
-            ma20 = closes.tail(20).mean()
-            current = closes.iloc[-1]
-            if current < ma20:
-                score += 1
-
-            # 2. MA5 < MA20: 단기 데드크로스
-            ma5 = closes.tail(5).mean()
-            if ma5 < ma20:
-                score += 1
-
-            # 3. 3일 연속 하락
-            if len(closes) >= 4:
-                last3 = closes.iloc[-3:]
-                prev3 = closes.iloc[-4:-1]
-                if all(c < p for c, p in zip(last3, prev3)):
-                    score += 1
-
-            self._bear_score = score
-            self._bear_market = score >= 1
-
-            logger.info("시장 레짐: 약세점수=%d (KOSPI: %.1f, MA20: %.1f, MA5: %.1f)",
-                        score, current, ma20, ma5)
-        except Exception as e:
-            logger.warning("시장 레짐 확인 실패: %s", e)
+        if regime is None:
             self._bear_score = 0
             self._bear_market = False
+            return
+
+        score, current, ma20, ma5 = regime
+        self._bear_score = score
+        self._bear_market = score >= 1
+        self._regime_day = now.date()
+
+        logger.info("시장 레짐: 약세점수=%d (KOSPI: %.1f, MA20: %.1f, MA5: %.1f)",
+                    score, current, ma20, ma5)
 
     def _estimate_market_from_quotes(self, quotes: List[Quote]):
         """배치 시세에서 약세 점수를 추정한다 (백테스트용).
 
         인버스 ETF를 제외한 일반 종목의 등락률로 판단.
         """
-        regular_quotes = [q for q in quotes if q.symbol not in self._inverse_symbols]
-        if not regular_quotes:
+        # 종목 수가 수십 개라 배열을 만드는 것보다 한 번 순회하며 합계와 하락 수를 같이 세는 편이 빠르다
+        inverse = self._inverse_symbols
+        total = 0
+        change_sum = 0.0
+        declining = 0
+        for q in quotes:
+            if q.symbol in inverse:
+                continue
+            rate = q.change_rate
+            total += 1
+            change_sum += rate
+            if rate < 0:
+                declining += 1
+        if not total:
             return
 
-        total = len(regular_quotes)
-        avg_change = sum(q.change_rate for q in regular_quotes) / total
-        declining = sum(1 for q in regular_quotes if q.change_rate < 0)
+        avg_change = change_sum / total
         decline_ratio = declining / total
 
         score = 0
@@ -638,149 +667,163 @@ class MomentumScalpStrategy(BaseStrategy):
         self._bear_score = score
         self._bear_market = score >= 1
 
-    def _evaluate_buy(self, quote: Quote, pending_orders: Optional[List[Order]] = None) -> Optional[Order]:
+    def _evaluate_buy(
+        self,
+        quote: Quote,
+        total_exposure: Optional[int] = None,
+        pending_total: int = 0,
+        pending_stock: int = 0,
+    ) -> Optional[Order]:
         """모멘텀 점수 기반 매수 판단 (일반 주식)."""
+        symbol = quote.symbol
+        price = quote.current_price
+        cfg = self.cfg
+
         # 인버스 ETF는 별도 로직
-        if quote.symbol in self._inverse_symbols:
+        if symbol in self._inverse_symbols:
             return None
 
-        if quote.current_price <= 0 or quote.open_price <= 0:
+        if price <= 0 or quote.open_price <= 0:
             return None
-        if quote.current_price < self.cfg.min_price:
+        if price < cfg.min_price:
             return None
 
-        # 쿨다운 체크
-        last_sold = self._sell_cooldown.get(quote.symbol)
-        if last_sold:
-            elapsed = (datetime.now() - last_sold).total_seconds()
-            if elapsed < self.cfg.cooldown_seconds:
-                return None
+        if self._in_cooldown(symbol):
+            return None
 
-        position = self.positions.get(quote.symbol)
+        position = self.positions.get(symbol)
         is_scale_in = position is not None
 
         # 약세장 보수 모드(B): 신규 롱 진입 금지
-        if not is_scale_in and self._bear_market and self.cfg.bear_market_mode == 'B':
+        if not is_scale_in and self._bear_market and cfg.bear_market_mode == 'B':
             return None
 
         score = self._calc_momentum_score(quote)
         if is_scale_in:
-            if not self.cfg.enable_pyramiding:
+            if not cfg.enable_pyramiding:
                 return None
-            pnl_pct = (quote.current_price - position.buy_price) / position.buy_price * 100
-            if pnl_pct < self.cfg.scale_in_min_profit_pct:
+            pnl_pct = (price - position.buy_price) / position.buy_price * 100
+            if pnl_pct < cfg.scale_in_min_profit_pct:
                 return None
-            if score < (self.cfg.min_momentum_score + self.cfg.scale_in_score_bonus):
+            if score < (cfg.min_momentum_score + cfg.scale_in_score_bonus):
                 return None
         else:
-            if score < self.cfg.min_momentum_score:
+            if score < cfg.min_momentum_score:
                 return None
 
         alloc = self._compute_buy_allocation(
-            symbol=quote.symbol,
-            current_price=quote.current_price,
-            pending_orders=pending_orders,
+            symbol=symbol,
+            current_price=price,
+            total_exposure=total_exposure,
+            pending_total=pending_total,
+            pending_stock=pending_stock,
         )
-        quantity = alloc // quote.current_price
+        quantity = alloc // price
 
         if quantity <= 0:
             return None
 
-        if is_scale_in:
-            logger.info(
-                "추가매수 신호: %s(%s) 점수=%.1f, %d주 @ %s원 (할당 %s원)",
-                quote.name,
-                quote.symbol,
-                score,
-                quantity,
-                f"{quote.current_price:,}",
-                f"{alloc:,}",
-            )
-        else:
+        # 금액 포맷(f-string)은 로그 레벨과 무관하게 먼저 만들어지므로 INFO가 꺼져 있으면 건너뛴다
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "매수 신호: %s(%s) 점수=%.1f, %d주 @ %s원 (할당 %s원)",
+                "%s 신호: %s(%s) 점수=%.1f, %d주 @ %s원 (할당 %s원)",
+                "추가매수" if is_scale_in else "매수",
                 quote.name,
-                quote.symbol,
+                symbol,
                 score,
                 quantity,
-                f"{quote.current_price:,}",
+                f"{price:,}",
                 f"{alloc:,}",
             )
 
         return Order(
-            symbol=quote.symbol,
+            symbol=symbol,
             side=OrderSide.BUY,
             order_type=OrderType.MARKET,
             quantity=quantity,
             price=0,
         )
 
-    def _evaluate_inverse_buy(self, quote: Quote, pending_orders: Optional[List[Order]] = None) -> Optional[Order]:
+    def _evaluate_inverse_buy(
+        self,
+        quote: Quote,
+        total_exposure: Optional[int] = None,
+        pending_total: int = 0,
+        pending_stock: int = 0,
+    ) -> Optional[Order]:
         """인버스 ETF 매수 판단.
 
         약세 점수 >= bearish_threshold일 때만 진입.
         인버스 ETF는 시장 하락 시 상승하므로 모멘텀 점수가 자연스럽게 높아진다.
         """
-        if quote.current_price <= 0 or quote.open_price <= 0:
+        symbol = quote.symbol
+        price = quote.current_price
+        cfg = self.cfg
+
+        if price <= 0 or quote.open_price <= 0:
             return None
 
-        if self._bear_score < self.cfg.bearish_threshold:
+        if self._bear_score < cfg.bearish_threshold:
             return None
 
-        # 쿨다운 체크
-        last_sold = self._sell_cooldown.get(quote.symbol)
-        if last_sold:
-            elapsed = (datetime.now() - last_sold).total_seconds()
-            if elapsed < self.cfg.cooldown_seconds:
-                return None
+        if self._in_cooldown(symbol):
+            return None
 
         # 모멘텀 점수 (인버스도 상승 중이어야 진입)
         score = self._calc_momentum_score(quote)
-        if score < self.cfg.inverse_min_momentum:
+        if score < cfg.inverse_min_momentum:
             return None
 
         alloc = self._compute_buy_allocation(
-            symbol=quote.symbol,
-            current_price=quote.current_price,
-            pending_orders=pending_orders,
+            symbol=symbol,
+            current_price=price,
+            total_exposure=total_exposure,
+            pending_total=pending_total,
+            pending_stock=pending_stock,
         )
-        quantity = alloc // quote.current_price
+        quantity = alloc // price
         if quantity <= 0:
             return None
 
-        logger.info("[INV] 매수 신호: %s 약세점수=%d, 모멘텀=%.1f, %d주 @ %s원",
-                     quote.symbol, self._bear_score, score, quantity,
-                     f"{quote.current_price:,}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[INV] 매수 신호: %s 약세점수=%d, 모멘텀=%.1f, %d주 @ %s원",
+                        symbol, self._bear_score, score, quantity, f"{price:,}")
 
         return Order(
-            symbol=quote.symbol,
+            symbol=symbol,
             side=OrderSide.BUY,
             order_type=OrderType.MARKET,
             quantity=quantity,
             price=0,
         )
 
+    def _position_counts(self) -> Tuple[int, int]:
+        """(일반 보유 종목 수, 인버스 보유 종목 수). 교집합 크기는 C 레벨 집합 연산으로 센다."""
+        inv_count = len(self.positions.keys() & self._inverse_symbols)
+        return len(self.positions) - inv_count, inv_count
+
+    def _in_cooldown(self, symbol: str) -> bool:
+        """매도 직후 재매수 쿨다운 중인지 확인한다. 틱마다 불리므로 datetime 대신 monotonic 초를 쓴다."""
+        last_sold = self._sell_cooldown.get(symbol)
+        return last_sold is not None and time.monotonic() - last_sold < self.cfg.cooldown_seconds
+
     def _compute_buy_allocation(
         self,
         symbol: str,
         current_price: int,
-        pending_orders: Optional[List[Order]] = None,
+        total_exposure: Optional[int] = None,
+        pending_total: int = 0,
+        pending_stock: int = 0,
     ) -> int:
-        total_exposure = self._get_total_exposure()
-        stock_exposure = self._get_stock_exposure(symbol)
+        """신규/추가 매수 금액을 정한다.
 
-        pending_total = 0
-        pending_stock = 0
-        for order in pending_orders or []:
-            if order.side != OrderSide.BUY:
-                continue
-            q = self._quotes_cache.get(order.symbol)
-            if q is None or q.current_price <= 0:
-                continue
-            amount = q.current_price * order.quantity
-            pending_total += amount
-            if order.symbol == symbol:
-                pending_stock += amount
+        total_exposure는 현재 보유 금액 합계로, 배치 처리처럼 같은 보유 상태에서 여러 종목을
+        평가할 때는 호출자가 한 번 구해 넘긴다. 생략하면 포지션을 합산한다.
+        pending_total/pending_stock은 같은 배치에서 이미 낸 매수 주문 금액(전체/해당 종목)이다.
+        """
+        if total_exposure is None:
+            total_exposure = self._get_total_exposure()
+        stock_exposure = self._get_stock_exposure(symbol)
 
         total_room = self.cfg.seed_money - (total_exposure + pending_total)
         stock_room = self.cfg.max_per_stock_amount - (stock_exposure + pending_stock)
@@ -804,34 +847,41 @@ class MomentumScalpStrategy(BaseStrategy):
         if not pos:
             return None
 
-        pnl_pct = (quote.current_price - pos.buy_price) / pos.buy_price * 100
-        pnl_amount = (quote.current_price - pos.buy_price) * pos.quantity
+        # 매 틱 호출되므로 가격 차이는 한 번만 구하고, 천 단위 포맷은 로그가 켜졌을 때만 만든다
+        cfg = self.cfg
+        price = quote.current_price
+        diff = price - pos.buy_price
+        pnl_pct = diff / pos.buy_price * 100
+        pnl_amount = diff * pos.quantity
 
         # 익절
-        if pnl_pct >= self.cfg.take_profit_pct:
-            logger.info("익절: %s %.2f%% (%s원)",
-                        quote.symbol, pnl_pct, f"{pnl_amount:,}")
+        if pnl_pct >= cfg.take_profit_pct:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("익절: %s %.2f%% (%s원)",
+                            quote.symbol, pnl_pct, f"{pnl_amount:,}")
             return self._make_sell_order(pos)
 
         # 개별 포지션 손절 (금액 기준)
-        if pnl_amount <= self.cfg.per_position_stop_loss:
-            logger.info("개별손절: %s %s원 (한도 %s원)",
-                        quote.symbol, f"{pnl_amount:,}",
-                        f"{self.cfg.per_position_stop_loss:,}")
+        if pnl_amount <= cfg.per_position_stop_loss:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("개별손절: %s %s원 (한도 %s원)",
+                            quote.symbol, f"{pnl_amount:,}",
+                            f"{cfg.per_position_stop_loss:,}")
             return self._make_sell_order(pos)
 
         # 추적손절 (고점 대비)
-        if pos.high_since_buy > pos.buy_price:
-            drop_from_high = (quote.current_price - pos.high_since_buy) / pos.high_since_buy * 100
-            if drop_from_high <= self.cfg.trailing_stop_pct:
-                logger.info("추적손절: %s 고점 %s → 현재 %s (%.2f%%)",
-                            quote.symbol, f"{pos.high_since_buy:,}",
-                            f"{quote.current_price:,}", drop_from_high)
+        high = pos.high_since_buy
+        if high > pos.buy_price:
+            drop_from_high = (price - high) / high * 100
+            if drop_from_high <= cfg.trailing_stop_pct:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("추적손절: %s 고점 %s → 현재 %s (%.2f%%)",
+                                quote.symbol, f"{high:,}", f"{price:,}", drop_from_high)
                 return self._make_sell_order(pos)
 
         return None
 
-    def _evaluate_inverse_sell(self, quote: Quote) -> Optional[Order]:
+    def _evaluate_inverse_sell(self, quote: Quote, now: Optional[datetime] = None) -> Optional[Order]:
         """인버스 ETF 매도 판단 (타이트한 리스크 관리).
 
         인버스 ETF는 음의 복리 위험이 있으므로:
@@ -843,37 +893,42 @@ class MomentumScalpStrategy(BaseStrategy):
         if not pos:
             return None
 
-        pnl_pct = (quote.current_price - pos.buy_price) / pos.buy_price * 100
+        cfg = self.cfg
+        price = quote.current_price
+        pnl_pct = (price - pos.buy_price) / pos.buy_price * 100
 
         # 1. 익절 (+1.0%, 일반 +1.5%보다 빠르게)
-        if pnl_pct >= self.cfg.inverse_take_profit_pct:
+        if pnl_pct >= cfg.inverse_take_profit_pct:
             logger.info("[INV] 익절: %s %.2f%%", quote.symbol, pnl_pct)
             return self._make_sell_order(pos)
 
         # 2. 손절 (-0.5%, 타이트)
-        if pnl_pct <= self.cfg.inverse_stop_loss_pct:
+        if pnl_pct <= cfg.inverse_stop_loss_pct:
             logger.info("[INV] 손절: %s %.2f%%", quote.symbol, pnl_pct)
             return self._make_sell_order(pos)
 
-        # 3. 시간 초과 청산 (음의 복리 방지, 실거래 모드만)
-        if self.market_data is not None:
-            hold_minutes = (datetime.now() - pos.buy_time).total_seconds() / 60
-            if hold_minutes >= self.cfg.inverse_max_hold_minutes:
-                logger.info("[INV] 시간초과 청산: %s (%.0f분 보유)", quote.symbol, hold_minutes)
-                return self._make_sell_order(pos)
-
-        # 4. 시장 반등 청산 (약세 점수가 임계 미만으로 떨어지면)
-        if self._bear_score < self.cfg.bearish_threshold:
+        # 3. 시장 반등 청산 (약세 점수가 임계 미만으로 떨어지면)
+        #    정수 비교라 시계를 읽는 시간 초과 판정보다 먼저 본다 (어느 쪽이든 결과는 청산)
+        if self._bear_score < cfg.bearish_threshold:
             logger.info("[INV] 시장반등 청산: %s (약세점수: %d)", quote.symbol, self._bear_score)
             return self._make_sell_order(pos)
 
+        # 4. 시간 초과 청산 (음의 복리 방지, 실거래 모드만)
+        if self.market_data is not None:
+            held = (now or datetime.now()) - pos.buy_time
+            if held >= self._inverse_max_hold:
+                logger.info("[INV] 시간초과 청산: %s (%.0f분 보유)",
+                            quote.symbol, held.total_seconds() / 60)
+                return self._make_sell_order(pos)
+
         # 5. 추적손절 (고점 -0.3%, 일반 -0.7%보다 타이트)
-        if pos.high_since_buy > pos.buy_price:
-            drop_from_high = (quote.current_price - pos.high_since_buy) / pos.high_since_buy * 100
-            if drop_from_high <= self.cfg.inverse_trailing_stop_pct:
-                logger.info("[INV] 추적손절: %s 고점 %s → 현재 %s (%.2f%%)",
-                            quote.symbol, f"{pos.high_since_buy:,}",
-                            f"{quote.current_price:,}", drop_from_high)
+        high = pos.high_since_buy
+        if high > pos.buy_price:
+            drop_from_high = (price - high) / high * 100
+            if drop_from_high <= cfg.inverse_trailing_stop_pct:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[INV] 추적손절: %s 고점 %s → 현재 %s (%.2f%%)",
+                                quote.symbol, f"{high:,}", f"{price:,}", drop_from_high)
                 return self._make_sell_order(pos)
 
         return None
@@ -881,10 +936,14 @@ class MomentumScalpStrategy(BaseStrategy):
     def _calc_momentum_score(self, quote: Quote) -> float:
         """모멘텀 점수를 계산한다 (0~5)."""
         score = 0.0
+        price = quote.current_price
+        open_price = quote.open_price
+        change_rate = quote.change_rate
+        low = quote.low_price
 
         # 1. 시가 대비 상승폭 (0~1.5)
-        if quote.open_price > 0:
-            vs_open = (quote.current_price - quote.open_price) / quote.open_price * 100
+        if open_price > 0:
+            vs_open = (price - open_price) / open_price * 100
             if vs_open >= 2.0:
                 score += 1.5
             elif vs_open >= 1.0:
@@ -893,17 +952,17 @@ class MomentumScalpStrategy(BaseStrategy):
                 score += 0.5
 
         # 2. 전일 대비 등락률 (0~1.0)
-        if quote.change_rate >= 2.0:
+        if change_rate >= 2.0:
             score += 1.0
-        elif quote.change_rate >= 1.0:
+        elif change_rate >= 1.0:
             score += 0.6
-        elif quote.change_rate >= 0.5:
+        elif change_rate >= 0.5:
             score += 0.3
 
         # 3. 고가 근접도 (0~1.0)
-        price_range = quote.high_price - quote.low_price
+        price_range = quote.high_price - low
         if price_range > 0:
-            proximity = (quote.current_price - quote.low_price) / price_range
+            proximity = (price - low) / price_range
             if proximity >= 0.9:
                 score += 1.0
             elif proximity >= 0.7:
@@ -941,20 +1000,20 @@ class MomentumScalpStrategy(BaseStrategy):
             return 0
         return int(round(sell_notional * self.cfg.tax_slippage_rate))
 
-    def _estimate_unrealized_net_pnl(self) -> int:
-        total = 0
-        for sym, pos in self.positions.items():
-            q = self._quotes_cache.get(sym)
-            if not q or q.current_price <= 0:
-                continue
-            gross = (q.current_price - pos.buy_price) * pos.quantity
-            sell_notional = q.current_price * pos.quantity
-            exit_cost = (
-                self._calc_commission_cost(sell_notional) +
-                self._calc_sell_tax_slippage_cost(sell_notional)
-            )
-            total += (gross - exit_cost)
-        return total
+    def _exit_net_pnl(self, pos: PositionState, price: int) -> int:
+        """현재가로 전량 매도했을 때의 추정 순손익 (매도 수수료/세금/슬리피지 차감).
+
+        보유 종목마다 매 배치 불리므로 비용 계산을 인라인한다. 체결 시 정산(on_order_filled)과
+        같은 값이 나오도록 수수료와 세금/슬리피지는 합치지 않고 각각 반올림한다.
+        """
+        cfg = self.cfg
+        gross = (price - pos.buy_price) * pos.quantity
+        sell_notional = price * pos.quantity
+        exit_cost = (
+            int(round(sell_notional * cfg.commission_rate)) +
+            int(round(sell_notional * cfg.tax_slippage_rate))
+        )
+        return gross - exit_cost
 
     def _liquidate_all(self) -> List[Order]:
         """전 포지션 청산 (일반 + 인버스 모두)."""
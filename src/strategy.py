@@ -16,6 +16,15 @@ class BaseStrategy(ABC):
         """전략 초기화. 봇 시작 시 1회 호출된다."""
         pass
 
+    def daily_reset(self):
+        """거래일이 바뀔 때 호출된다 (백테스트에서는 매 거래일 시작 시).
+
+        기본 구현은 initialize()를 다시 호출한다. 일별 상태가 큰 전략은 버퍼를
+        __init__에서 미리 할당해 두고, 이 메서드에서 새로 만들지 않고 값만
+        초기화하도록 오버라이드하면 된다.
+        """
+        self.initialize()
+
     @abstractmethod
     def get_watchlist(self) -> List[str]:
         """감시할 종목코드 리스트를 반환한다."""
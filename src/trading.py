@@ -1,59 +1,206 @@
 import logging
+import random
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from src.api_client import KISClient
+from src.api_client import APIResponse, KISClient
 from src.models import Order, OrderResult, OrderSide, OrderType
 
 logger = logging.getLogger("kis_trader.orders")
 
+# 주문 직후 체결 조회 재시도: 대부분 첫 재조회에서 잡히므로 짧게 시작해 두 배씩 늘린다.
+# 기본값 기준 최대 대기는 0.05+0.1+0.2+0.4초(+지터 25%)로, 이전 고정 0.2초×5회보다 짧다.
+FILL_POLL_ATTEMPTS = 5
+FILL_POLL_INITIAL_DELAY = 0.05
+FILL_POLL_BACKOFF = 2.0
+FILL_POLL_MAX_DELAY = 0.8
+
+# 동시에 낸 주문들이 당일 전체 체결내역 조회 결과를 함께 쓰는 시간(초)
+FILL_CACHE_TTL = 0.5
+
+# 매수/매도별 주문 TR ID (모의투자 시 api_client가 V로 자동 변환)와 체결조회 매도매수구분 코드
+_ORDER_TR_ID = {OrderSide.BUY: "TTTC0012U", OrderSide.SELL: "TTTC0011U"}
+_CCLD_SIDE_CODE = {OrderSide.BUY: "02", OrderSide.SELL: "01"}
+
+# 요청 본문/파라미터 중 호출마다 바뀌지 않는 부분 (읽기 전용 템플릿).
+# 빈 값 키는 호출 시 채우며, 키 순서는 전송 본문 순서를 그대로 따른다.
+# CANO/ACNT_PRDT_CD는 api_client가 자동 주입한다.
+_ORDER_BODY = MappingProxyType({
+    "CANO": "",
+    "ACNT_PRDT_CD": "",
+    "PDNO": "",
+    "ORD_DVSN": "",
+    "ORD_QTY": "",
+    "ORD_UNPR": "",
+    "EXCG_ID_DVSN_CD": "KRX",
+    "SLL_TYPE": "",
+    "CNDT_PRIC": "",
+})
+
+_REVISE_CANCEL_BODY = MappingProxyType({
+    "CANO": "",
+    "ACNT_PRDT_CD": "",
+    "KRX_FWDG_ORD_ORGNO": "",
+    "ORGN_ODNO": "",
+    "ORD_DVSN": "",
+    "RVSE_CNCL_DVSN_CD": "",
+    "ORD_QTY": "",
+    "ORD_UNPR": "",
+    "QTY_ALL_ORD_YN": "",
+    "EXCG_ID_DVSN_CD": "KRX",
+})
+
+_DAILY_CCLD_PARAMS = MappingProxyType({
+    "CANO": "",
+    "ACNT_PRDT_CD": "",
+    "INQR_STRT_DT": "",
+    "INQR_END_DT": "",
+    "SLL_BUY_DVSN_CD": "",
+    "PDNO": "",
+    "CCLD_DVSN": "00",
+    "INQR_DVSN": "00",
+    "INQR_DVSN_3": "00",
+    "ORD_GNO_BRNO": "",
+    "ODNO": "",
+    "INQR_DVSN_1": "",
+    "CTX_AREA_FK100": "",
+    "CTX_AREA_NK100": "",
+    "EXCG_ID_DVSN_CD": "KRX",
+})
+
+# 여러 주문을 한 번에 낼 때 동시에 진행할 최대 주문 수 (호출 간격은 KISClient 레이트 리미터가 보장)
+ORDER_MAX_WORKERS = 8
+
+# place_order_async가 체결 조회를 넘기는 백그라운드 스레드 수
+FILL_MAX_WORKERS = 4
+
 
 class TradingAPI:
     """국내주식 주문 API."""
 
-    def __init__(self, client: KISClient):
+    def __init__(
+        self,
+        client: KISClient,
+        fill_poll_attempts: int = FILL_POLL_ATTEMPTS,
+        fill_poll_initial_delay: float = FILL_POLL_INITIAL_DELAY,
+        fill_poll_backoff: float = FILL_POLL_BACKOFF,
+        fill_poll_max_delay: float = FILL_POLL_MAX_DELAY,
+    ):
         self.client = client
+        self.fill_poll_attempts = max(1, fill_poll_attempts)
+        self.fill_poll_initial_delay = fill_poll_initial_delay
+        self.fill_poll_backoff = fill_poll_backoff
+        self.fill_poll_max_delay = fill_poll_max_delay
+        # 체결 조회일(오늘)과 그 YYYYMMDD 문자열. 여러 스레드가 읽으므로 튜플로 한 번에 교체한다
+        self._fill_date: Tuple[Optional[date], str] = (None, "")
+        # 최근 전체 체결내역 조회: (조회 시작 시각, 조회일, 주문번호 → 행, 다음 페이지 여부)
+        self._fill_cache: Tuple[float, str, Dict[str, Dict[str, Any]], bool] = (0.0, "", {}, False)
+        self._fill_lock = threading.Lock()
+        # shutdown()이 설정하면 진행 중인 체결 조회 대기가 즉시 끝난다
+        self._shutdown = threading.Event()
+        # 스레드는 첫 비동기 주문 때 만들어진다
+        self._fill_executor = ThreadPoolExecutor(max_workers=FILL_MAX_WORKERS, thread_name_prefix="fill")
+
+    def shutdown(self):
+        """체결 조회 대기를 중단하고 아직 시작하지 않은 비동기 체결 조회를 취소한다.
+
+        이후 동기 체결 조회는 첫 조회만 하고 끝난다. 취소됐거나 이후에 낸 비동기 주문은
+        체결 조회 없이 주문 값으로 완료된다.
+        """
+        self._shutdown.set()
+        self._fill_executor.shutdown(wait=False, cancel_futures=True)
 
     def place_order(self, order: Order) -> OrderResult:
-        """매수/매도 주문을 실행한다."""
-        # TR ID: 매수 TTTC0012U, 매도 TTTC0011U (모의투자 시 자동 V 변환)
-        if order.side == OrderSide.BUY:
-            tr_id = "TTTC0012U"
+        """매수/매도 주문을 실행한다. 체결 조회가 끝날 때까지 기다린다."""
+        res = self._send_order(order)
+        if not res.success:
+            return self._rejected_result(order, res)
+        return self._accepted_result(order, res)
+
+    def place_order_async(
+        self,
+        order: Order,
+        on_fill: Optional[Callable[[OrderResult], None]] = None,
+    ) -> "Future[OrderResult]":
+        """주문 전송까지만 기다리고 체결 조회는 백그라운드 스레드에서 진행한다.
+
+        반환된 Future는 체결 조회가 끝나면 place_order와 같은 OrderResult로 완료된다.
+        주문이 거부됐거나 shutdown() 이후라면 이미 완료된 Future를 돌려준다.
+        on_fill을 주면 결과가 나왔을 때 그 OrderResult로 호출한다.
+        """
+        future: "Future[OrderResult]" = Future()
+        future.set_running_or_notify_cancel()  # 접수된 주문의 결과는 호출자가 취소할 수 없다
+        if on_fill is not None:
+            def notify(f: "Future[OrderResult]"):
+                if f.exception() is None:
+                    on_fill(f.result())
+            future.add_done_callback(notify)
+
+        res = self._send_order(order)
+        if not res.success:
+            future.set_result(self._rejected_result(order, res))
+            return future
+
+        def complete(task: "Future[OrderResult]"):
+            if task.cancelled():
+                # shutdown()으로 취소된 체결 조회: 주문 값으로 완료한다
+                future.set_result(self._accepted_result(order, res, resolve_fill=False))
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        try:
+            task = self._fill_executor.submit(self._accepted_result, order, res)
+        except RuntimeError:
+            # shutdown() 이후에도 이미 접수된 주문 결과는 돌려준다
+            future.set_result(self._accepted_result(order, res, resolve_fill=False))
         else:
-            tr_id = "TTTC0011U"
+            task.add_done_callback(complete)
+        return future
 
+    def _send_order(self, order: Order) -> APIResponse:
+        """주문 요청을 전송한다."""
+        tr_id = _ORDER_TR_ID[order.side]
         body = {
-            "CANO": "",  # api_client가 자동 주입
-            "ACNT_PRDT_CD": "",  # api_client가 자동 주입
+            **_ORDER_BODY,
             "PDNO": order.symbol,
             "ORD_DVSN": order.order_type.value,
             "ORD_QTY": str(order.quantity),
             "ORD_UNPR": str(order.price),
-            "EXCG_ID_DVSN_CD": "KRX",
-            "SLL_TYPE": "",
-            "CNDT_PRIC": "",
         }
 
-        res = self.client.post(
+        return self.client.post(
             api_url="/uapi/domestic-stock/v1/trading/order-cash",
             tr_id=tr_id,
             body=body,
         )
 
-        if res.success:
-            output = res.output or {}
-            order_no = output.get("ODNO", "")
+    def _accepted_result(self, order: Order, res: APIResponse, resolve_fill: bool = True) -> OrderResult:
+        """접수된 주문의 체결을 조회해 결과를 만든다. 체결을 못 찾으면 주문 값을 쓴다.
+
+        지정가 주문은 바로 체결된다는 보장이 없어 기다리지 않는다 (체결 확인은 poll_fills).
+        """
+        output = res.output or {}
+        order_no = output.get("ODNO", "")
+        if not resolve_fill or order.order_type is OrderType.LIMIT:
+            fill_qty, fill_price = 0, 0
+        else:
             fill_qty, fill_price = self._resolve_fill(order, order_no)
-            result = OrderResult(
-                success=True,
-                order_no=order_no,
-                message=res.error_message,
-                symbol=order.symbol,
-                side=order.side,
-                quantity=fill_qty if fill_qty > 0 else order.quantity,
-                price=fill_price if fill_price > 0 else order.price,
-            )
+        result = OrderResult(
+            success=True,
+            order_no=order_no,
+            message=res.error_message,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=fill_qty if fill_qty > 0 else order.quantity,
+            price=fill_price if fill_price > 0 else order.price,
+        )
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "주문 성공: %s %s %s %d주 @ %s",
                 order.side.value,
@@ -62,17 +209,33 @@ class TradingAPI:
                 order.quantity,
                 order.price or "시장가",
             )
-        else:
-            result = OrderResult(
-                success=False,
-                message=f"[{res.error_code}] {res.error_message}",
-                symbol=order.symbol,
-                side=order.side,
-            )
-            logger.error("주문 실패 [%s]: %s", order.symbol, result.message)
+        return result
 
+    @staticmethod
+    def _rejected_result(order: Order, res: APIResponse) -> OrderResult:
+        result = OrderResult(
+            success=False,
+            message=f"[{res.error_code}] {res.error_message}",
+            symbol=order.symbol,
+            side=order.side,
+        )
+        logger.error("주문 실패 [%s]: %s", order.symbol, result.message)
         return result
 
+    def place_orders(self, orders: List[Order]) -> List[OrderResult]:
+        """여러 주문을 동시에 실행하고 입력 순서대로 결과를 반환한다.
+
+        주문마다 체결 조회 대기가 있어 순차 실행하면 대기 시간이 주문 수만큼 쌓인다.
+        스레드로 겹쳐 실행하되 API 호출 간격은 공유 레이트 리미터가 지킨다.
+        브로커 도착 순서는 보장하지 않으므로 순서가 중요한 주문(매도 후 매수 등)에는
+        쓰지 않는다. OrderExecutor.submit_orders는 순차 실행한다.
+        """
+        if len(orders) <= 1:
+            return [self.place_order(order) for order in orders]
+
+        with ThreadPoolExecutor(max_workers=min(len(orders), ORDER_MAX_WORKERS)) as pool:
+            return list(pool.map(self.place_order, orders))
+
     def _resolve_fill(self, order: Order, order_no: str) -> Tuple[int, int]:
         """주문 직후 체결내역에서 실제 체결수량/평균체결가를 조회한다.
 
@@ -82,30 +245,149 @@ class TradingAPI:
         if not order_no:
             return 0, 0
 
-        start_date = datetime.now().strftime("%Y%m%d")
-        side_code = "02" if order.side == OrderSide.BUY else "01"
+        start_date = self._today_str()
+        side_code = _CCLD_SIDE_CODE[order.side]
+        placed_at = time.monotonic()
 
-        # 시장가는 체결 확정에 약간의 지연이 있을 수 있어 짧게 재조회
-        for _ in range(5):
-            row = self._fetch_fill_row(
+        # 시장가는 체결 확정에 약간의 지연이 있을 수 있어 간격을 늘려 가며 재조회
+        # (지터로 여러 주문의 재조회가 같은 순간에 몰리지 않게 한다)
+        delay = self.fill_poll_initial_delay
+        for attempt in range(self.fill_poll_attempts):
+            row = self._find_fill_row(
                 order_no=order_no,
                 symbol=order.symbol,
                 side_code=side_code,
                 start_date=start_date,
+                placed_at=placed_at,
             )
             if row:
-                qty = self._to_int(row.get("tot_ccld_qty", 0))
-                avg_price = self._to_int(row.get("avg_prvs", 0))
-                if qty > 0 and avg_price <= 0:
-                    total_amt = self._to_int(row.get("tot_ccld_amt", 0))
-                    if total_amt > 0:
-                        avg_price = int(round(total_amt / qty))
+                qty, avg_price = self._parse_fill(row)
                 if qty > 0 and avg_price > 0:
                     return qty, avg_price
-            time.sleep(0.2)
+            if attempt + 1 < self.fill_poll_attempts:
+                if self._shutdown.wait(delay + random.uniform(0, delay * 0.25)):
+                    break
+                delay = min(delay * self.fill_poll_backoff, self.fill_poll_max_delay)
 
         return 0, 0
 
+    def poll_fills(self, order_nos: List[str]) -> Dict[str, Tuple[int, int]]:
+        """당일 체결내역을 조회해 주문번호별 (체결수량, 평균체결가)를 돌려준다.
+
+        place_order가 체결을 기다리지 않는 지정가 주문을 호출자가 원하는 주기로 확인할 때 쓴다.
+        한 번의 전체 조회로 찾고, 첫 페이지에 없는 주문만 주문번호로 따로 조회한다.
+        아직 체결되지 않은 주문은 결과에서 빠진다.
+        """
+        start_date = self._today_str()
+        with self._fill_lock:
+            entry = self._fetch_fill_cache(start_date)
+        if entry is None:
+            return {}
+
+        _, _, index, has_more = entry
+        fills: Dict[str, Tuple[int, int]] = {}
+        for order_no in order_nos:
+            row = index.get(order_no)
+            if row is None and has_more:
+                row = self._fetch_fill_row(order_no, "", "00", start_date)
+            if row:
+                qty, avg_price = self._parse_fill(row)
+                if qty > 0 and avg_price > 0:
+                    fills[order_no] = (qty, avg_price)
+        return fills
+
+    def _parse_fill(self, row: Dict[str, Any]) -> Tuple[int, int]:
+        """체결내역 행에서 (체결수량, 평균체결가)를 읽는다. 평균가가 비어 있으면 체결금액으로 계산한다."""
+        qty = self._to_int(row.get("tot_ccld_qty", 0))
+        avg_price = self._to_int(row.get("avg_prvs", 0))
+        if qty > 0 and avg_price <= 0:
+            total_amt = self._to_int(row.get("tot_ccld_amt", 0))
+            if total_amt > 0:
+                avg_price = int(round(total_amt / qty))
+        return qty, avg_price
+
+    def _today_str(self) -> str:
+        """체결 조회에 쓸 오늘 날짜(YYYYMMDD). 날짜가 바뀔 때만 다시 만든다."""
+        today = date.today()
+        cached_date, cached_str = self._fill_date
+        if today != cached_date:
+            cached_str = f"{today:%Y%m%d}"
+            self._fill_date = (today, cached_str)
+        return cached_str
+
+    def _find_fill_row(
+        self,
+        order_no: str,
+        symbol: str,
+        side_code: str,
+        start_date: str,
+        placed_at: float,
+    ) -> Optional[Dict[str, Any]]:
+        """주문의 당일 체결 행을 찾는다.
+
+        동시에 낸 주문들이 같은 조회를 반복하지 않도록 당일 전체 체결내역을 주문번호로 색인해
+        FILL_CACHE_TTL 동안 공유한다. 주문 접수 이후에 시작된 조회 결과만 쓰고,
+        거기에 주문이 없으면 새로 조회한다.
+        """
+        entry = self._fill_cache
+        if not (self._is_fresh_fill_cache(entry, start_date, placed_at) and order_no in entry[2]):
+            with self._fill_lock:
+                # 기다리는 동안 다른 스레드가 새로 조회했으면 그 결과를 이번 조회로 쓴다
+                latest = self._fill_cache
+                if latest is not entry and self._is_fresh_fill_cache(latest, start_date, placed_at):
+                    entry = latest
+                else:
+                    entry = self._fetch_fill_cache(start_date)
+                    if entry is None:
+                        return None
+
+        _, _, index, has_more = entry
+        row = index.get(order_no)
+        if row is None and has_more:
+            # 최신순 첫 페이지에 없으면 주문번호로 좁혀 다시 조회한다
+            return self._fetch_fill_row(order_no, symbol, side_code, start_date)
+        if row is None or row.get("pdno", "") != symbol:
+            return None
+        return row
+
+    @staticmethod
+    def _is_fresh_fill_cache(
+        entry: Tuple[float, str, Dict[str, Dict[str, Any]], bool],
+        start_date: str,
+        placed_at: float,
+    ) -> bool:
+        fetched_at, cached_date, _, _ = entry
+        return (
+            cached_date == start_date
+            and fetched_at >= placed_at
+            and time.monotonic() - fetched_at < FILL_CACHE_TTL
+        )
+
+    def _fetch_fill_cache(
+        self, start_date: str
+    ) -> Optional[Tuple[float, str, Dict[str, Dict[str, Any]], bool]]:
+        """당일 전체 체결내역 첫 페이지(최신순)를 조회해 공유 캐시를 갱신한다. _fill_lock 안에서 호출한다."""
+        fetched_at = time.monotonic()
+        params = {
+            **_DAILY_CCLD_PARAMS,
+            "INQR_STRT_DT": start_date,
+            "INQR_END_DT": start_date,
+            "SLL_BUY_DVSN_CD": "00",  # 전체
+        }
+
+        res = self.client.get(
+            api_url="/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
+            tr_id="TTTC0081R",
+            params=params,
+        )
+        if not res.success:
+            return None
+
+        index = {row.get("odno", ""): row for row in res.output1 or []}
+        entry = (fetched_at, start_date, index, res.has_next)
+        self._fill_cache = entry
+        return entry
+
     def _fetch_fill_row(
         self,
         order_no: str,
@@ -113,22 +395,14 @@ class TradingAPI:
         side_code: str,
         start_date: str,
     ) -> Optional[Dict[str, Any]]:
+        """주문번호로 좁혀 체결 행을 조회한다. symbol이 비어 있으면 종목은 확인하지 않는다."""
         params = {
-            "CANO": "",
-            "ACNT_PRDT_CD": "",
+            **_DAILY_CCLD_PARAMS,
             "INQR_STRT_DT": start_date,
             "INQR_END_DT": start_date,
             "SLL_BUY_DVSN_CD": side_code,
             "PDNO": symbol,
-            "CCLD_DVSN": "00",
-            "INQR_DVSN": "00",
-            "INQR_DVSN_3": "00",
-            "ORD_GNO_BRNO": "",
             "ODNO": order_no,
-            "INQR_DVSN_1": "",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-            "EXCG_ID_DVSN_CD": "KRX",
         }
 
         res = self.client.get(
@@ -141,15 +415,26 @@ class TradingAPI:
 
         rows = res.output1 or []
         for row in rows:
-            if row.get("odno", "") == order_no and row.get("pdno", "") == symbol:
+            if row.get("odno", "") == order_no and (not symbol or row.get("pdno", "") == symbol):
                 return row
         return None
 
     @staticmethod
     def _to_int(value: Any) -> int:
+        """응답 값을 정수로 바꾼다. 변환할 수 없으면 0.
+
+        체결 응답은 대부분 "3", "70100" 같은 정수 문자열이므로 int()를 먼저 시도하고,
+        실패할 때만 쉼표 제거 후 float를 거쳐 변환한다.
+        """
+        if type(value) is int:
+            return value
+        try:
+            return int(value)
+        except (TypeError, ValueError, OverflowError):
+            pass
         try:
             return int(float(str(value).replace(",", "").strip()))
-        except (TypeError, ValueError):
+        except (TypeError, ValueError, OverflowError):
             return 0
 
     def buy(
@@ -194,16 +479,13 @@ class TradingAPI:
     ) -> OrderResult:
         """주문을 취소한다."""
         body = {
-            "CANO": "",
-            "ACNT_PRDT_CD": "",
-            "KRX_FWDG_ORD_ORGNO": "",
+            **_REVISE_CANCEL_BODY,
             "ORGN_ODNO": order_no,
             "ORD_DVSN": "00",
             "RVSE_CNCL_DVSN_CD": "02",  # 취소
             "ORD_QTY": str(quantity),
             "ORD_UNPR": "0",
             "QTY_ALL_ORD_YN": "Y" if cancel_all else "N",
-            "EXCG_ID_DVSN_CD": "KRX",
         }
 
         res = self.client.post(
@@ -228,16 +510,13 @@ class TradingAPI:
     ) -> OrderResult:
         """주문을 정정한다."""
         body = {
-            "CANO": "",
-            "ACNT_PRDT_CD": "",
-            "KRX_FWDG_ORD_ORGNO": "",
+            **_REVISE_CANCEL_BODY,
             "ORGN_ODNO": order_no,
             "ORD_DVSN": order_type.value,
             "RVSE_CNCL_DVSN_CD": "01",  # 정정
             "ORD_QTY": str(quantity),
             "ORD_UNPR": str(price),
             "QTY_ALL_ORD_YN": "N",
-            "EXCG_ID_DVSN_CD": "KRX",
         }
 
         res = self.client.post(
@@ -0,0 +1,91 @@
+import unittest
+
+from src.account import AccountAPI
+from src.models import AccountBalance, Position
+
+
+class DummyResponse:
+    def __init__(self, success, output1=None, output2=None, error_message=""):
+        self.success = success
+        self.output1 = output1
+        self.output2 = output2
+        self.error_message = error_message
+
+
+class DummyClient:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, **kwargs):
+        return self.response
+
+
+class AccountBalanceTests(unittest.TestCase):
+    def test_get_balance_casts_fields_and_skips_empty_positions(self):
+        client = DummyClient(
+            DummyResponse(
+                success=True,
+                output1=[
+                    {
+                        "pdno": "005930",
+                        "prdt_name": "삼성전자",
+                        "hldg_qty": "3",
+                        "pchs_avg_pric": "70100.5000",
+                        "prpr": "71000",
+                        "evlu_amt": "213000",
+                        "evlu_pfls_amt": "2700",
+                        "evlu_pfls_rt": "1.28",
+                    },
+                    {"pdno": "000660", "prdt_name": "SK하이닉스", "hldg_qty": "0"},
+                ],
+                output2=[{
+                    "tot_evlu_amt": "1000000",
+                    "dnca_tot_amt": "787000",
+                    "evlu_pfls_smtl_amt": "2700",
+                    "tot_evlu_pfls_amt_rt": "",
+                }],
+            )
+        )
+
+        balance = AccountAPI(client).get_balance()
+
+        self.assertEqual(balance.total_eval_amount, 1_000_000)
+        self.assertEqual(balance.total_deposit, 787_000)
+        self.assertEqual(len(balance.position_arrays), 1)
+        self.assertEqual(balance.position_arrays.quantities.tolist(), [3])
+        self.assertEqual(len(balance.positions), 1)
+        pos = balance.positions[0]
+        self.assertEqual(pos.symbol, "005930")
+        self.assertEqual(pos.quantity, 3)
+        self.assertEqual(pos.avg_price, 70100.5)
+        self.assertEqual(pos.current_price, 71000)
+        self.assertEqual(pos.profit_rate, 1.28)
+
+    def test_get_balance_without_holdings_has_empty_positions(self):
+        client = DummyClient(DummyResponse(success=True, output1=[], output2=[]))
+
+        balance = AccountAPI(client).get_balance()
+
+        self.assertIsNone(balance.position_arrays)
+        self.assertEqual(balance.positions, [])
+
+    def test_balance_accepts_position_list_and_compares_by_value(self):
+        held = [Position("005930", "삼성전자", 3, 70100.5, 71000, 213000, 2700, 1.28)]
+        first = AccountBalance(1_000_000, 787_000, 2700, 0.27, positions=held)
+        second = AccountBalance(1_000_000, 787_000, 2700, 0.27, positions=list(held))
+
+        self.assertEqual(first.positions, held)
+        self.assertEqual(first.position_arrays.quantities.tolist(), [3])
+        self.assertEqual(first, second)
+
+        lazy = AccountBalance(1_000_000, 787_000, 2700, 0.27, position_arrays=second.position_arrays)
+        _ = second.positions  # 한쪽만 목록을 만들어도 비교 결과는 같다
+        self.assertEqual(lazy, second)
+
+    def test_get_balance_failure_returns_none(self):
+        client = DummyClient(DummyResponse(success=False, error_message="err"))
+        self.assertIsNone(AccountAPI(client).get_balance())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from types import SimpleNamespace
+
+from src.api_client import KISClient
+
+
+class InjectAccountTests(unittest.TestCase):
+    def setUp(self):
+        self.client = SimpleNamespace(_account_params={"CANO": "12345678", "ACNT_PRDT_CD": "01"})
+
+    def test_fills_only_account_keys_already_present(self):
+        params = {"CANO": "", "PDNO": "005930"}
+
+        injected = KISClient._inject_account(self.client, params)
+
+        self.assertEqual(injected, {"CANO": "12345678", "PDNO": "005930"})
+        self.assertEqual(params["CANO"], "")  # 호출자 dict는 그대로
+
+    def test_keeps_key_order_and_params_without_account(self):
+        params = {"CANO": "", "ACNT_PRDT_CD": "", "INQR_DVSN": "02"}
+        plain = {"FID_INPUT_ISCD": "005930"}
+
+        self.assertEqual(list(KISClient._inject_account(self.client, params)), ["CANO", "ACNT_PRDT_CD", "INQR_DVSN"])
+        self.assertIs(KISClient._inject_account(self.client, plain), plain)
+
+
+if __name__ == "__main__":
+    unittest.main()
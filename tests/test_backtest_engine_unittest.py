@@ -0,0 +1,223 @@
+import unittest
+
+import pandas as pd
+
+from src.backtest.engine import (
+    RATE_SCALE,
+    BacktestEngine,
+    BacktestResult,
+    DailyRecord,
+    TradeRecord,
+    _buy_fill,
+    _sell_fill,
+)
+from src.models import Order, OrderSide, OrderType
+from src.strategy import BaseStrategy
+
+
+def make_daily(rows):
+    return pd.DataFrame(
+        [
+            {
+                "stck_bsop_date": d,
+                "stck_oprc": str(o),
+                "stck_hgpr": str(h),
+                "stck_lwpr": str(l),
+                "stck_clpr": str(c),
+                "acml_vol": str(v),
+            }
+            for d, o, h, l, c, v in rows
+        ]
+    )
+
+
+class ScriptedStrategy(BaseStrategy):
+    """첫 틱에 지정 종목을 매수하고 틱별 시세를 기록한다."""
+
+    def __init__(self, buy_symbol=None, quantity=10, watchlist=None):
+        self.buy_symbol = buy_symbol
+        self.quantity = quantity
+        self.watchlist = watchlist or []
+        self.seen = []
+        self.fills = []
+
+    def initialize(self):
+        self._bought = False
+
+    def get_watchlist(self):
+        return self.watchlist
+
+    def on_tick(self, quote):
+        return []
+
+    def on_batch_tick(self, quotes):
+        self.seen.append([(q.symbol, q.current_price, q.high_price, q.low_price, q.volume) for q in quotes])
+        if self.buy_symbol and not self._bought:
+            self._bought = True
+            return [Order(symbol=self.buy_symbol, side=OrderSide.BUY,
+                          order_type=OrderType.MARKET, quantity=self.quantity)]
+        return []
+
+    def on_order_filled(self, result):
+        self.fills.append((result.side, result.symbol, result.quantity, result.price))
+
+    def should_continue(self):
+        return True
+
+
+class BacktestEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            "AAA": make_daily([
+                ("20260102", 1000, 1100, 950, 1050, 400),   # 상승일
+                ("20260105", 1050, 1080, 990, 1000, 800),   # 하락일
+            ]),
+            "BBB": make_daily([
+                ("20260105", 2000, 2100, 1900, 2050, 100),
+            ]),
+        }
+
+    def test_day_ticks_follow_open_extremes_close_order(self):
+        strategy = ScriptedStrategy()
+        engine = BacktestEngine(strategy=strategy, data=self.data)
+
+        engine.run("20260101", "20260131")
+
+        # 1일차: AAA만 존재, 상승일이므로 O → L → H → C
+        self.assertEqual(
+            strategy.seen[:4],
+            [
+                [("AAA", 1000, 1000, 1000, 100)],
+                [("AAA", 950, 1000, 950, 200)],
+                [("AAA", 1100, 1100, 950, 300)],
+                [("AAA", 1050, 1100, 950, 400)],
+            ],
+        )
+        # 2일차: AAA 하락일(O → H → L → C), BBB 상승일
+        self.assertEqual([p for _, p, *_ in strategy.seen[5]], [1080, 1900])
+        self.assertEqual([p for _, p, *_ in strategy.seen[6]], [990, 2100])
+
+    def test_change_uses_prev_close_and_falls_back_to_open(self):
+        data = {
+            "AAA": make_daily([("20260102", 1000, 1100, 950, 1050, 400)]).assign(stck_prdy_clpr="900"),
+            "BBB": make_daily([("20260102", 2000, 2100, 1900, 2050, 100)]).assign(stck_prdy_clpr="0"),
+        }
+        engine = BacktestEngine(strategy=ScriptedStrategy(), data=data)
+
+        engine._build_tick_panel([20260102])
+
+        # 필드 순서: [현재가, 전일대비, ...], 종가 틱 기준
+        self.assertEqual(engine._tick_fields[0, 0, 3, 1], 1050 - 900)
+        self.assertEqual(engine._tick_fields[0, 1, 3, 1], 2050 - 2000)
+        self.assertAlmostEqual(engine._tick_rates[0, 0, 3], 150 / 900 * 100)
+
+    def test_ticks_cover_only_watched_symbols(self):
+        strategy = ScriptedStrategy(watchlist=["BBB"])
+        engine = BacktestEngine(strategy=strategy, data=self.data)
+
+        engine.run("20260101", "20260131")
+
+        # AAA만 있는 첫날은 틱이 없고, 둘째 날은 BBB 시세만 전달된다
+        self.assertEqual(len(strategy.seen), 4)
+        self.assertTrue(all(sym == "BBB" for tick in strategy.seen for sym, *_ in tick))
+
+    def test_calls_daily_reset_once_per_trading_day(self):
+        strategy = ScriptedStrategy()
+        strategy.resets = 0
+
+        def daily_reset():
+            strategy.resets += 1
+
+        strategy.daily_reset = daily_reset
+        engine = BacktestEngine(strategy=strategy, data=self.data)
+
+        result = engine.run("20260101", "20260131")
+
+        self.assertEqual(strategy.resets, len(result.daily_records))
+        self.assertFalse(hasattr(strategy, "_bought"))  # initialize()는 호출되지 않음
+
+    def test_buy_fills_next_tick_and_liquidates_at_close(self):
+        strategy = ScriptedStrategy(buy_symbol="AAA", quantity=10)
+        engine = BacktestEngine(
+            strategy=strategy,
+            data={"AAA": self.data["AAA"].iloc[:1]},
+            initial_capital=100_000,
+            commission_rate=0.00015,
+            tax_rate=0.002,
+        )
+
+        result = engine.run("20260101", "20260131")
+
+        # 시가 틱에서 주문 → 다음 틱(저가 950) 체결, 종가 1050 강제 청산
+        self.assertEqual(strategy.fills, [
+            (OrderSide.BUY, "AAA", 10, 950),
+            (OrderSide.SELL, "AAA", 10, 1050),
+        ])
+        buy_comm = int(9_500 * 0.00015)
+        sell_cost = int(10_500 * 0.00015) + int(10_500 * 0.002)
+        expected_pnl = (10_500 - sell_cost) - (9_500 + buy_comm)
+        self.assertEqual(result.trade_records[-1].pnl, expected_pnl)
+        self.assertEqual(result.final_capital, 100_000 + expected_pnl)
+        self.assertEqual(result.total_trades, 2)
+        self.assertEqual(result.winning_trades, 1)
+        self.assertEqual(len(result.daily_records), 1)
+        self.assertEqual(result.daily_records[0].realized_pnl, expected_pnl)
+        self.assertEqual(result.daily_records[0].trade_count, 2)
+
+
+class FillKernelTests(unittest.TestCase):
+    def test_buy_and_sell_apply_slippage_commission_and_tax(self):
+        # 10bps 슬리피지, 수수료 0.015%, 세금 0.2% — RATE_SCALE 기준 정수
+        comm, tax = 150 * RATE_SCALE // 1_000_000, 2_000 * RATE_SCALE // 1_000_000
+        fill_price, total_cost, commission = _buy_fill(10_000, 3, 10_010, comm)
+        self.assertEqual(fill_price, 10_010)  # 부동소수 계산이면 10_009로 내려간다
+        self.assertEqual(commission, int(30_030 * 0.00015))
+        self.assertEqual(total_cost, 30_030 + commission)
+
+        fill_price, net_proceeds, net_pnl = _sell_fill(10_500, 3, 10_010, commission, 9_990, comm, tax)
+        self.assertEqual(fill_price, 10_489)
+        gross = 10_489 * 3
+        self.assertEqual(net_proceeds, gross - int(gross * 0.00015) - int(gross * 0.002))
+        self.assertEqual(net_pnl, net_proceeds - total_cost)
+
+
+    def test_fine_grained_rates_are_kept_or_rejected(self):
+        engine = BacktestEngine(strategy=None, data={}, commission_rate=0.000140527)
+        self.assertEqual(engine._comm_num, 140_527)
+
+        with self.assertRaises(ValueError):
+            BacktestEngine(strategy=None, data={}, commission_rate=1 / 3)
+
+
+class BacktestResultTests(unittest.TestCase):
+    def test_aggregates_match_record_scans(self):
+        result = BacktestResult(
+            initial_capital=100_000, final_capital=95_000,
+            total_trades=4, winning_trades=1, losing_trades=1,
+            daily_records=[
+                DailyRecord("20260102", 112_000, 12_000, 2, 0),
+                DailyRecord("20260105", 106_000, -6_000, 2, 0),
+                DailyRecord("20260106", 95_000, 0, 0, 0),
+            ],
+            trade_records=[
+                TradeRecord("", "AAA", "buy", 1, 100),
+                TradeRecord("", "AAA", "sell", 1, 200, pnl=12_000),
+                TradeRecord("", "BBB", "buy", 1, 100),
+                TradeRecord("", "BBB", "sell", 1, 50, pnl=-6_000),
+            ],
+        )
+        result.finalize()
+
+        self.assertEqual(result.avg_win, 12_000)
+        self.assertEqual(result.avg_loss, -6_000)
+        self.assertAlmostEqual(result.max_drawdown_pct, (112_000 - 95_000) / 112_000 * 100)
+        self.assertEqual(result.total_realized_pnl, 6_000)
+        self.assertEqual(result.days_target_hit(), 1)
+        self.assertEqual(result.days_loss_limit_hit(), 1)
+        # 캐시와 다른 기준값은 직접 계산한다
+        self.assertEqual(result.days_loss_limit_hit(-10_000), 0)
+        self.assertEqual(result.days_target_hit(0), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
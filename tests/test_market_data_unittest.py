@@ -0,0 +1,190 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.market_data import DAILY_ROWS_TTL, HOLIDAY_TTL_FALLBACK, MarketDataAPI
+
+
+class DummyResponse:
+    def __init__(self, success, error_code="", error_message="", output=None):
+        self.success = success
+        self.error_code = error_code
+        self.error_message = error_message
+        self.output = output
+
+
+class DummyClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def get(self, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+class HolidayDiskCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "holidays.json")
+
+    def test_result_survives_new_instance(self):
+        client = DummyClient(DummyResponse(success=True, output=[{"opnd_yn": "N"}]))
+
+        first = MarketDataAPI(client, holiday_cache_path=self.path).is_market_open("20260101")
+        second = MarketDataAPI(client, holiday_cache_path=self.path).is_market_open("20260101")
+
+        self.assertFalse(first)
+        self.assertFalse(second)
+        self.assertEqual(client.calls, 1)
+
+    def test_expired_entry_is_refetched(self):
+        client = DummyClient(DummyResponse(success=False, error_code="OPSQ0002"))
+        MarketDataAPI(client, holiday_cache_path=self.path).is_market_open("20260213")
+
+        with open(self.path, encoding="utf-8") as f:
+            entry = json.load(f)["20260213"]
+        self.assertEqual(entry["ttl"], HOLIDAY_TTL_FALLBACK)
+
+        with patch("src.market_data.time.time", return_value=entry["fetched_at"] + HOLIDAY_TTL_FALLBACK + 1):
+            MarketDataAPI(client, holiday_cache_path=self.path).is_market_open("20260213")
+        self.assertEqual(client.calls, 2)
+
+    def test_without_path_nothing_is_written(self):
+        client = DummyClient(DummyResponse(success=True, output=[{"opnd_yn": "Y"}]))
+
+        self.assertTrue(MarketDataAPI(client).is_market_open("20260213"))
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+
+class ResponseParsingTests(unittest.TestCase):
+    def test_multi_price_casts_fields_and_skips_invalid_rows(self):
+        rows = [
+            {"inter_shrn_iscd": "005930", "inter_kor_isnm": "삼성전자", "inter2_prpr": "70000",
+             "inter2_prdy_vrss": "-500", "prdy_ctrt": "-0.71", "inter2_oprc": "70500",
+             "inter2_hgpr": "71000", "inter2_lwpr": "69500", "acml_vol": "123", "acml_tr_pbmn": "456"},
+            {"inter_shrn_iscd": "", "inter2_prpr": "1"},
+            {"inter_shrn_iscd": "000660", "inter_kor_isnm": "SK하이닉스", "inter2_prpr": "",
+             "inter2_prdy_vrss": "0", "prdy_ctrt": "0", "inter2_oprc": "0",
+             "inter2_hgpr": "0", "inter2_lwpr": "0", "acml_vol": "0", "acml_tr_pbmn": "0"},
+        ]
+        market = MarketDataAPI(DummyClient(DummyResponse(success=True, output=rows)))
+
+        quotes = market.get_multi_price(["005930", "000660"])
+
+        self.assertEqual(len(quotes), 1)
+        q = quotes[0]
+        self.assertIsInstance(q.timestamp, datetime)
+        self.assertEqual((q.symbol, q.name, q.current_price, q.change), ("005930", "삼성전자", 70000, -500))
+        self.assertEqual((q.open_price, q.high_price, q.low_price), (70500, 71000, 69500))
+        self.assertEqual((q.volume, q.trade_amount), (123, 456))
+        self.assertAlmostEqual(q.change_rate, -0.71)
+        self.assertIsInstance(q.current_price, int)
+
+    def test_current_price_casts_fields_and_defaults_missing_keys(self):
+        output = {"hts_kor_isnm": "삼성전자", "stck_prpr": "70000", "prdy_vrss": "-500",
+                  "prdy_ctrt": "-0.71", "stck_oprc": "70500", "acml_vol": "123"}
+        market = MarketDataAPI(DummyClient(DummyResponse(success=True, output=output)))
+
+        q = market.get_current_price("005930")
+
+        self.assertEqual((q.symbol, q.name, q.current_price, q.change), ("005930", "삼성전자", 70000, -500))
+        self.assertEqual((q.open_price, q.high_price, q.low_price), (70500, 0, 0))
+        self.assertEqual((q.volume, q.trade_amount), (123, 0))
+        self.assertAlmostEqual(q.change_rate, -0.71)
+
+    def test_daily_prices_have_numeric_columns(self):
+        rows = [
+            {"stck_bsop_date": "20260213", "stck_clpr": "70000", "stck_oprc": "69000",
+             "stck_hgpr": "70500", "stck_lwpr": "68800", "acml_vol": "", "flng_cls_code": "00"},
+        ]
+        response = DummyResponse(success=True)
+        response.output2 = rows
+        market = MarketDataAPI(DummyClient(response))
+
+        df = market.get_daily_prices("005930", "20260201", "20260213")
+
+        self.assertEqual(df["stck_clpr"].dtype, "int64")
+        self.assertEqual(df["stck_clpr"].iloc[0], 70000)
+        self.assertEqual(df["acml_vol"].iloc[0], 0)
+        self.assertEqual(df["stck_bsop_date"].iloc[0], "20260213")
+
+    def test_index_daily_closes_are_oldest_first_and_skip_invalid(self):
+        response = DummyResponse(success=True)
+        response.output2 = [
+            {"stck_bsop_date": "20260213", "bstp_nmix_prpr": "2650.50"},
+            {"stck_bsop_date": "20260212", "bstp_nmix_prpr": ""},
+            {"stck_bsop_date": "20260211", "bstp_nmix_prpr": "2600.00"},
+        ]
+        market = MarketDataAPI(DummyClient(response))
+
+        closes = market.get_index_daily_closes("0001", "20260201", "20260213")
+
+        self.assertEqual(closes.dtype, "float64")
+        self.assertEqual(closes.tolist(), [2600.0, 2650.5])
+
+    def test_repeated_daily_rows_request_reuses_response(self):
+        response = DummyResponse(success=True)
+        response.output2 = [{"stck_bsop_date": "20260213", "stck_clpr": "70000"}]
+        client = DummyClient(response)
+        market = MarketDataAPI(client)
+
+        first = market.get_daily_price_rows("005930", "20260201", "20260213")
+        first.clear()  # 호출자가 받은 목록을 바꿔도 캐시는 그대로
+        second = market.get_daily_price_rows("005930", "20260201", "20260213")
+        market.get_daily_price_rows("000660", "20260201", "20260213")
+        with patch("src.market_data.time.time", return_value=time.time() + DAILY_ROWS_TTL):
+            market.get_daily_price_rows("005930", "20260201", "20260213")
+
+        self.assertEqual(second, response.output2)
+        self.assertEqual(client.calls, 3)
+
+    def test_daily_rows_cache_is_shared_safely_across_threads(self):
+        response = DummyResponse(success=True)
+        response.output2 = [{"stck_bsop_date": "20260213", "stck_clpr": "70000"}]
+        market = MarketDataAPI(DummyClient(response))
+        symbols = [f"{i:06d}" for i in range(200)]
+        start = threading.Barrier(8)
+        errors = []
+
+        def worker(offset):
+            start.wait()
+            try:
+                for symbol in symbols[offset::8]:
+                    market.get_daily_price_rows(symbol, "20260201", "20260213")
+            except Exception as e:  # 스레드 안 예외를 테스트로 전달
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(market._daily_rows_cache), len(symbols))
+
+    def test_ranking_respects_count_and_defaults_missing_keys(self):
+        rows = [
+            {"stck_shrn_iscd": f"{i:06d}", "hts_kor_isnm": f"종목{i}", "stck_prpr": str(1000 + i),
+             "prdy_ctrt": "1.5", "data_rank": str(i)}
+            for i in range(1, 6)
+        ]
+        market = MarketDataAPI(DummyClient(DummyResponse(success=True, output=rows)))
+
+        items = market.get_fluctuation_ranking(count=3)
+
+        self.assertEqual([item.symbol for item in items], ["000001", "000002", "000003"])
+        self.assertEqual(items[0].current_price, 1001)
+        self.assertEqual(items[0].volume, 0)  # acml_vol 없음 → 0
+        self.assertEqual(items[2].rank, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import time
+import unittest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.market_data import DAILY_ROWS_TTL, MarketDataAPI
+from src.models import OrderResult, OrderSide, Quote
+from src.strategies.momentum_scalp import MomentumScalpConfig, MomentumScalpStrategy, PositionState
+
+
+def index_rows(closes):
+    """오래된 순 종가 목록을 KIS 응답과 같은 최신순 인덱스 일봉 레코드로 만든다."""
+    start = date(2026, 1, 1)
+    rows = [
+        {
+            "stck_bsop_date": (start + timedelta(days=i)).strftime("%Y%m%d"),
+            "bstp_nmix_prpr": f"{close:.2f}",
+        }
+        for i, close in enumerate(closes)
+    ]
+    return rows[::-1]
+
+
+class IndexResponse:
+    def __init__(self, rows):
+        self.success = True
+        self.output2 = rows
+
+
+class FakeIndexClient:
+    def __init__(self, closes):
+        self.closes = closes
+        self.index_calls = 0
+
+    def get(self, **kwargs):
+        self.index_calls += 1
+        return IndexResponse(index_rows(self.closes))
+
+
+class MarketRegimeTests(unittest.TestCase):
+    def _strategy(self, closes):
+        client = FakeIndexClient(closes)
+        strategy = MomentumScalpStrategy(market_data=MarketDataAPI(client), config=MomentumScalpConfig())
+        return strategy, client
+
+    def test_regime_is_fetched_once_per_day(self):
+        strategy, market = self._strategy([2500 + i for i in range(30)])
+
+        strategy._check_market_regime()
+        strategy._check_market_regime()
+
+        self.assertEqual(market.index_calls, 1)
+
+    def test_uses_latest_bars_of_newest_first_response(self):
+        # 오래 오르다가 최근 3일 연속 하락해 MA5/MA20 아래로 내려온 경우
+        closes = [2000 + 20 * i for i in range(40)] + [2400, 2200, 2000]
+        strategy, _ = self._strategy(closes)
+
+        strategy._check_market_regime()
+
+        self.assertEqual(strategy._bear_score, 3)
+        self.assertTrue(strategy._bear_market)
+
+    def test_rising_market_scores_zero(self):
+        strategy, _ = self._strategy([2000 + 10 * i for i in range(40)])
+
+        strategy._check_market_regime()
+
+        self.assertEqual(strategy._bear_score, 0)
+
+    def test_failed_fetch_is_retried(self):
+        strategy, market = self._strategy([2500] * 5)  # 20일 미만 → 계산 불가
+
+        strategy._check_market_regime()
+        # 같은 응답은 MarketDataAPI가 DAILY_ROWS_TTL 동안 재사용하므로 그 이후에 재시도
+        with patch("src.market_data.time.time", return_value=time.time() + DAILY_ROWS_TTL):
+            strategy._check_market_regime()
+
+        self.assertEqual(market.index_calls, 2)
+        self.assertEqual(strategy._bear_score, 0)
+
+
+class FakeRankingMarket:
+    def __init__(self, symbols):
+        self.symbols = symbols
+
+    def get_fluctuation_ranking(self, **kwargs):
+        return [SimpleNamespace(symbol=s) for s in self.symbols]
+
+
+class PoolTests(unittest.TestCase):
+    def test_pool_keeps_static_inverse_then_ranking_order(self):
+        cfg = MomentumScalpConfig(static_watchlist=["000001", "000002"], inverse_etfs=["114800"])
+        strategy = MomentumScalpStrategy(market_data=FakeRankingMarket(["000009", "000002", "000008"]), config=cfg)
+
+        strategy._build_pool()
+
+        self.assertEqual(strategy._pool, ["000001", "000002", "114800", "000009", "000008"])
+
+
+def rising_quote(symbol, price=10_300):
+    return Quote(
+        symbol=symbol, name=symbol, current_price=price, change=300, change_rate=3.0,
+        open_price=10_000, high_price=price, low_price=10_000, volume=1_000_000, trade_amount=0,
+    )
+
+
+class QuoteMarketEstimateTests(unittest.TestCase):
+    def test_inverse_etfs_are_excluded_from_breadth(self):
+        strategy = MomentumScalpStrategy(market_data=None, config=MomentumScalpConfig())
+        inverse = next(iter(strategy._inverse_symbols))
+        quotes = [rising_quote(inverse)] + [
+            Quote(symbol=f"{i:06d}", name="", current_price=9_800, change=-200, change_rate=-1.2,
+                  open_price=10_000, high_price=10_000, low_price=9_800, volume=1, trade_amount=0)
+            for i in range(4)
+        ]
+
+        strategy._estimate_market_from_quotes(quotes)
+
+        self.assertEqual(strategy._bear_score, 3)
+        self.assertTrue(strategy._bear_market)
+
+
+class BatchTickTests(unittest.TestCase):
+    def test_new_buys_stop_at_max_position_count(self):
+        cfg = MomentumScalpConfig(max_position_count=3, inverse_enabled=False)
+        strategy = MomentumScalpStrategy(market_data=None, config=cfg)
+        strategy.positions["HELD"] = PositionState(symbol="HELD", buy_price=10_000, quantity=1)
+
+        orders = strategy.on_batch_tick([rising_quote(f"{i:06d}") for i in range(5)])
+
+        buys = [o.symbol for o in orders if o.side == OrderSide.BUY]
+        self.assertEqual(buys, ["000000", "000001"])
+
+    def test_buys_in_same_batch_share_seed_money(self):
+        cfg = MomentumScalpConfig(seed_money=20_000, per_stock_amount=20_000, inverse_enabled=False)
+        strategy = MomentumScalpStrategy(market_data=None, config=cfg)
+
+        orders = strategy.on_batch_tick([rising_quote("000001"), rising_quote("000002")])
+
+        # 첫 매수(10,300원 1주) 후 남은 9,700원으로는 두 번째 종목을 살 수 없다
+        self.assertEqual([(o.symbol, o.quantity) for o in orders], [("000001", 1)])
+
+    def test_take_profit_is_not_followed_by_scale_in(self):
+        strategy = MomentumScalpStrategy(market_data=None, config=MomentumScalpConfig(inverse_enabled=False))
+        strategy.positions["005930"] = PositionState(symbol="005930", buy_price=10_000, quantity=1)
+
+        orders = strategy.on_tick(rising_quote("005930"))
+
+        self.assertEqual([o.side for o in orders], [OrderSide.SELL])
+
+    def test_sold_symbol_is_not_rebought_during_cooldown(self):
+        cfg = MomentumScalpConfig(cooldown_seconds=600, inverse_enabled=False)
+        strategy = MomentumScalpStrategy(market_data=None, config=cfg)
+        strategy.positions["005930"] = PositionState(symbol="005930", buy_price=10_000, quantity=1)
+        sold = OrderResult(success=True, order_no="1", symbol="005930", side=OrderSide.SELL,
+                           quantity=1, price=10_000, message="")
+
+        with patch("src.strategies.momentum_scalp.time.monotonic", return_value=1000.0):
+            strategy.on_order_filled(sold)
+            blocked = strategy._evaluate_buy(rising_quote("005930"))
+        with patch("src.strategies.momentum_scalp.time.monotonic", return_value=1600.0):
+            allowed = strategy._evaluate_buy(rising_quote("005930"))
+
+        self.assertIsNone(blocked)
+        self.assertIsNotNone(allowed)
+
+
+class MarketCloseTests(unittest.TestCase):
+    def _tick_at(self, hour, minute):
+        cfg = MomentumScalpConfig(inverse_enabled=False)
+        strategy = MomentumScalpStrategy(market_data=MarketDataAPI(FakeIndexClient([])), config=cfg)
+        strategy.positions["005930"] = PositionState(symbol="005930", buy_price=10_000, quantity=1)
+        fixed = datetime(2026, 2, 13, hour, minute)
+
+        with patch("src.strategies.momentum_scalp.datetime") as clock:
+            clock.now.return_value = fixed
+            orders = strategy.on_batch_tick([rising_quote("005930", price=10_050)])
+        return strategy, orders
+
+    def test_liquidates_after_cutoff_including_later_hours(self):
+        for hour, minute in ((15, 15), (15, 40), (16, 5)):
+            strategy, orders = self._tick_at(hour, minute)
+            self.assertTrue(strategy._halted, (hour, minute))
+            self.assertEqual([o.side for o in orders], [OrderSide.SELL])
+
+    def test_keeps_trading_before_cutoff(self):
+        strategy, _ = self._tick_at(15, 14)
+
+        self.assertFalse(strategy._halted)
+
+
+class InverseHoldTimeTests(unittest.TestCase):
+    def test_inverse_position_is_closed_at_max_hold(self):
+        strategy = MomentumScalpStrategy(market_data=MarketDataAPI(FakeIndexClient([])), config=MomentumScalpConfig())
+        strategy._bear_score = strategy.cfg.bearish_threshold  # 반등 청산 조건은 제외
+        bought = datetime(2026, 2, 13, 9, 30)
+        strategy.positions["114800"] = PositionState(symbol="114800", buy_price=10_000, quantity=1, buy_time=bought)
+        quote = rising_quote("114800", price=10_000)
+
+        before = strategy._evaluate_inverse_sell(quote, bought + timedelta(minutes=119))
+        at_limit = strategy._evaluate_inverse_sell(quote, bought + timedelta(minutes=120))
+
+        self.assertIsNone(before)
+        self.assertIsNotNone(at_limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
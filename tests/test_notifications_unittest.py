@@ -1,7 +1,10 @@
+import os
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
-from src.notifications import AlertConfig, AlertManager
+from src.notifications import ALERT_KEY_LIMIT, AlertConfig, AlertManager
 
 
 class DummyResp:
@@ -20,13 +23,14 @@ class NotificationTests(unittest.TestCase):
         )
         mgr = AlertManager(cfg=cfg)
 
-        with patch("src.notifications.requests.post", return_value=DummyResp(200)) as mock_post:
+        with patch("src.notifications._session.post", return_value=DummyResp(200)) as mock_post:
             ok = mgr.send(
                 event_key="k1",
                 title="제목",
                 message="내용",
                 level="warning",
             )
+            mgr.flush()
 
         self.assertTrue(ok)
         mock_post.assert_called_once()
@@ -43,14 +47,107 @@ class NotificationTests(unittest.TestCase):
         )
         mgr = AlertManager(cfg=cfg)
 
-        with patch("src.notifications.requests.post", return_value=DummyResp(200)) as mock_post:
+        with patch("src.notifications._session.post", return_value=DummyResp(200)) as mock_post:
             first = mgr.send(event_key="same", title="a", message="b")
             second = mgr.send(event_key="same", title="a", message="b")
+            mgr.flush()
 
         self.assertTrue(first)
         self.assertFalse(second)
         self.assertEqual(mock_post.call_count, 1)
 
+    def test_send_does_not_wait_for_webhook(self):
+        cfg = AlertConfig(
+            enabled=True,
+            channel="slack",
+            slack_webhook_url="https://hooks.slack.com/services/test",
+            min_interval_seconds=0,
+        )
+        mgr = AlertManager(cfg=cfg)
+        release = threading.Event()
+
+        def slow_post(*args, **kwargs):
+            release.wait(5)
+            return DummyResp(200)
+
+        with patch("src.notifications._session.post", side_effect=slow_post) as mock_post:
+            started = time.monotonic()
+            ok = mgr.send(event_key="k", title="t", message="m")
+            elapsed = time.monotonic() - started
+            release.set()
+            mgr.flush()
+
+        self.assertTrue(ok)
+        self.assertLess(elapsed, 1)
+        mock_post.assert_called_once()
+
+    def test_flush_with_timeout_returns_when_webhook_hangs(self):
+        cfg = AlertConfig(
+            enabled=True,
+            channel="slack",
+            slack_webhook_url="https://hooks.slack.com/services/test",
+            min_interval_seconds=0,
+        )
+        mgr = AlertManager(cfg=cfg)
+        release = threading.Event()
+
+        def hanging_post(*args, **kwargs):
+            release.wait(5)
+            return DummyResp(200)
+
+        with patch("src.notifications._session.post", side_effect=hanging_post):
+            mgr.send(event_key="k", title="t", message="m")
+            started = time.monotonic()
+            flushed = mgr.flush(timeout=0.05)
+            elapsed = time.monotonic() - started
+            release.set()
+            self.assertTrue(mgr.flush(timeout=5))
+
+        self.assertFalse(flushed)
+        self.assertLess(elapsed, 1)
+
+    def test_failed_send_releases_cooldown(self):
+        cfg = AlertConfig(
+            enabled=True,
+            channel="slack",
+            slack_webhook_url="https://hooks.slack.com/services/test",
+            min_interval_seconds=60,
+        )
+        mgr = AlertManager(cfg=cfg)
+
+        with patch("src.notifications._session.post", return_value=DummyResp(500)) as mock_post:
+            mgr.send(event_key="k", title="t", message="m")
+            mgr.flush()
+            retried = mgr.send(event_key="k", title="t", message="m")
+            mgr.flush()
+
+        self.assertTrue(retried)
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_cooldown_records_are_bounded(self):
+        cfg = AlertConfig(
+            enabled=True,
+            channel="slack",
+            slack_webhook_url="https://hooks.slack.com/services/test",
+            min_interval_seconds=60,
+        )
+        mgr = AlertManager(cfg=cfg)
+
+        with patch("src.notifications._session.post", return_value=DummyResp(200)), \
+                patch("src.notifications.time.time", return_value=1000.0):
+            mgr.send(event_key="old", title="t", message="m")
+            mgr.flush()
+        with patch("src.notifications._session.post", return_value=DummyResp(200)), \
+                patch("src.notifications.time.time", return_value=2000.0):
+            for i in range(ALERT_KEY_LIMIT):
+                mgr.send(event_key=f"k{i}", title="t", message="m")
+                mgr.flush()
+            blocked = mgr.send(event_key="k0", title="t", message="m")
+
+        self.assertLessEqual(len(mgr._last_sent), ALERT_KEY_LIMIT)
+        self.assertNotIn("old", mgr._last_sent)
+        self.assertFalse(blocked)
+
     def test_disabled_alert_returns_false(self):
         cfg = AlertConfig(
             enabled=False,
@@ -60,12 +157,31 @@ class NotificationTests(unittest.TestCase):
         )
         mgr = AlertManager(cfg=cfg)
 
-        with patch("src.notifications.requests.post") as mock_post:
+        with patch("src.notifications._session.post") as mock_post:
             ok = mgr.send(event_key="k", title="t", message="m")
 
         self.assertFalse(ok)
         mock_post.assert_not_called()
 
+    def test_from_env_reflects_current_environment(self):
+        env = {
+            "ALERTS_ENABLED": "yes",
+            "ALERT_CHANNEL": " SLACK ",
+            "SLACK_WEBHOOK_URL": " https://hooks.slack.com/services/x ",
+            "ALERT_MIN_INTERVAL_SECONDS": "-5",
+        }
+        with patch.dict(os.environ, env):
+            cfg = AlertConfig.from_env()
+        with patch.dict(os.environ, {**env, "ALERTS_ENABLED": "off"}):
+            disabled = AlertConfig.from_env()
+
+        self.assertTrue(cfg.enabled)
+        self.assertEqual(cfg.channel, "slack")
+        self.assertEqual(cfg.slack_webhook_url, "https://hooks.slack.com/services/x")
+        self.assertEqual(cfg.min_interval_seconds, 0)
+        self.assertFalse(disabled.enabled)
+        self.assertIsNot(cfg, AlertConfig.from_env())
+
 
 if __name__ == "__main__":
     unittest.main()
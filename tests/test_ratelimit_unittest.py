@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+from src.ratelimit import TokenBucket, shared_bucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_waits_only_when_tokens_are_exhausted(self):
+        clock = FakeClock()
+        with patch("src.ratelimit.time", clock):
+            bucket = TokenBucket(rate_per_sec=2.0, burst=2)
+            waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.5)
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(clock.now, 101.0)
+
+    def test_tokens_refill_after_idle_time(self):
+        clock = FakeClock()
+        with patch("src.ratelimit.time", clock):
+            bucket = TokenBucket(rate_per_sec=1.0, burst=1)
+            bucket.acquire()
+            clock.now += 5.0
+            waited = bucket.acquire()
+
+        self.assertEqual(waited, 0.0)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_shared_bucket_is_reused_per_key(self):
+        a = shared_bucket("test-key", 20.0)
+        b = shared_bucket("test-key", 20.0)
+        c = shared_bucket("other-key", 20.0)
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+    def test_shared_bucket_keeps_first_settings_for_key(self):
+        first = shared_bucket("test-rate-key", 20.0, burst=2)
+        with self.assertLogs("kis_trader.ratelimit", level="WARNING"):
+            second = shared_bucket("test-rate-key", 2.0, burst=5)
+
+        self.assertIs(first, second)
+        self.assertEqual((second.rate, second.capacity), (20.0, 2.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
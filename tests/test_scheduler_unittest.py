@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+
+from src.models import Quote
+from src.scheduler import QUOTE_BATCH_SIZE, TradingScheduler
+
+
+def make_quote(symbol):
+    return Quote(
+        symbol=symbol, name=symbol, current_price=1000, change=0, change_rate=0.0,
+        open_price=1000, high_price=1000, low_price=1000, volume=0, trade_amount=0,
+    )
+
+
+class FakeMarketData:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_multi_price(self, symbols):
+        with self.lock:
+            self.calls.append(list(symbols))
+        return [make_quote(s) for s in symbols]
+
+
+class SchedulerQuoteFetchTests(unittest.TestCase):
+    def _scheduler(self):
+        scheduler = TradingScheduler.__new__(TradingScheduler)
+        scheduler.market_data = FakeMarketData()
+        scheduler._quote_pool = None
+        self.addCleanup(lambda: scheduler._quote_pool and scheduler._quote_pool.shutdown())
+        return scheduler
+
+    def test_fetches_batches_concurrently_and_keeps_watchlist_order(self):
+        scheduler = self._scheduler()
+        watchlist = [f"{i:06d}" for i in range(QUOTE_BATCH_SIZE * 2 + 5)]
+
+        quotes = scheduler._fetch_quotes(watchlist)
+
+        self.assertEqual([q.symbol for q in quotes], watchlist)
+        self.assertEqual(sorted(len(c) for c in scheduler.market_data.calls), [5, 30, 30])
+
+    def test_worker_pool_is_reused_across_ticks(self):
+        scheduler = self._scheduler()
+        watchlist = [f"{i:06d}" for i in range(QUOTE_BATCH_SIZE + 1)]
+
+        scheduler._fetch_quotes(watchlist)
+        pool = scheduler._quote_pool
+        scheduler._fetch_quotes(watchlist)
+
+        self.assertIsNotNone(pool)
+        self.assertIs(scheduler._quote_pool, pool)
+
+    def test_empty_watchlist_makes_no_calls(self):
+        scheduler = self._scheduler()
+
+        self.assertEqual(scheduler._fetch_quotes([]), [])
+        self.assertEqual(scheduler.market_data.calls, [])
+
+
+class SchedulerShutdownTests(unittest.TestCase):
+    def test_stop_wakes_interruptible_sleep(self):
+        scheduler = TradingScheduler.__new__(TradingScheduler)
+        scheduler._shutdown = threading.Event()
+        threading.Timer(0.05, scheduler.stop).start()
+
+        started = time.monotonic()
+        scheduler._interruptible_sleep(30)
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertTrue(scheduler._shutdown.is_set())
+
+
+class SchedulerPreopenTests(unittest.TestCase):
+    def _wait(self, now):
+        return TradingScheduler.__new__(TradingScheduler)._seconds_until_preopen(now)
+
+    def test_before_preopen_on_weekday_waits_for_today(self):
+        # 2026-02-16 월요일
+        self.assertEqual(self._wait(datetime(2026, 2, 16, 8, 0, 0)), 50 * 60)
+
+    def test_after_preopen_on_friday_skips_weekend(self):
+        # 2026-02-20 금요일 16:00 → 2026-02-23 월요일 08:50
+        now = datetime(2026, 2, 20, 16, 0, 0)
+        expected = datetime(2026, 2, 23, 8, 50) - now
+        self.assertEqual(self._wait(now), int(expected.total_seconds()))
+
+    def test_saturday_morning_waits_for_monday(self):
+        now = datetime(2026, 2, 21, 7, 0, 0, 500000)
+        expected = datetime(2026, 2, 23, 8, 50) - now
+        self.assertEqual(self._wait(now), int(expected.total_seconds()))
+
+
+if __name__ == "__main__":
+    unittest.main()
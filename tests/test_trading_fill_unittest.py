@@ -1,15 +1,20 @@
+import threading
+import time
 import unittest
+from concurrent.futures import Future
 from unittest.mock import patch
 
+from src.executor import OrderExecutor
 from src.models import Order, OrderSide, OrderType
 from src.trading import TradingAPI
 
 
 class DummyResponse:
-    def __init__(self, success, output=None, output1=None, error_code="", error_message=""):
+    def __init__(self, success, output=None, output1=None, error_code="", error_message="", has_next=False):
         self.success = success
         self.output = output or {}
         self.output1 = output1 or []
+        self.has_next = has_next
         self.error_code = error_code
         self.error_message = error_message
 
@@ -88,7 +93,7 @@ class TradingFillPriceTests(unittest.TestCase):
             price=0,
         )
 
-        with patch("src.trading.time.sleep", return_value=None):
+        with patch.object(trading._shutdown, "wait", return_value=False):
             result = trading.place_order(order)
 
         self.assertTrue(result.success)
@@ -97,6 +102,211 @@ class TradingFillPriceTests(unittest.TestCase):
         self.assertEqual(result.price, 0)     # 시장가 fallback
         self.assertEqual(client.get_calls, 5)
 
+    def test_fill_polling_backs_off_without_trailing_sleep(self):
+        client = FakeClient(post_response=DummyResponse(success=True, output={"ODNO": "1"}), get_responses=[])
+        trading = TradingAPI(client, fill_poll_attempts=6)
+        order = Order(symbol="005930", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=1, price=0)
+
+        with patch("src.trading.random.uniform", return_value=0.0), \
+                patch.object(trading._shutdown, "wait", return_value=False) as wait:
+            trading.place_order(order)
+
+        delays = [call.args[0] for call in wait.call_args_list]
+        self.assertEqual(delays, [0.05, 0.1, 0.2, 0.4, 0.8])
+        self.assertEqual(client.get_calls, 6)
+
+    def test_shutdown_stops_fill_polling(self):
+        client = FakeClient(post_response=DummyResponse(success=True, output={"ODNO": "1"}), get_responses=[])
+        trading = TradingAPI(client)
+        order = Order(symbol="005930", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=2, price=0)
+
+        trading.shutdown()
+        started = time.monotonic()
+        result = trading.place_order(order)
+
+        self.assertLess(time.monotonic() - started, 0.05)
+        self.assertEqual(client.get_calls, 1)
+        self.assertEqual(result.quantity, 2)
+
+
+    def test_limit_order_does_not_wait_for_fill(self):
+        client = FakeClient(post_response=DummyResponse(success=True, output={"ODNO": "7"}), get_responses=[])
+        order = Order(symbol="005930", side=OrderSide.BUY, order_type=OrderType.LIMIT, quantity=2, price=70_000)
+
+        result = TradingAPI(client).place_order(order)
+
+        self.assertEqual((result.order_no, result.quantity, result.price), ("7", 2, 70_000))
+        self.assertEqual(client.get_calls, 0)
+
+
+class PollFillsTests(unittest.TestCase):
+    def test_reports_filled_orders_from_one_query(self):
+        rows = [
+            {"odno": "3", "pdno": "000660", "tot_ccld_qty": "0", "avg_prvs": "0"},
+            {"odno": "2", "pdno": "005930", "tot_ccld_qty": "2", "avg_prvs": "", "tot_ccld_amt": "140100"},
+            {"odno": "1", "pdno": "035720", "tot_ccld_qty": "1", "avg_prvs": "50000"},
+        ]
+        client = FakeClient(post_response=None, get_responses=[DummyResponse(success=True, output1=rows)])
+
+        fills = TradingAPI(client).poll_fills(["2", "3", "9"])
+
+        self.assertEqual(fills, {"2": (2, 70050)})
+        self.assertEqual(client.get_calls, 1)
+
+    def test_order_beyond_first_page_is_queried_by_number(self):
+        older = {"odno": "1", "pdno": "035720", "tot_ccld_qty": "1", "avg_prvs": "50000"}
+        client = FakeClient(
+            post_response=None,
+            get_responses=[
+                DummyResponse(success=True, output1=[], has_next=True),
+                DummyResponse(success=True, output1=[older]),
+            ],
+        )
+
+        fills = TradingAPI(client).poll_fills(["1"])
+
+        self.assertEqual(fills, {"1": (1, 50000)})
+        self.assertEqual(client.get_calls, 2)
+
+
+class ToIntTests(unittest.TestCase):
+    def test_parses_kis_numeric_strings(self):
+        cases = {"3": 3, " 42 ": 42, "70100.9": 70100, "1,234": 1234, "-5": -5, 7: 7, 3.9: 3, "": 0, None: 0, "abc": 0}
+        for raw, expected in cases.items():
+            self.assertEqual(TradingAPI._to_int(raw), expected, raw)
+
+
+class EchoClient:
+    """주문번호를 종목코드로 돌려주고, 체결 조회에는 지금까지 받은 주문의 체결 행을 최신순으로 돌려준다."""
+
+    def __init__(self):
+        self.symbols = []
+        self.get_calls = 0
+
+    def post(self, body, **kwargs):
+        self.symbols.append(body["PDNO"])
+        return DummyResponse(success=True, output={"ODNO": body["PDNO"]})
+
+    def get(self, params, **kwargs):
+        self.get_calls += 1
+        rows = [
+            {"odno": s, "pdno": s, "tot_ccld_qty": "1", "avg_prvs": s.lstrip("0")}
+            for s in reversed(self.symbols)
+            if params["ODNO"] in ("", s)
+        ]
+        return DummyResponse(success=True, output1=rows)
+
+
+class PlaceOrdersTests(unittest.TestCase):
+    def test_results_follow_input_order(self):
+        trading = TradingAPI(EchoClient())
+        orders = [
+            Order(symbol=f"{i:06d}", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=1, price=0)
+            for i in range(1, 6)
+        ]
+
+        results = trading.place_orders(orders)
+
+        self.assertEqual([r.order_no for r in results], [o.symbol for o in orders])
+        self.assertEqual([r.price for r in results], [1, 2, 3, 4, 5])
+
+    def test_concurrent_fill_lookups_share_one_query(self):
+        client = EchoClient()
+        trading = TradingAPI(client)
+        placed_at = time.monotonic()
+        client.symbols = ["000001", "000002"]
+
+        rows = [trading._find_fill_row(s, s, "02", "20260213", placed_at) for s in client.symbols]
+
+        self.assertEqual([row["odno"] for row in rows], client.symbols)
+        self.assertEqual(client.get_calls, 1)
+
+    def test_order_missing_from_truncated_page_is_queried_directly(self):
+        older = {"odno": "1", "pdno": "005930", "tot_ccld_qty": "1", "avg_prvs": "70000"}
+        target = {"odno": "2", "pdno": "000660", "tot_ccld_qty": "1", "avg_prvs": "200000"}
+        client = FakeClient(
+            post_response=None,
+            get_responses=[
+                DummyResponse(success=True, output1=[older], has_next=True),
+                DummyResponse(success=True, output1=[target]),
+            ],
+        )
+
+        row = TradingAPI(client)._find_fill_row("2", "000660", "02", "20260213", time.monotonic())
+
+        self.assertEqual(row, target)
+        self.assertEqual(client.get_calls, 2)
+
+
+    def test_async_order_resolves_fill_in_background(self):
+        trading = TradingAPI(EchoClient())
+        order = Order(symbol="000007", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=1, price=0)
+        filled = []
+        done = threading.Event()
+
+        future = trading.place_order_async(order, on_fill=lambda r: (filled.append(r), done.set()))
+        result = future.result(timeout=5)
+
+        self.assertEqual((result.order_no, result.price), ("000007", 7))
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(filled, [result])
+
+    def test_async_order_after_shutdown_completes_with_order_values(self):
+        client = EchoClient()
+        trading = TradingAPI(client)
+        order = Order(symbol="000007", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=3, price=0)
+        filled = []
+
+        trading.shutdown()
+        future = trading.place_order_async(order, on_fill=filled.append)
+
+        self.assertTrue(future.done())
+        result = future.result()
+        self.assertEqual((result.success, result.order_no, result.quantity), (True, "000007", 3))
+        self.assertEqual(filled, [result])
+        self.assertEqual(client.get_calls, 0)
+
+    def test_cancelled_fill_lookup_still_reports_accepted_order(self):
+        trading = TradingAPI(EchoClient())
+        order = Order(symbol="000007", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=3, price=0)
+        pending = Future()
+        filled = []
+
+        with patch.object(trading._fill_executor, "submit", return_value=pending):
+            future = trading.place_order_async(order, on_fill=filled.append)
+        self.assertFalse(future.done())
+        pending.cancel()
+
+        result = future.result(timeout=1)
+        self.assertEqual((result.success, result.order_no, result.quantity), (True, "000007", 3))
+        self.assertEqual(filled, [result])
+
+    def test_rejected_async_order_is_already_done(self):
+        client = FakeClient(post_response=DummyResponse(success=False, error_code="E1", error_message="거부"),
+                            get_responses=[])
+        order = Order(symbol="005930", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=1, price=0)
+
+        future = TradingAPI(client).place_order_async(order)
+
+        self.assertTrue(future.done())
+        self.assertFalse(future.result().success)
+        self.assertEqual(client.get_calls, 0)
+
+
+
+class SubmitOrdersTests(unittest.TestCase):
+    def test_orders_reach_broker_in_strategy_order(self):
+        client = EchoClient()
+        orders = [
+            Order(symbol=f"{i:06d}", side=side, order_type=OrderType.MARKET, quantity=1, price=0)
+            for i, side in enumerate([OrderSide.SELL, OrderSide.SELL, OrderSide.BUY, OrderSide.BUY], start=1)
+        ]
+
+        results = OrderExecutor(TradingAPI(client)).submit_orders(orders)
+
+        self.assertEqual(client.symbols, [o.symbol for o in orders])
+        self.assertTrue(all(r.success for r in results))
+
 
 if __name__ == "__main__":
     unittest.main()